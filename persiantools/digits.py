@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Union
 
 EN_TO_FA_MAP = str.maketrans("0123456789", "۰۱۲۳۴۵۶۷۸۹")
@@ -262,3 +263,361 @@ def to_word(number: Union[int, float]) -> str:
     elif isinstance(number, float):
         return _floating_number_to_word(number, False)
     raise TypeError("number must be digit")
+
+
+# Other spellings of number words, besides the ones to_word writes
+_NUMBER_WORD_VARIANTS = {
+    "پونصد": 500,
+    "شونزده": 16,
+    "هیفده": 17,
+    "هیجده": 18,
+    "ملیون": 1_000_000,
+    "ملیارد": 1_000_000_000,
+    "بیلیون": 1_000_000_000,
+}
+
+
+def _number_words() -> dict:
+    """
+    Return the ``(kind, value)`` of every number word.
+
+    The kinds are ``num`` (below a thousand), ``hundred`` (صد on its own, as in "سه صد"), ``big`` (a power
+    of a thousand), ``frac`` (a MANTISSA word, with its number of decimal places as value), ``zero``,
+    ``neg`` and ``and``.
+    """
+    words = {ZERO: ("zero", 0), NEGATIVE.strip(): ("neg", 0), DELI.strip(): ("and", 0), "صد": ("hundred", 100)}
+    for number, word in enumerate(ONES, 1):
+        words[word] = ("num", number)
+    for number, word in enumerate(RANGE, 10):
+        words[word] = ("num", number)
+    for number, word in enumerate(TENS, 2):
+        words[word] = ("num", number * 10)
+    for number, word in enumerate(HUNDREDS, 1):
+        words[word] = ("num", number * 100)
+        if word.endswith("صد"):
+            words[word[:-2] + "\u200cصد"] = ("num", number * 100)
+    for exponent, word in enumerate(BIG_RANGE, 1):
+        words[word.strip()] = ("big", 1000**exponent)
+    for places, word in enumerate(MANTISSA, 1):
+        words[word] = ("frac", places)
+        if word.startswith("یک "):
+            words[word[3:]] = ("frac", places)
+    for word, number in _NUMBER_WORD_VARIANTS.items():
+        words[word] = ("big" if number >= 1000 else "num", number)
+
+    # the same words joined with a zero-width non-joiner or written with the Arabic yeh and kaf
+    for word, value in list(words.items()):
+        joined = word.replace(" ", "\u200c")
+        for variant in (joined, word.replace("ی", "ي").replace("ک", "ك"), joined.replace("ی", "ي").replace("ک", "ك")):
+            words.setdefault(variant, value)
+
+    return words
+
+
+def _build_trie(words: dict) -> dict:
+    """Build a character trie of ``words``; the key None of a node holds the value of the word ending there."""
+    trie = {}
+    for word, value in words.items():
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[None] = value
+
+    return trie
+
+
+_NUMBER_TRIE = _build_trie(_number_words())
+
+# Characters that separate the words of a number
+_WORD_SPACES = frozenset(" \t\n\r\u00a0\u200c")
+
+
+def _number_tokens(text: str) -> list:
+    """
+    Split ``text`` into tokens in one scan, taking the longest number word at each word start.
+
+    Returns a list of ``(start, end, kind, value)``; other words and punctuation have the kind None.
+    """
+    trie = _NUMBER_TRIE
+    tokens = []
+    i, n = 0, len(text)
+    while i < n:
+        char = text[i]
+        if char in _WORD_SPACES:
+            i += 1
+            continue
+
+        if not char.isalpha():
+            tokens.append((i, i + 1, None, None))
+            i += 1
+            continue
+
+        node, j, found = trie, i, None
+        while j < n:
+            node = node.get(text[j])
+            if node is None:
+                break
+            j += 1
+            if None in node and (j == n or not text[j].isalpha()):
+                found = j, node[None]
+
+        start = i
+        if found is None:
+            while i < n and text[i].isalpha():
+                i += 1
+            tokens.append((start, i, None, None))
+        else:
+            i = found[0]
+            tokens.append((start, i) + found[1])
+
+    return tokens
+
+
+# Tokens a fraction can span before its MANTISSA word, enough for 14 decimal places
+_MAX_FRACTION_TOKENS = 48
+
+
+def _fraction_ends(tokens: list) -> list:
+    """Return, for each token, the index of the MANTISSA word that ends its run of number words, or -1."""
+    ends = [-1] * len(tokens)
+    end = -1
+    for k in range(len(tokens) - 1, -1, -1):
+        kind = tokens[k][2]
+        if kind == "frac":
+            end = k
+        elif kind not in ("num", "hundred", "big", "and"):
+            end = -1
+        ends[k] = end
+
+    return ends
+
+
+def _split_fraction(tokens: list, ends: list, boundaries: list, j: int):
+    """
+    Read the number as an integer part and a fraction that starts after one of its "و".
+
+    This resolves numbers like "پانزده و هفت هزارم", where the fraction does not continue the integer
+    part; the fraction that starts last wins. Returns ``(next, number)`` as ``_read_number``, or None.
+    """
+    end = ends[j]
+    if end < 0:
+        return None
+
+    for index, at_total, at_current, _ in reversed(boundaries[1:]):
+        if end - index > _MAX_FRACTION_TOKENS:
+            break
+
+        following, number = _read_number(tokens, ends, index, fraction_only=True)
+        if number is not None and number[1] == 0 and number[2] is not None:
+            return following, (number[0], at_total + at_current, number[2])
+
+    return None
+
+
+def _read_number(tokens: list, ends: list, i: int, fraction_only: bool = False):
+    """
+    Read the longest unsigned number of ``tokens`` that starts at the index ``i``.
+
+    Returns ``(next, number)``: the index to read on from and ``(last, integer, fraction)``, with the
+    index of the last token of the number and ``fraction`` as None or ``(numerator, places)``; ``number``
+    is None when no number starts at ``i``. ``ends`` is the result of ``_fraction_ends(tokens)``.
+
+    Before a MANTISSA word, the longest integer part whose fraction fits the word wins, so the words of
+    ``to_word(230.03)`` read back as 230.03 and not 200.33, which has the same words; with
+    ``fraction_only`` the whole number is read as the fraction.
+    """
+    kind = tokens[i][2]
+    if kind == "zero":
+        return i + 1, (i, 0, None)
+
+    if kind not in ("num", "hundred", "big"):
+        return i + 1, None
+
+    n = len(tokens)
+    total = current = 0
+    last_big = None
+    bigs = 0
+    # (index, total, current, bigs) after each "و", where the numerator of a fraction may start
+    boundaries = [(i, 0, 0, 0)]
+    group_start = last = i
+    j = i
+    while j < n:
+        kind, value = tokens[j][2], tokens[j][3]
+        if kind == "num":
+            place = 100 if value >= 100 else 10 if value >= 10 else 1
+            if current % (place * 10) or (place == 1 and current % 100 == 10):
+                # not a smaller place, or ones after "ده", which has its own words for 11 to 19
+                break
+
+            if current == 0:
+                group_start = j
+            current += value
+        elif kind == "hundred":
+            if current >= 10:
+                break
+
+            if current == 0:
+                group_start = j
+            current = (current or 1) * 100
+        elif kind == "big":
+            if current == 0 and j > i and tokens[j - 1][2] == "big" and value > tokens[j - 1][3]:
+                # هزار میلیارد
+                total *= value
+            elif last_big is None or value < last_big:
+                total += (current or 1) * value
+                current = 0
+            elif current:
+                # the group of current starts another number
+                split = _split_fraction(tokens, ends, boundaries, j)
+                if split is not None:
+                    return split
+
+                last = group_start - 1
+                if tokens[last][2] == "and":
+                    last -= 1
+                return group_start, (last, total, None)
+            else:
+                break
+            last_big = value
+            bigs += 1
+        elif kind == "and":
+            if j + 1 == n or tokens[j + 1][2] not in ("num", "hundred", "big"):
+                break
+
+            j += 1
+            boundaries.append((j, total, current, bigs))
+            continue
+        elif kind == "frac":
+            for _, at_total, at_current, at_bigs in boundaries[:1] if fraction_only else reversed(boundaries):
+                if at_current and at_bigs < bigs:
+                    # a big word after this "و" multiplied the number before it
+                    continue
+
+                integer = at_total + at_current
+                numerator = total + current - integer
+                if 0 < numerator < 10**value:
+                    return j + 1, (j, integer, (numerator, value))
+            break
+        else:
+            break
+
+        last = j
+        j += 1
+
+    if j < n:
+        split = _split_fraction(tokens, ends, boundaries, j)
+        if split is not None:
+            return split
+
+    return last + 1, (last, total + current, None)
+
+
+def _number_value(negative: bool, integer: int, fraction):
+    if fraction is None:
+        return -integer if negative else integer
+
+    numerator, places = fraction
+    value = float(f"{integer}.{numerator:0{places}d}")
+
+    return -value if negative else value
+
+
+def _iter_numbers(tokens: list):
+    """Yield ``(first, last, value)`` for the numbers in ``tokens``, with the indices of their first and last tokens."""
+    ends = _fraction_ends(tokens)
+    i, n = 0, len(tokens)
+    while i < n:
+        first = i
+        negative = tokens[i][2] == "neg"
+        if negative:
+            i += 1
+            if i == n:
+                break
+
+        i, number = _read_number(tokens, ends, i)
+        if number is not None:
+            last, integer, fraction = number
+            yield first, last, _number_value(negative, integer, fraction)
+
+
+@lru_cache(maxsize=4096)
+def _from_word(text: str):
+    tokens = _number_tokens(text)
+    numbers = list(_iter_numbers(tokens))
+    if len(numbers) != 1 or numbers[0][:2] != (0, len(tokens) - 1):
+        raise ValueError(f"{text!r} is not a number in words")
+
+    return numbers[0][2]
+
+
+def from_word(text: str) -> Union[int, float]:
+    """
+    Convert Persian number words to a number, the reverse of ``to_word``.
+
+    The words are found with a character trie over the vocabulary of ``to_word`` in one scan of the text.
+    Common other spellings are accepted as well, such as "صد", "سه صد", "پونصد", "هیجده" or "ملیون",
+    words joined with a zero-width non-joiner and the Arabic forms of yeh and kaf. Fractions are read
+    from the ``MANTISSA`` words; when the words fit several numbers, as those of 230.03 and 200.33 do,
+    the one with the longest integer part is returned.
+
+    Parameters:
+    text (str): The number in words.
+
+    Returns:
+    int or float: The number, a float when it has a fractional part.
+
+    Raises:
+    TypeError: If the input is not a string.
+    ValueError: If the text is not exactly one number in words.
+
+    Examples:
+    >>> digits.from_word("یکصد و بیست و سه هزار")
+    123000
+
+    >>> digits.from_word("منفی پانزده و هفت هزارم")
+    -15.007
+    """
+    if not isinstance(text, str):
+        raise TypeError("Input must be a string")
+
+    return _from_word(text)
+
+
+words_to_number = from_word
+
+
+def from_word_many(values) -> list:
+    """
+    Convert many numbers in words with ``from_word``.
+
+    Repeated values are converted once.
+
+    Parameters:
+    values (iterable of str): The numbers in words.
+
+    Returns:
+    list: The numbers, in the order of ``values``.
+    """
+    return [from_word(value) for value in values]
+
+
+def extract_numbers(text: str):
+    """
+    Find the numbers written in words in running text.
+
+    Parameters:
+    text (str): The text.
+
+    Yields:
+    tuple: ``((start, end), number)`` for each number, with its offsets in ``text``.
+
+    Example:
+    >>> list(digits.extract_numbers("مبلغ دو میلیون و پانصد هزار ریال برای سه قلم"))
+    [((5, 29), 2500000), ((41, 43), 3)]
+    """
+    if not isinstance(text, str):
+        raise TypeError("Input must be a string")
+
+    tokens = _number_tokens(text)
+    for first, last, value in _iter_numbers(tokens):
+        yield (tokens[first][0], tokens[last][1]), value
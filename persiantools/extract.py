@@ -0,0 +1,170 @@
+"""
+Extraction of Jalali dates from free text.
+
+A single precompiled regular expression finds numeric dates such as ``1367/02/14`` or ``۱۴-۰۲-۱۳۶۷`` and
+dates with month names such as ``۱۴ اردیبهشت ۱۳۶۷``, ``۱۴ام اردیبهشت``, ``اردیبهشت ۶۷`` or
+``14 Ordibehesht 1367``, in ASCII, Persian or Arabic-Indic digits. Text can be given as one string or as an
+iterable of chunks, e.g. an open file, and is scanned once with a bounded overlap between chunks.
+"""
+
+import re
+
+from persiantools.jdatetime import (
+    _MONTH_COUNT,
+    _TO_ASCII_DIGITS,
+    MAXYEAR,
+    MINYEAR,
+    MONTH_NAMES_EN,
+    MONTH_NAMES_FA,
+    JalaliDate,
+)
+
+__all__ = ["extract"]
+
+_DIGIT = "[0-9۰-۹٠-٩]"
+
+# Month numbers by lower-cased name, also with the Arabic forms of yeh and kaf
+_MONTH_NUMBERS = {}
+for _number in range(1, 13):
+    for _name in (MONTH_NAMES_EN[_number].lower(), MONTH_NAMES_FA[_number]):
+        _MONTH_NUMBERS[_name] = _number
+        _MONTH_NUMBERS[_name.replace("ی", "ي").replace("ک", "ك")] = _number
+
+_MONTHS = "|".join(re.escape(name) for name in sorted(_MONTH_NUMBERS, key=len, reverse=True))
+
+# The characters a match can start with, checked first to skip the rest of the text quickly
+_FIRST = re.escape("".join(sorted({name[0] for name in _MONTH_NUMBERS} | {name[0].upper() for name in _MONTH_NUMBERS})))
+
+# Spaces between the parts of a date, bounded so that a match never spans more than _OVERLAP characters
+_SPACE = r"[ \t\u200c\u00a0]"
+
+# Words of a count, such as "نفر" in "۱۵ مهر ۲۰ نفر", after which two digits are not a year
+_COUNT_WORDS = (
+    "نفر تا عدد مورد بار دفعه درصد روز ساعت دقیقه ثانیه هفته ماه سال ساله ریال تومان هزار میلیون میلیارد "
+    "گرم کیلو کیلوگرم متر کیلومتر سانتیمتر لیتر نسخه جلد دستگاه واحد سهم نمره امتیاز "
+    "people persons times items percent days hours minutes years"
+).split()
+_COUNT_WORDS += [word.replace("ی", "ي").replace("ک", "ك") for word in _COUNT_WORDS if "ی" in word or "ک" in word]
+
+_COUNT = "|".join(re.escape(word) for word in sorted(_COUNT_WORDS, key=len, reverse=True))
+
+_PATTERN = re.compile(
+    rf"""
+    (?=[0-9۰-۹٠-٩{_FIRST}])
+    (?<!{_DIGIT})
+    (?:
+        (?P<y1>{_DIGIT}{{4}})(?P<s1>[/\-.])(?P<m1>{_DIGIT}{{1,2}})(?P=s1)(?P<d1>{_DIGIT}{{1,2}})
+      | (?P<d2>{_DIGIT}{{1,2}})(?P<s2>[/\-.])(?P<m2>{_DIGIT}{{1,2}})(?P=s2)(?P<y2>{_DIGIT}{{4}})
+      | (?:(?P<d3>{_DIGIT}{{1,2}})(?:ام|ُم|م|th|st|nd|rd)?{_SPACE}{{0,3}})?
+        (?<![^\W\d_])(?P<n3>{_MONTHS})(?![^\W\d_])
+        (?:{_SPACE}{{0,2}}ماه)?
+        (?:[ \t\u200c\u00a0,،]{{1,3}}(?:سال{_SPACE}{{1,2}})?
+           (?P<y3>{_DIGIT}{{4}}|{_DIGIT}{{2}}(?!{_SPACE}{{0,3}}(?:[%٪]|(?:{_COUNT})(?![^\W\d_])))))?
+    )
+    (?!{_DIGIT})
+    """,
+    re.VERBOSE | re.IGNORECASE,
+)
+
+# Characters kept from the end of a chunk, longer than any match
+_OVERLAP = 64
+
+
+def _two_digit_year(yy: int, year: int) -> int:
+    """Return the year ending in ``yy`` closest to ``year`` that is at most 20 years after it."""
+    full = year - year % 100 + yy
+    return full - 100 if full > year + 20 else full
+
+
+def _date(match, year):
+    """Return the JalaliDate of ``match``, or None when it is not a valid date."""
+    groups = match.groupdict()
+    if groups["y1"] is not None:
+        y, m, d = groups["y1"], groups["m1"], groups["d1"]
+    elif groups["y2"] is not None:
+        y, m, d = groups["y2"], groups["m2"], groups["d2"]
+    else:
+        y, d = groups["y3"], groups["d3"]
+        if y is None and d is None:
+            # a bare month name
+            return None
+
+        m = _MONTH_NUMBERS[groups["n3"].lower()]
+        if y is None:
+            y = year
+        elif len(y) == 2:
+            y = _two_digit_year(int(y.translate(_TO_ASCII_DIGITS)), year)
+
+        if d is None:
+            d = 1
+
+    y, m, d = (int(v.translate(_TO_ASCII_DIGITS)) if isinstance(v, str) else v for v in (y, m, d))
+    if not (MINYEAR <= y <= MAXYEAR and 1 <= m <= 12 and 1 <= d):
+        return None
+
+    if d > _MONTH_COUNT[m][0] and not (m == 12 and d == 30 and JalaliDate.is_leap(y)):
+        return None
+
+    return JalaliDate._from_fields(y, m, d)
+
+
+def extract(text, year=None):
+    """
+    Find the Jalali dates in ``text``.
+
+    Numeric dates are read as year/month/day or day/month/year, with ``/``, ``-`` or ``.`` as separator.
+    Named dates need a day, a year or both next to the month name; a missing day is taken as the first of
+    the month and a two-digit year as the closest one to ``year`` that is at most 20 years after it. Two
+    digits followed by a word of a count, as in "۱۵ مهر ۲۰ نفر", are not read as a year.
+    Invalid dates are skipped.
+
+    Args:
+        text (str | iterable of str): The text, or its chunks in order, e.g. an open file or
+            ``iter(lambda: file.read(1 << 20), "")``.
+        year (int, optional): The year of dates written without one, and the reference of two-digit years.
+            Defaults to the current Jalali year.
+
+    Yields:
+        tuple: ``((start, end), JalaliDate)``, where ``start`` and ``end`` are offsets in the whole text.
+
+    Example:
+        >>> from persiantools.extract import extract
+        >>> list(extract("جلسه در ۱۴ اردیبهشت ۱۳۶۷ و 1367/03/01 برگزار شد"))
+        [((8, 24), JalaliDate(1367, 2, 14, Chaharshanbeh)), ((27, 37), JalaliDate(1367, 3, 1, Yekshanbeh))]
+    """
+    if year is None:
+        year = JalaliDate.today().year
+
+    if isinstance(text, str):
+        text = (text,)
+
+    finditer = _PATTERN.finditer
+    buffer = ""
+    base = 0  # offset of buffer[0] in the text
+    pos = 0  # where the next search starts in buffer
+    for chunk in text:
+        buffer += chunk
+        safe = len(buffer) - _OVERLAP
+        for match in finditer(buffer, pos):
+            if match.end() > safe:
+                # the text that follows may still change this match
+                pos = match.start()
+                break
+
+            pos = match.end()
+            value = _date(match, year)
+            if value is not None:
+                yield (base + match.start(), base + pos), value
+        else:
+            pos = max(pos, safe)
+
+        # drop the scanned text, keeping one character before pos for the lookbehind
+        drop = max(pos - 1, 0)
+        buffer = buffer[drop:]
+        base += drop
+        pos -= drop
+
+    for match in finditer(buffer, pos):
+        value = _date(match, year)
+        if value is not None:
+            yield (base + match.start(), base + match.end()), value
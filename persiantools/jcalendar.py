@@ -0,0 +1,480 @@
+"""
+Calendar printing functions for the Jalali calendar, following the standard ``calendar`` module.
+
+Weeks start on Saturday by default and weekdays are numbered as in ``JalaliDate.weekday``: Saturday is 0
+and Friday is 6. Month layouts are computed from the weekday of Nowruz and the month lengths, without
+creating date objects.
+"""
+
+import sys
+from functools import lru_cache
+
+from persiantools.jdatetime import (
+    _MONTH_COUNT,
+    _MONTH_NAMES,
+    _WEEKDAY_NAMES,
+    _WEEKDAY_NAMES_ABBR,
+    MAXYEAR,
+    MINYEAR,
+    JalaliDate,
+    _localize_digits,
+    _ymd_to_ordinal,
+)
+
+__all__ = [
+    "SATURDAY",
+    "SUNDAY",
+    "MONDAY",
+    "TUESDAY",
+    "WEDNESDAY",
+    "THURSDAY",
+    "FRIDAY",
+    "Calendar",
+    "TextCalendar",
+    "HTMLCalendar",
+    "isleap",
+    "leapdays",
+    "weekday",
+    "nowruz_weekday",
+    "monthrange",
+    "monthcalendar",
+    "itermonthdates",
+    "month",
+    "calendar",
+    "prmonth",
+    "prcal",
+]
+
+SATURDAY, SUNDAY, MONDAY, TUESDAY, WEDNESDAY, THURSDAY, FRIDAY = range(7)
+
+
+def _check_year(year):
+    if not MINYEAR <= year <= MAXYEAR:
+        raise ValueError(f"year must be in {MINYEAR}..{MAXYEAR}", year)
+
+
+def _check_month(month):
+    if not 1 <= month <= 12:
+        raise ValueError("month must be in 1..12", month)
+
+
+def _check_locale(locale):
+    if locale not in ("en", "fa"):
+        raise ValueError("locale must be 'en' or 'fa'")
+
+
+def isleap(year: int) -> bool:
+    """Return True for leap years, False for non-leap years."""
+    return JalaliDate.is_leap(year)
+
+
+def leapdays(y1: int, y2: int) -> int:
+    """
+    Return the number of leap years in ``range(y1, y2)``.
+
+    Args:
+        y1 (int): The first year, in MINYEAR..MAXYEAR + 1.
+        y2 (int): The year after the last one, in MINYEAR..MAXYEAR + 1.
+
+    Returns:
+        int: The number of leap years, negative if ``y2`` is before ``y1``.
+    """
+    for year in (y1, y2):
+        if not MINYEAR <= year <= MAXYEAR + 1:
+            raise ValueError(f"year must be in {MINYEAR}..{MAXYEAR + 1}", year)
+
+    return _ymd_to_ordinal(y2, 1, 1) - _ymd_to_ordinal(y1, 1, 1) - 365 * (y2 - y1)
+
+
+def nowruz_weekday(year: int) -> int:
+    """Return the weekday (0 is Saturday) of 1 Farvardin of ``year``."""
+    _check_year(year)
+    return (_ymd_to_ordinal(year, 1, 1) + 4) % 7
+
+
+def weekday(year: int, month: int, day: int) -> int:
+    """Return the weekday (0 is Saturday) of the given Jalali date."""
+    days = monthrange(year, month)[1]
+    if not 1 <= day <= days:
+        raise ValueError(f"day must be in 1..{days}", day)
+
+    return (_ymd_to_ordinal(year, month, day) + 4) % 7
+
+
+def monthrange(year: int, month: int):
+    """
+    Return the weekday (0 is Saturday) of the first day of the month and the number of days in the month.
+
+    Example:
+        >>> from persiantools import jcalendar
+        >>> jcalendar.monthrange(1403, 12)
+        (4, 30)
+    """
+    _check_year(year)
+    _check_month(month)
+    count = _MONTH_COUNT[month]
+    first = (_ymd_to_ordinal(year, 1, 1) + 4 + count[2]) % 7
+
+    return first, count[1] if month == 12 and isleap(year) else count[0]
+
+
+@lru_cache(maxsize=None)
+def _layout(offset: int, days: int):
+    """
+    Return the weeks of a month as tuples of day numbers, with 0 for the days outside the month.
+
+    ``offset`` is the column of the first day, so a month layout only depends on it and on the number of days.
+    """
+    cells = (0,) * offset + tuple(range(1, days + 1))
+    cells += (0,) * (-len(cells) % 7)
+
+    return tuple(cells[i : i + 7] for i in range(0, len(cells), 7))
+
+
+class Calendar:
+    """
+    Base calendar class providing the data to build Jalali month and year layouts.
+
+    Args:
+        firstweekday (int, optional): The first day of the week, 0 (Saturday) to 6 (Friday).
+                                      Defaults to Saturday.
+    """
+
+    def __init__(self, firstweekday: int = SATURDAY):
+        self.firstweekday = firstweekday
+
+    @property
+    def firstweekday(self) -> int:
+        return self._firstweekday
+
+    @firstweekday.setter
+    def firstweekday(self, firstweekday: int):
+        self._firstweekday = firstweekday % 7
+
+    def iterweekdays(self):
+        """Return an iterator over the weekday numbers of one week, starting with the first weekday."""
+        for i in range(self._firstweekday, self._firstweekday + 7):
+            yield i % 7
+
+    def _month_layout(self, year: int, month: int):
+        first, days = monthrange(year, month)
+        return _layout((first - self._firstweekday) % 7, days)
+
+    def itermonthdays(self, year: int, month: int):
+        """Return an iterator over the days of the month in complete weeks, with 0 for the other months' days."""
+        for week in self._month_layout(year, month):
+            yield from week
+
+    def itermonthdays2(self, year: int, month: int):
+        """Like ``itermonthdays``, but yield ``(day, weekday)`` tuples."""
+        for i, day in enumerate(self.itermonthdays(year, month), self._firstweekday):
+            yield day, i % 7
+
+    def itermonthdays3(self, year: int, month: int):
+        """
+        Return an iterator over ``(year, month, day)`` tuples of the month in complete weeks,
+        including the days of the previous and the next month.
+        """
+        first, days = monthrange(year, month)
+        before = (first - self._firstweekday) % 7
+        after = -(before + days) % 7
+
+        if before:
+            y, m = (year, month - 1) if month > 1 else (year - 1, 12)
+            last = _MONTH_COUNT[m][0] if m < 12 or y < MINYEAR or not isleap(y) else _MONTH_COUNT[m][1]
+            for d in range(last - before + 1, last + 1):
+                yield y, m, d
+
+        for d in range(1, days + 1):
+            yield year, month, d
+
+        y, m = (year, month + 1) if month < 12 else (year + 1, 1)
+        for d in range(1, after + 1):
+            yield y, m, d
+
+    def itermonthdays4(self, year: int, month: int):
+        """Like ``itermonthdays3``, but yield ``(year, month, day, weekday)`` tuples."""
+        for i, (y, m, d) in enumerate(self.itermonthdays3(year, month), self._firstweekday):
+            yield y, m, d, i % 7
+
+    def itermonthdates(self, year: int, month: int):
+        """
+        Return an iterator over the ``JalaliDate`` objects of the month in complete weeks,
+        including the days of the previous and the next month.
+
+        Raises:
+            ValueError: If the weeks reach before MINYEAR or after MAXYEAR.
+        """
+        for y, m, d in self.itermonthdays3(year, month):
+            if MINYEAR <= y <= MAXYEAR:
+                yield JalaliDate._from_fields(y, m, d)
+            else:
+                yield JalaliDate(y, m, d)
+
+    def monthdatescalendar(self, year: int, month: int):
+        """Return the weeks of the month as lists of seven ``JalaliDate`` objects."""
+        dates = list(self.itermonthdates(year, month))
+        return [dates[i : i + 7] for i in range(0, len(dates), 7)]
+
+    def monthdayscalendar(self, year: int, month: int):
+        """Return the weeks of the month as lists of seven day numbers, with 0 outside the month."""
+        return [list(week) for week in self._month_layout(year, month)]
+
+    def monthdays2calendar(self, year: int, month: int):
+        """Return the weeks of the month as lists of seven ``(day, weekday)`` tuples."""
+        weekdays = list(self.iterweekdays())
+        return [list(zip(week, weekdays)) for week in self._month_layout(year, month)]
+
+    def yeardayscalendar(self, year: int, width: int = 3):
+        """Return the month rows of the year, ``width`` months per row, each month as ``monthdayscalendar``."""
+        months = [self.monthdayscalendar(year, m) for m in range(1, 13)]
+        return [months[i : i + width] for i in range(0, 12, width)]
+
+    def yeardays2calendar(self, year: int, width: int = 3):
+        """Return the month rows of the year, ``width`` months per row, each month as ``monthdays2calendar``."""
+        months = [self.monthdays2calendar(year, m) for m in range(1, 13)]
+        return [months[i : i + width] for i in range(0, 12, width)]
+
+    def yeardatescalendar(self, year: int, width: int = 3):
+        """Return the month rows of the year, ``width`` months per row, each month as ``monthdatescalendar``."""
+        months = [self.monthdatescalendar(year, m) for m in range(1, 13)]
+        return [months[i : i + width] for i in range(0, 12, width)]
+
+
+class TextCalendar(Calendar):
+    """
+    A calendar that renders plain text month and year pages.
+
+    Args:
+        firstweekday (int, optional): The first day of the week, 0 (Saturday) to 6 (Friday).
+        locale (str, optional): The locale of names and digits ('en' or 'fa'). Defaults to 'en'.
+
+    Example:
+        >>> from persiantools.jcalendar import TextCalendar
+        >>> print(TextCalendar().formatmonth(1403, 1))
+           Farvardin 1403
+        Sh Ye Do Se Ch Pa Jo
+                     1  2  3
+         4  5  6  7  8  9 10
+        11 12 13 14 15 16 17
+        18 19 20 21 22 23 24
+        25 26 27 28 29 30 31
+    """
+
+    def __init__(self, firstweekday: int = SATURDAY, locale: str = "en"):
+        _check_locale(locale)
+        super().__init__(firstweekday)
+        self.locale = locale
+
+    def _number(self, n: int) -> str:
+        return _localize_digits(str(n), self.locale)
+
+    def formatday(self, day: int, weekday: int, width: int) -> str:
+        """Return a day number centered in ``width`` characters, or blanks for 0."""
+        if day == 0:
+            return " " * width
+
+        return _localize_digits(f"{day:2d}", self.locale).center(width)
+
+    def formatweek(self, theweek, width: int) -> str:
+        """Return a week of ``(day, weekday)`` tuples as a line of text."""
+        return " ".join(self.formatday(d, wd, width) for d, wd in theweek)
+
+    def formatweekday(self, day: int, width: int) -> str:
+        """Return the weekday name, abbreviated unless ``width`` fits the full names."""
+        names = _WEEKDAY_NAMES[self.locale] if width >= 13 else _WEEKDAY_NAMES_ABBR[self.locale]
+
+        return names[day][:width].center(width)
+
+    def formatweekheader(self, width: int) -> str:
+        """Return a header line with the weekday names."""
+        return " ".join(self.formatweekday(i, width) for i in self.iterweekdays())
+
+    def formatmonthname(self, theyear: int, themonth: int, width: int, withyear: bool = True) -> str:
+        """Return the month name, followed by the year if ``withyear``, centered in ``width`` characters."""
+        name = _MONTH_NAMES[self.locale][themonth]
+        if withyear:
+            name = f"{name} {self._number(theyear)}"
+
+        return name.center(width)
+
+    def formatmonth(self, theyear: int, themonth: int, w: int = 0, l: int = 0) -> str:  # noqa: E741
+        """
+        Return a month's calendar as a multi-line string.
+
+        Args:
+            theyear (int): The year.
+            themonth (int): The month.
+            w (int, optional): The width of the day columns, at least 2.
+            l (int, optional): The number of lines for each week, at least 1.
+        """
+        w = max(2, w)
+        l = max(1, l)  # noqa: E741
+        weekdays = list(self.iterweekdays())
+        lines = [
+            self.formatmonthname(theyear, themonth, 7 * (w + 1) - 1).rstrip(),
+            self.formatweekheader(w).rstrip(),
+        ]
+        lines.extend(self.formatweek(zip(week, weekdays), w).rstrip() for week in self._month_layout(theyear, themonth))
+
+        return "".join(line + "\n" * l for line in lines)
+
+    def prmonth(self, theyear: int, themonth: int, w: int = 0, l: int = 0):  # noqa: E741
+        """Print a month's calendar."""
+        print(self.formatmonth(theyear, themonth, w, l), end="")
+
+    def formatyear(self, theyear: int, w: int = 2, l: int = 1, c: int = 6, m: int = 3) -> str:  # noqa: E741
+        """
+        Return a year's calendar as a multi-line string.
+
+        Args:
+            theyear (int): The year.
+            w (int, optional): The width of the day columns, at least 2.
+            l (int, optional): The number of lines for each week, at least 1.
+            c (int, optional): The number of spaces between the month columns, at least 2.
+            m (int, optional): The number of months per row.
+        """
+        w = max(2, w)
+        l = max(1, l)  # noqa: E741
+        c = max(2, c)
+        colwidth = (w + 1) * 7 - 1
+        weekdays = list(self.iterweekdays())
+        header = self.formatweekheader(w)
+        newlines = "\n" * l
+        lines = [self._number(theyear).center(colwidth * m + c * (m - 1)).rstrip(), newlines]
+
+        for first in range(1, 13, m):
+            months = range(first, min(first + m, 13))
+            layouts = [self._month_layout(theyear, k) for k in months]
+            lines.append(newlines)
+            lines.append(self._row([self.formatmonthname(theyear, k, colwidth, False) for k in months], colwidth, c))
+            lines.append(newlines)
+            lines.append(self._row([header] * len(months), colwidth, c))
+            lines.append(newlines)
+
+            for j in range(max(len(layout) for layout in layouts)):
+                weeks = [self.formatweek(zip(layout[j], weekdays), w) if j < len(layout) else "" for layout in layouts]
+                lines.append(self._row(weeks, colwidth, c))
+                lines.append(newlines)
+
+        return "".join(lines)
+
+    @staticmethod
+    def _row(cols, colwidth: int, spacing: int) -> str:
+        return (" " * spacing).join(col.center(colwidth) for col in cols).rstrip()
+
+    def pryear(self, theyear: int, w: int = 0, l: int = 0, c: int = 6, m: int = 3):  # noqa: E741
+        """Print a year's calendar."""
+        print(self.formatyear(theyear, w, l, c, m), end="")
+
+
+class HTMLCalendar(Calendar):
+    """
+    A calendar that renders HTML tables, with the same CSS class attributes as ``calendar.HTMLCalendar``.
+
+    Args:
+        firstweekday (int, optional): The first day of the week, 0 (Saturday) to 6 (Friday).
+        locale (str, optional): The locale of names and digits ('en' or 'fa'). Defaults to 'en'.
+    """
+
+    # CSS classes for the day cells, indexed by weekday (0 is Saturday)
+    cssclasses = ["sat", "sun", "mon", "tue", "wed", "thu", "fri"]
+
+    # CSS classes for the weekday names in the header row
+    cssclasses_weekday_head = cssclasses
+
+    # CSS class for the days before and after the month
+    cssclass_noday = "noday"
+
+    # CSS class for the month's head
+    cssclass_month_head = "month"
+
+    # CSS class for the month
+    cssclass_month = "month"
+
+    # CSS class for the year's table head
+    cssclass_year_head = "year"
+
+    # CSS class for the whole year table
+    cssclass_year = "year"
+
+    def __init__(self, firstweekday: int = SATURDAY, locale: str = "en"):
+        _check_locale(locale)
+        super().__init__(firstweekday)
+        self.locale = locale
+
+    def _number(self, n: int) -> str:
+        return _localize_digits(str(n), self.locale)
+
+    def formatday(self, day: int, weekday: int) -> str:
+        """Return a day as a table cell."""
+        if day == 0:
+            return f'<td class="{self.cssclass_noday}">&nbsp;</td>'
+
+        return f'<td class="{self.cssclasses[weekday]}">{self._number(day)}</td>'
+
+    def formatweek(self, theweek) -> str:
+        """Return a week of ``(day, weekday)`` tuples as a table row."""
+        return "<tr>" + "".join(self.formatday(d, wd) for d, wd in theweek) + "</tr>"
+
+    def formatweekday(self, day: int) -> str:
+        """Return a weekday name as a table header cell."""
+        return f'<th class="{self.cssclasses_weekday_head[day]}">{_WEEKDAY_NAMES_ABBR[self.locale][day]}</th>'
+
+    def formatweekheader(self) -> str:
+        """Return a header row with the weekday names."""
+        return "<tr>" + "".join(self.formatweekday(i) for i in self.iterweekdays()) + "</tr>"
+
+    def formatmonthname(self, theyear: int, themonth: int, withyear: bool = True) -> str:
+        """Return the month name as a table row."""
+        name = _MONTH_NAMES[self.locale][themonth]
+        if withyear:
+            name = f"{name} {self._number(theyear)}"
+
+        return f'<tr><th colspan="7" class="{self.cssclass_month_head}">{name}</th></tr>'
+
+    def formatmonth(self, theyear: int, themonth: int, withyear: bool = True) -> str:
+        """Return a month's calendar as an HTML table."""
+        weekdays = list(self.iterweekdays())
+        rows = [
+            f'<table border="0" cellpadding="0" cellspacing="0" class="{self.cssclass_month}">',
+            self.formatmonthname(theyear, themonth, withyear=withyear),
+            self.formatweekheader(),
+        ]
+        rows.extend(self.formatweek(zip(week, weekdays)) for week in self._month_layout(theyear, themonth))
+        rows.append("</table>")
+
+        return "\n".join(rows) + "\n"
+
+    def formatyear(self, theyear: int, width: int = 3) -> str:
+        """Return a year's calendar as an HTML table, ``width`` months per row."""
+        width = max(width, 1)
+        rows = [
+            f'<table border="0" cellpadding="0" cellspacing="0" class="{self.cssclass_year}">',
+            f'<tr><th colspan="{width}" class="{self.cssclass_year_head}">{self._number(theyear)}</th></tr>',
+        ]
+
+        for first in range(1, 13, width):
+            rows.append("<tr>")
+            for k in range(first, min(first + width, 13)):
+                rows.append("<td>")
+                rows.append(self.formatmonth(theyear, k, withyear=False))
+                rows.append("</td>")
+            rows.append("</tr>")
+
+        rows.append("</table>")
+        return "\n".join(rows)
+
+
+_text_calendar = TextCalendar()
+
+monthcalendar = _text_calendar.monthdayscalendar
+itermonthdates = _text_calendar.itermonthdates
+month = _text_calendar.formatmonth
+calendar = _text_calendar.formatyear
+prmonth = _text_calendar.prmonth
+
+
+def prcal(theyear: int, w: int = 0, l: int = 0, c: int = 6, m: int = 3, file=None):  # noqa: E741
+    """Print a year's calendar to ``file``, ``sys.stdout`` by default."""
+    print(_text_calendar.formatyear(theyear, w, l, c, m), end="", file=file or sys.stdout)
@@ -1,13 +1,18 @@
+import math
 import operator
 import re
+import time
+from collections import OrderedDict, namedtuple
 from datetime import date
 from datetime import datetime as dt
 from datetime import time as _time
 from datetime import timedelta, timezone, tzinfo
+from functools import lru_cache
 from re import escape as re_escape
 from zoneinfo import ZoneInfo
 
 from persiantools import digits, utils
+from persiantools.tz import TehranTZ
 
 # The minimum year supported by the JalaliDate module
 MINYEAR = 1
@@ -106,6 +111,42 @@ WEEKDAY_NAMES_ABBR_EN = ["Sha", "Yek", "Dos", "Ses", "Cha", "Pan", "Jom"]
 # Abbreviated weekday names in Persian for the Jalali calendar
 WEEKDAY_NAMES_ABBR_FA = ["ش", "ی", "د", "س", "چ", "پ", "ج"]
 
+# Ordinal words of the days of the month in Persian, indexed by day
+DAY_ORDINAL_WORDS_FA = [
+    None,
+    "یکم",
+    "دوم",
+    "سوم",
+    "چهارم",
+    "پنجم",
+    "ششم",
+    "هفتم",
+    "هشتم",
+    "نهم",
+    "دهم",
+    "یازدهم",
+    "دوازدهم",
+    "سیزدهم",
+    "چهاردهم",
+    "پانزدهم",
+    "شانزدهم",
+    "هفدهم",
+    "هجدهم",
+    "نوزدهم",
+    "بیستم",
+    "بیست و یکم",
+    "بیست و دوم",
+    "بیست و سوم",
+    "بیست و چهارم",
+    "بیست و پنجم",
+    "بیست و ششم",
+    "بیست و هفتم",
+    "بیست و هشتم",
+    "بیست و نهم",
+    "سی‌ام",
+    "سی و یکم",
+]
+
 # The number of days in each month of the Jalali calendar.
 # Each list contains the following columns:
 # 1. The number of days in the month for a non-leap year.
@@ -147,9 +188,1030 @@ NON_LEAP_CORRECTION_SET = frozenset(
 
 MIN_NON_LEAP_CORRECTION = 1502
 
+_EPOCH = dt(1970, 1, 1)
+
+# Difference between a Gregorian (proleptic) ordinal and the corresponding JalaliDate ordinal
+_GREGORIAN_ORDINAL_OFFSET = 226894
+
+# JalaliDate ordinal of 1970-01-01, the Unix epoch
+_EPOCH_ORDINAL = 719163 - _GREGORIAN_ORDINAL_OFFSET
+
+# First JalaliDate ordinal (1601-01-01) from which the Gregorian to Jalali conversion is a plain
+# shift of the day count; earlier dates go through the Gregorian calendar.
+_ARITHMETIC_ORDINAL_START = 584389 - _GREGORIAN_ORDINAL_OFFSET
+
+
+def _gregorian_to_jalali(year: int, month: int, day: int):
+    """Convert a Gregorian date to a ``(year, month, day)`` Jalali tuple without validation."""
+    # Days in each month of the Gregorian calendar
+    gregorian_days_in_month = [0, 31, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334]
+
+    # Determine the Jalali year
+    jalali_year = 0 if year <= 1600 else 979
+    year -= 621 if year <= 1600 else 1600
+
+    # Determine if the year is a leap year
+    leap_year = year + 1 if month > 2 else year
+
+    # Calculate the number of days
+    days = (365 * year) + (leap_year + 3) // 4 - (leap_year + 99) // 100
+    days += (leap_year + 399) // 400 - 80 + day + gregorian_days_in_month[month - 1]
+
+    return _jalali_from_days(jalali_year, days)
+
+
+def _jalali_from_days(jalali_year: int, days: int):
+    # Update the Jalali year
+    jalali_year += 33 * (days // 12053)
+    days %= 12053
+    jalali_year += 4 * (days // 1461)
+    days %= 1461
+
+    # Correct for the leap year case
+    if days > 365:
+        jalali_year += (days - 1) // 365
+        days = (days - 1) % 365
+
+    # Determine the Jalali month and day
+    if days < 186:
+        return jalali_year, 1 + days // 31, 1 + (days % 31)
+
+    days -= 186
+    return jalali_year, 7 + days // 30, 1 + (days % 30)
+
+
+def _ymd_to_ordinal(year: int, month: int, day: int) -> int:
+    """Return the ordinal of a Jalali date, using the same day count as ``JalaliDate.to_gregorian``."""
+    year += 1595
+    days = 365 * year + (year // 33) * 8 + ((year % 33) + 3) // 4 + day - 582927
+
+    if month < 7:
+        return days + (month - 1) * 31
+
+    return days + (month - 7) * 30 + 186
+
+
+def _ordinal_to_ymd(n: int):
+    """Return the ``(year, month, day)`` tuple of a Jalali ordinal without validation."""
+    if n >= _ARITHMETIC_ORDINAL_START:
+        return _jalali_from_days(979, n - 357208)
+
+    g = date.fromordinal(n + _GREGORIAN_ORDINAL_OFFSET)
+    return _gregorian_to_jalali(g.year, g.month, g.day)
+
+
+def _offset_seconds(offset):
+    """Convert a UTC offset to seconds, or None if it is missing or not a whole number of seconds."""
+    if offset is None or offset.microseconds:
+        return None
+
+    return offset.days * 86400 + offset.seconds
+
+
+def _utcoffset_from_utc(tz, seconds: int):
+    """
+    Return the UTC offset (in seconds) of ``tz`` at the UTC instant ``seconds`` since the epoch.
+
+    Fixed offsets and ``TehranTZ`` are resolved with integer arithmetic; any other tzinfo is asked
+    through ``fromutc``. None is returned when the offset has a sub-second component.
+    """
+    if isinstance(tz, TehranTZ):
+        return tz.offset_at(seconds)
+
+    if isinstance(tz, timezone):
+        return _offset_seconds(tz.utcoffset(None))
+
+    utc = _EPOCH + timedelta(seconds=seconds)
+    return _offset_seconds(tz.fromutc(utc.replace(tzinfo=tz)).replace(tzinfo=None) - utc)
+
+
+def _utcoffset_at_wall(tz, wall: int):
+    """
+    Return the UTC offset (in seconds) of ``tz`` at the wall clock time ``wall`` (seconds since the epoch).
+
+    Ambiguous and skipped wall times resolve like ``fold=0``, so a skipped time maps onto the instant of
+    the transition. ``tz=None`` stands for the system local time.
+    """
+    if isinstance(tz, TehranTZ):
+        return tz.local_offset_at(wall)
+
+    if isinstance(tz, timezone):
+        return _offset_seconds(tz.utcoffset(None))
+
+    local = _EPOCH + timedelta(seconds=wall)
+    if tz is None:
+        return _offset_seconds(local.astimezone().utcoffset())
+
+    return _offset_seconds(tz.utcoffset(local.replace(tzinfo=tz)))
+
+
+# Calendar periods understood by JalaliDateTime.floor, ceil and period_bounds
+PERIOD_UNITS = ("minute", "hour", "day", "week", "month", "quarter", "year")
+
+_PERIOD_MONTHS = {"month": 1, "quarter": 3, "year": 12}
+
+
+def _check_period_unit(unit):
+    if unit not in PERIOD_UNITS:
+        raise ValueError(f"unit must be one of {', '.join(PERIOD_UNITS)}", unit)
+
+
+def _period_wall(wall: int, unit: str):
+    """Return the wall clock bounds ``(start, end)`` of the Jalali calendar period containing ``wall``."""
+    if unit == "minute":
+        start = wall - wall % 60
+        return start, start + 60
+
+    if unit == "hour":
+        start = wall - wall % 3600
+        return start, start + 3600
+
+    days = wall // 86400
+    if unit == "day":
+        return days * 86400, days * 86400 + 86400
+
+    if unit == "week":
+        # Weeks start on Shanbeh, see JalaliDate.weekday
+        days -= (days + _EPOCH_ORDINAL + 4) % 7
+        return days * 86400, days * 86400 + 7 * 86400
+
+    year, month, _ = _ordinal_to_ymd(days + _EPOCH_ORDINAL)
+    months = _PERIOD_MONTHS[unit]
+    month -= (month - 1) % months
+    end_year, end_month = divmod(month - 1 + months, 12)
+
+    start = _ymd_to_ordinal(year, month, 1) - _EPOCH_ORDINAL
+    end = _ymd_to_ordinal(year + end_year, end_month + 1, 1) - _EPOCH_ORDINAL
+
+    return start * 86400, end * 86400
+
+
+class _OffsetCache:
+    """
+    Remember the offset period of a tzinfo around the last looked up UTC instant.
+
+    ``TehranTZ`` and fixed offsets report their exact periods. Other tzinfos, such as ``ZoneInfo``
+    (and the system local time, for ``tz=None``), are probed at both ends of the surrounding UTC day,
+    and the offset is reused for the whole day when both probes agree (transitions of a zone are more
+    than a day apart in practice). Otherwise the transition is found by bisection to the second, so
+    a sorted batch asks the zone twice per day and about twenty times per transition.
+    """
+
+    __slots__ = "_tz", "_offset", "_start", "_end"
+
+    _BUCKET = 86400
+
+    def __init__(self, tz):
+        self._tz = tz
+        self._offset = None
+        self._start = self._end = 0
+
+    def _probe(self, seconds: int):
+        if self._tz is None:
+            return time.localtime(seconds).tm_gmtoff
+
+        return _utcoffset_from_utc(self._tz, seconds)
+
+    def period_at(self, seconds: int):
+        """Return ``(offset, start, end)``: the offset at ``seconds`` and the UTC range it is known to cover."""
+        if self._start <= seconds < self._end:
+            return self._offset, self._start, self._end
+
+        tz = self._tz
+        if isinstance(tz, TehranTZ):
+            offset, start, end = tz.period_at(seconds)
+        elif isinstance(tz, timezone):
+            offset, start, end = _offset_seconds(tz.utcoffset(None)), None, None
+        else:
+            start = seconds - seconds % self._BUCKET
+            end = start + self._BUCKET
+            offset = self._probe(start)
+            last = self._probe(end - 1)
+            if offset != last:
+                # the first second of the last offset
+                low, high = start, end - 1
+                while high - low > 1:
+                    middle = (low + high) // 2
+                    if self._probe(middle) == offset:
+                        low = middle
+                    else:
+                        high = middle
+
+                if seconds < high:
+                    end = high
+                else:
+                    offset, start = last, high
+
+                if offset != self._probe(seconds):
+                    # more than one transition in the day
+                    return self._probe(seconds), seconds, seconds + 1
+
+        self._offset = offset
+        self._start = float("-inf") if start is None else start
+        self._end = float("inf") if end is None else end
+
+        return offset, self._start, self._end
+
+    def offset_at(self, seconds: int):
+        if self._start <= seconds < self._end:
+            return self._offset
+
+        return self.period_at(seconds)[0]
+
+
+_MONTH_NAMES = {"en": MONTH_NAMES_EN, "fa": MONTH_NAMES_FA}
+_MONTH_NAMES_ABBR = {"en": MONTH_NAMES_ABBR_EN, "fa": MONTH_NAMES_ABBR_FA}
+_WEEKDAY_NAMES = {"en": WEEKDAY_NAMES_EN, "fa": WEEKDAY_NAMES_FA}
+_WEEKDAY_NAMES_ABBR = {"en": WEEKDAY_NAMES_ABBR_EN, "fa": WEEKDAY_NAMES_ABBR_FA}
+
+# Zero-padded digit strings per locale, so the formatters emit Persian digits directly instead of
+# translating the whole result afterwards
+_DIGITS = {"en": "0123456789", "fa": "۰۱۲۳۴۵۶۷۸۹"}
+_DIGITS2 = {locale: tuple(a + b for a in chars for b in chars) for locale, chars in _DIGITS.items()}
+_DIGITS3 = {locale: tuple(a + b for a in chars for b in _DIGITS2[locale]) for locale, chars in _DIGITS.items()}
+_YEARS = {"en": {}, "fa": {}}
+
+
+def _localize_digits(text: str, locale: str) -> str:
+    return digits.en_to_fa(text) if locale == "fa" else text
+
+
+def _format_year(year: int, locale: str) -> str:
+    """Return ``year`` zero-padded to four digits in the digits of ``locale``, built lazily."""
+    years = _YEARS[locale]
+    try:
+        return years[year]
+    except KeyError:
+        text = years[year] = _localize_digits(f"{year:04d}", locale)
+        return text
+
+
+def _format_microsecond(microsecond: int, locale: str) -> str:
+    table = _DIGITS3[locale]
+    return table[microsecond // 1000] + table[microsecond % 1000]
+
+
+# strftime directives of JalaliDate. Each formatter takes the date and the locale and is only
+# called when its directive is present in the format.
+_STRFTIME_DATE = {
+    "a": lambda d, locale: _WEEKDAY_NAMES_ABBR[locale][d.weekday()],
+    "A": lambda d, locale: _WEEKDAY_NAMES[locale][d.weekday()],
+    "w": lambda d, locale: _DIGITS[locale][d.weekday()],
+    "d": lambda d, locale: _DIGITS2[locale][d._day],
+    "b": lambda d, locale: _MONTH_NAMES_ABBR[locale][d._month],
+    "B": lambda d, locale: _MONTH_NAMES[locale][d._month],
+    "m": lambda d, locale: _DIGITS2[locale][d._month],
+    "y": lambda d, locale: _DIGITS2[locale][d._year % 100],
+    "Y": lambda d, locale: _format_year(d._year, locale),
+    "H": lambda d, locale: _DIGITS2[locale][0],
+    "I": lambda d, locale: _DIGITS2[locale][0],
+    "p": lambda d, locale: "AM" if locale == "en" else "ق.ظ",
+    "M": lambda d, locale: _DIGITS2[locale][0],
+    "S": lambda d, locale: _DIGITS2[locale][0],
+    "f": lambda d, locale: _format_microsecond(0, locale),
+    "z": lambda d, locale: "",
+    "Z": lambda d, locale: "",
+    "j": lambda d, locale: _DIGITS3[locale][_MONTH_COUNT[d._month][2] + d._day],
+    "U": lambda d, locale: _DIGITS2[locale][d.week_of_year()],
+    "W": lambda d, locale: _DIGITS2[locale][d.week_of_year()],
+    "X": lambda d, locale: _format_time(0, 0, 0, locale),
+    "%": lambda d, locale: "%",
+}
+
+
+def _format_time(hour: int, minute: int, second: int, locale: str) -> str:
+    table = _DIGITS2[locale]
+    return f"{table[hour]}:{table[minute]}:{table[second]}"
+
+
+def _format_utcoffset(offset) -> str:
+    """Format a UTC offset like datetime's ``%z``: ``+HHMM[SS[.ffffff]]``, or "" for None."""
+    if offset is None:
+        return ""
+
+    sign = "+"
+    if offset.days < 0:
+        sign = "-"
+        offset = -offset
+
+    hours, rest = divmod(offset, timedelta(hours=1))
+    minutes, rest = divmod(rest, timedelta(minutes=1))
+    result = f"{sign}{hours:02d}{minutes:02d}"
+
+    if rest.seconds or rest.microseconds:
+        result += f"{rest.seconds:02d}"
+        if rest.microseconds:
+            result += f".{rest.microseconds:06d}"
+
+    return result
+
+
+def _strftime_utcoffset(d, locale) -> str:
+    tz = d._tzinfo
+    if tz is None:
+        return ""
+
+    if isinstance(tz, TehranTZ):
+        offset = timedelta(seconds=tz.local_offset_at(d._wall_seconds()))
+    elif isinstance(tz, timezone):
+        offset = tz.utcoffset(None)
+    else:
+        offset = tz.utcoffset(d.to_gregorian())
+
+    return _localize_digits(_format_utcoffset(offset), locale)
+
+
+def _strftime_tzname(d, locale) -> str:
+    if d._tzinfo is None:
+        return ""
+
+    return _localize_digits(d._tzinfo.tzname(d.to_gregorian()) or "", locale)
+
+
+# strftime directives of JalaliDateTime: the date directives plus the time of day and timezone
+_STRFTIME_DATETIME = {
+    **_STRFTIME_DATE,
+    "H": lambda d, locale: _DIGITS2[locale][d._hour],
+    "I": lambda d, locale: _DIGITS2[locale][d._hour if d._hour <= 12 else d._hour - 12],
+    "p": lambda d, locale: "AM" if d._hour < 12 else "PM",
+    "M": lambda d, locale: _DIGITS2[locale][d._minute],
+    "S": lambda d, locale: _DIGITS2[locale][d._second],
+    "f": lambda d, locale: _format_microsecond(d._microsecond, locale),
+    "z": _strftime_utcoffset,
+    "Z": _strftime_tzname,
+    "X": lambda d, locale: _format_time(d._hour, d._minute, d._second, locale),
+}
+
+
+@lru_cache(maxsize=256)
+def _compile_strftime(fmt: str, cls, locale: str = "en"):
+    """
+    Split a strftime format into ``(text, is_directive)`` segments for ``cls``.
+
+    Aliases such as ``%c`` and ``%x`` are expanded from ``cls._STRFTIME_ALIASES``, adjacent literal text
+    is merged and unknown directives are kept as literal text, with its digits in those of ``locale``.
+    """
+    directives = cls._STRFTIME_DIRECTIVES
+    aliases = cls._STRFTIME_ALIASES
+    segments = []
+    literal = []
+
+    def scan(fmt, expand):
+        i, n = 0, len(fmt)
+        while i < n:
+            j = fmt.find("%", i)
+            if j < 0 or j + 1 == n:
+                literal.append(fmt[i:])
+                return
+
+            literal.append(fmt[i:j])
+            char = fmt[j + 1]
+
+            if expand and char in aliases:
+                scan(aliases[char], False)
+            elif char in directives:
+                if literal:
+                    segments.append(("".join(literal), False))
+                    literal.clear()
+                segments.append((char, True))
+            else:
+                literal.append(fmt[j : j + 2])
+
+            i = j + 2
+
+    if not isinstance(fmt, str):
+        raise TypeError(f"strftime() argument 1 must be str, not {type(fmt).__name__}")
+
+    scan(fmt, True)
+    if literal and "".join(literal):
+        segments.append(("".join(literal), False))
+
+    return tuple(
+        (text if is_directive else _localize_digits(text, locale), is_directive)
+        for text, is_directive in segments
+        if text
+    )
+
+
+@lru_cache(maxsize=None)
+def _year_words(year: int) -> str:
+    """Return the Persian words of a year, memoised as the years are few and often repeated."""
+    return digits.to_word(year)
+
+
+# Relative time buckets of humanize: (upper bound in seconds, unit, seconds per unit). From 12 hours
+# up to a week, humanize_many counts days between calendar dates, so that the previous or next date
+# is "yesterday" or "tomorrow"; closer values keep their minutes or hours.
+_HUMANIZE_BUCKETS = (
+    (45, "now", 1),
+    (45 * 60, "minute", 60),
+    (22 * 3600, "hour", 3600),
+    (7 * 86400, "day", 86400),
+    (30 * 86400, "week", 7 * 86400),
+    (365 * 86400, "month", 30 * 86400),
+    (None, "year", 365 * 86400),
+)
+
+_HUMANIZE_UNITS = {
+    "en": {"minute": "minute", "hour": "hour", "day": "day", "week": "week", "month": "month", "year": "year"},
+    "fa": {"minute": "دقیقه", "hour": "ساعت", "day": "روز", "week": "هفته", "month": "ماه", "year": "سال"},
+}
+
+# Rendered humanize labels by (unit, signed count, locale)
+_humanize_labels = {}
+
+
+def _humanize_bucket(seconds: int):
+    """Return the unit and the signed count of elapsed ``seconds``, negative for the future."""
+    elapsed = abs(seconds)
+    for bound, unit, size in _HUMANIZE_BUCKETS:
+        if bound is None or elapsed < bound:
+            break
+
+    if unit == "now":
+        return unit, 0
+
+    count = (elapsed + size // 2) // size if unit in ("minute", "hour", "day") else elapsed // size
+    if unit == "month":
+        count = min(count, 11)
+
+    count = max(count, 1)
+    return unit, count if seconds >= 0 else -count
+
+
+def _humanize_label(unit: str, count: int, locale: str) -> str:
+    key = (unit, count, locale)
+    try:
+        return _humanize_labels[key]
+    except KeyError:
+        pass
+
+    past = count > 0
+    n = abs(count)
+    if unit == "now":
+        label = "just now" if locale == "en" else "همین الان"
+    elif unit == "day" and n == 1:
+        label = {"en": ("tomorrow", "yesterday"), "fa": ("فردا", "دیروز")}[locale][past]
+    elif locale == "en":
+        name = _HUMANIZE_UNITS["en"][unit] + ("s" if n > 1 else "")
+        label = f"{n} {name} ago" if past else f"in {n} {name}"
+    else:
+        label = f"{digits.en_to_fa(str(n))} {_HUMANIZE_UNITS['fa'][unit]} {'پیش' if past else 'بعد'}"
+
+    _humanize_labels[key] = label
+    return label
+
+
+# Units of format_duration: (seconds per unit, Persian name)
+_DURATION_UNITS = ((86400, "روز"), (3600, "ساعت"), (60, "دقیقه"), (1, "ثانیه"))
+
+DURATION_STYLES = ("digits", "words")
+
+
+@lru_cache(maxsize=1024)
+def _duration_count(count: int, style: str) -> str:
+    return digits.en_to_fa(str(count)) if style == "digits" else digits.to_word(count)
+
+
+@lru_cache(maxsize=4096)
+def _format_duration(seconds: int, style: str, precision):
+    if seconds < 0:
+        return digits.NEGATIVE + _format_duration(-seconds, style, precision)
+
+    parts = []
+    for size, name in _DURATION_UNITS:
+        count, seconds = divmod(seconds, size)
+        if count:
+            parts.append(f"{_duration_count(count, style)} {name}")
+            if len(parts) == precision:
+                break
+
+    if not parts:
+        return f"{_duration_count(0, style)} {_DURATION_UNITS[-1][1]}"
+
+    return digits.DELI.join(parts)
+
+
+def _check_duration_args(style, precision):
+    if style not in DURATION_STYLES:
+        raise ValueError(f"style must be one of {', '.join(DURATION_STYLES)}", style)
+
+    if precision is not None and (not isinstance(precision, int) or precision < 1):
+        raise ValueError("precision must be a positive integer or None", precision)
+
+
+def _duration_seconds(td) -> int:
+    if isinstance(td, timedelta):
+        if td.days < 0:
+            return -_duration_seconds(-td)
+        return td.days * 86400 + td.seconds
+    if isinstance(td, (int, float)) and not isinstance(td, bool):
+        if not math.isfinite(td):
+            raise ValueError("duration must be finite")
+        return int(td)
+
+    raise TypeError(f"duration must be a timedelta or a number of seconds, not {type(td).__name__}")
+
+
+def format_duration(td, style: str = "digits", precision=None) -> str:
+    """
+    Format a duration in Persian, such as "۲ روز و ۳ ساعت و ۱۵ دقیقه".
+
+    The duration is split into days, hours, minutes and seconds; zero units are left out and
+    fractions of a second are dropped.
+
+    Args:
+        td (timedelta or int or float): The duration, or a number of seconds.
+        style (str, optional): "digits" for Persian digits or "words" for numbers in words. Defaults to "digits".
+        precision (int, optional): The maximum number of units, largest first. Defaults to all of them.
+
+    Returns:
+        str: The formatted duration.
+
+    Raises:
+        TypeError: If td is not a timedelta or a number.
+        ValueError: If td is not finite, or if style or precision is invalid.
+
+    Example:
+        >>> from datetime import timedelta
+        >>> from persiantools.jdatetime import format_duration
+        >>> format_duration(timedelta(days=2, hours=3, minutes=15))
+        '۲ روز و ۳ ساعت و ۱۵ دقیقه'
+        >>> format_duration(timedelta(days=2, hours=3, minutes=15), style="words", precision=2)
+        'دو روز و سه ساعت'
+    """
+    _check_duration_args(style, precision)
+    return _format_duration(_duration_seconds(td), style, precision)
+
+
+def format_durations(values, style: str = "digits", precision=None):
+    """
+    Format a sequence of durations, see `format_duration`.
+
+    Args:
+        values (iterable): timedelta values or numbers of seconds.
+        style (str, optional): "digits" or "words". Defaults to "digits".
+        precision (int, optional): The maximum number of units. Defaults to all of them.
+
+    Returns:
+        list: The formatted durations, in input order.
+    """
+    _check_duration_args(style, precision)
+    return [_format_duration(_duration_seconds(td), style, precision) for td in values]
+
+
+# Persian and Arabic-Indic digits to ASCII, for the strptime scanners
+_TO_ASCII_DIGITS = str.maketrans("۰۱۲۳۴۵۶۷۸۹٠١٢٣٤٥٦٧٨٩", "01234567890123456789")
+_DIGIT_MASK = str.maketrans(dict.fromkeys("0123456789۰۱۲۳۴۵۶۷۸۹٠١٢٣٤٥٦٧٨٩", "0"))
+
+
+def _days_in_month(year: int, month: int) -> int:
+    if month == 12 and JalaliDate.is_leap(year):
+        return 30
+
+    return _MONTH_COUNT[month][0]
+
+
+# The binary types the parsers accept besides str, read as UTF-8
+_BYTES_TYPES = (bytes, bytearray, memoryview)
+_TEXT_TYPES = (str, *_BYTES_TYPES)
+
+# The UTF-8 bytes of text that is ASCII apart from Persian (DB B0-B9) and Arabic-Indic (D9 A0-A9) digits
+_UTF8_DIGITS = re.compile(rb"(?:[\x00-\x7f]|\xdb[\xb0-\xb9]|\xd9[\xa0-\xa9])*")
+
+# The second bytes of the UTF-8 Persian and Arabic-Indic digits to ASCII digits
+_UTF8_DIGIT_BYTES = bytes.maketrans(bytes(range(0xB0, 0xBA)) + bytes(range(0xA0, 0xAA)), b"0123456789" * 2)
+
+
+def _ascii_bytes(data):
+    """
+    Return the bytes of ``data`` with its UTF-8 Persian and Arabic-Indic digits as ASCII digits.
+
+    ``data`` is a ``bytes``, ``bytearray`` or ``memoryview``. Returns None when it has other non-ASCII bytes.
+    """
+    if type(data) is memoryview:
+        data = data.tobytes()
+
+    if data.isascii():
+        return data
+
+    if _UTF8_DIGITS.fullmatch(data) is None:
+        return None
+
+    # the lead bytes are dropped and the second bytes mapped to the digits
+    return data.replace(b"\xdb", b"").replace(b"\xd9", b"").translate(_UTF8_DIGIT_BYTES)
+
+
+def _fixed_scanner(layout: str):
+    """
+    Build a scanner for a fixed-width layout such as ``"YYYY/mm/dd HH:MM"``.
+
+    The scanner returns the (year, month, day[, hour, minute[, second]]) of a string, or of its UTF-8
+    bytes, with zero-padded ASCII, Persian or Arabic-Indic digits, or None for anything else, including
+    out of range values, so that strptime can fall back to its regular expressions and their error messages.
+    """
+    mask = "".join("0" if c in "YmdHMS" else c for c in layout)
+    byte_mask = mask.encode("ascii")
+    fields = [slice(i, i + layout.count(c)) for i, c in enumerate(layout) if c in "YmdHMS" and layout.index(c) == i]
+    with_time = len(fields) > 3
+
+    def scan(string):
+        # every digit maps to "0", so comparing with the mask checks the length, the digits and the separators
+        if isinstance(string, str):
+            if string.translate(_DIGIT_MASK) != mask:
+                return None
+
+            string = string.translate(_TO_ASCII_DIGITS)
+        else:
+            string = _ascii_bytes(string)
+            if string is None or string.translate(_BYTES_DIGIT_MASK) != byte_mask:
+                return None
+
+        values = [int(string[field]) for field in fields]
+
+        year, month, day = values[0], values[1], values[2]
+        if not (MINYEAR <= year <= MAXYEAR and 1 <= month <= 12 and 1 <= day <= _days_in_month(year, month)):
+            return None
+
+        if with_time and not (values[3] <= 23 and values[4] <= 59 and values[-1] <= 59):
+            return None
+
+        return values
+
+    return scan
+
+
+# Scanners of the most common strptime formats, tried before the regular expressions
+_DATE_SCANNERS = {
+    "%Y/%m/%d": _fixed_scanner("YYYY/mm/dd"),
+    "%Y-%m-%d": _fixed_scanner("YYYY-mm-dd"),
+    "%Y%m%d": _fixed_scanner("YYYYmmdd"),
+}
+
+_DATETIME_SCANNERS = {
+    **_DATE_SCANNERS,
+    "%Y/%m/%d %H:%M": _fixed_scanner("YYYY/mm/dd HH:MM"),
+    "%Y-%m-%d %H:%M": _fixed_scanner("YYYY-mm-dd HH:MM"),
+    "%Y/%m/%d %H:%M:%S": _fixed_scanner("YYYY/mm/dd HH:MM:SS"),
+    "%Y-%m-%d %H:%M:%S": _fixed_scanner("YYYY-mm-dd HH:MM:SS"),
+}
+
+
+# ASCII digits to "0", the bytes counterpart of _DIGIT_MASK
+_BYTES_DIGIT_MASK = bytes.maketrans(b"0123456789", b"0000000000")
+
+
+def _iso_input(string):
+    """
+    Return ``(string, mask)`` for the ISO 8601 parsers.
+
+    ``mask`` is ``string`` with every ASCII, Persian and Arabic-Indic digit replaced by ``"0"``, so the
+    layout is checked on the mask while ``int()`` reads the digits of any script straight from ``string``.
+    Bytes are read as they are when they are ASCII apart from UTF-8 Persian and Arabic-Indic digits, and
+    are decoded as UTF-8 otherwise.
+    """
+    if isinstance(string, str):
+        return string, string.translate(_DIGIT_MASK)
+
+    if isinstance(string, _BYTES_TYPES):
+        folded = _ascii_bytes(string)
+        if folded is not None:
+            return folded, folded.translate(_BYTES_DIGIT_MASK).decode("ascii")
+
+        string = bytes(string).decode("utf-8")
+        return string, string.translate(_DIGIT_MASK)
+
+    raise TypeError("fromisoformat: argument must be str")
+
+
+def _iso_date_fields(string, mask):
+    """Return the validated ``[year, month, day]`` of the ``YYYY-MM-DD`` at the start of ``string``."""
+    if mask[:10] != "0000-00-00":
+        raise ValueError("Invalid isoformat date")
+
+    year, month, day = int(string[0:4]), int(string[5:7]), int(string[8:10])
+    if not (MINYEAR <= year <= MAXYEAR and 1 <= month <= 12 and 1 <= day <= _days_in_month(year, month)):
+        raise ValueError("Invalid isoformat date")
+
+    return [year, month, day]
+
+
+def _iso_hh_mm_ss_ff(string, mask, pos: int, end: int):
+    """Return the ``[hour, minute, second, microsecond]`` of ``HH[:?MM[:?SS[{.,}fff[fff]]]]`` in ``pos:end``."""
+    if mask.startswith("00:00:00", pos, end):
+        # the usual extended form
+        time_comps = [int(string[pos : pos + 2]), int(string[pos + 3 : pos + 5]), int(string[pos + 6 : pos + 8]), 0]
+        pos += 8
+        if pos == end:
+            return time_comps
+    else:
+        time_comps = [0, 0, 0, 0]
+        has_sep = False
+        for comp in range(3):
+            if end - pos < 2 or mask[pos : pos + 2] != "00":
+                raise ValueError("Incomplete time component")
+
+            time_comps[comp] = int(string[pos : pos + 2])
+            pos += 2
+            if pos == end:
+                return time_comps
+
+            next_char = mask[pos]
+            if comp == 0:
+                has_sep = next_char == ":"
+            elif comp == 2:
+                break
+
+            if has_sep:
+                if next_char != ":":
+                    raise ValueError(f"Invalid time separator: {next_char}")
+                pos += 1
+
+    if mask[pos] not in ".,":
+        raise ValueError("Invalid microsecond component")
+
+    pos += 1
+    # digits after the sixth are truncated
+    stop = min(pos + 6, end)
+    if pos == stop or mask[pos:end] != "0" * (end - pos):
+        raise ValueError("Invalid microsecond component")
+
+    time_comps[3] = int(string[pos:stop])
+    if stop - pos < 6:
+        time_comps[3] *= _FRACTION_CORRECTION[stop - pos - 1]
+
+    return time_comps
+
+
+@lru_cache(maxsize=256)
+def _fixed_timezone(offset: timedelta):
+    """Return the shared ``timezone`` of ``offset``, so that equal offsets parse to the same tzinfo."""
+    return timezone(offset)
+
+
+@lru_cache(maxsize=256)
+def _strptime_offset(sign: str, hours: str, minutes: str, seconds, fraction):
+    """Return the ``timezone`` of the groups of a ``%z`` match, cached per offset string."""
+    offset = timedelta(
+        hours=int(hours),
+        minutes=int(minutes),
+        seconds=int(seconds or 0),
+        microseconds=int(fraction or 0),
+    )
+
+    return _fixed_timezone(-offset if sign == "-" else offset)
+
+
+@lru_cache(maxsize=64)
+def _zone_info(name: str):
+    """Return the ``ZoneInfo`` of ``name``, or None when it is not a known time zone."""
+    try:
+        return ZoneInfo(name)
+    except Exception:
+        return None
+
+
+def _iso_time_fields(string, mask, pos: int):
+    """Return the ``[hour, minute, second, microsecond, tzinfo]`` of the ISO 8601 time from ``pos``."""
+    end = len(mask)
+    if end - pos < 2:
+        raise ValueError("Isoformat time too short")
+
+    # the time ends at a "-", a "+" or a "Z", in that order of precedence
+    tz_pos = mask.find("-", pos)
+    if tz_pos < 0:
+        tz_pos = mask.find("+", pos)
+    if tz_pos < 0:
+        tz_pos = mask.find("Z", pos)
+    if tz_pos < 0:
+        tz_pos = end
+
+    time_comps = _iso_hh_mm_ss_ff(string, mask, pos, tz_pos)
+
+    tzi = None
+    if tz_pos == end - 1 and mask[tz_pos] == "Z":
+        tzi = timezone.utc
+    elif tz_pos < end:
+        # HH, HHMM, HH:MM, HHMMSS, HHMMSS.f+, HH:MM:SS or HH:MM:SS.f+
+        if end - tz_pos - 1 in (0, 1, 3):
+            raise ValueError("Malformed time zone string")
+
+        hours, minutes, seconds, microseconds = _iso_hh_mm_ss_ff(string, mask, tz_pos + 1, end)
+        if hours or minutes or seconds or microseconds:
+            offset = timedelta(hours=hours, minutes=minutes, seconds=seconds, microseconds=microseconds)
+            tzi = _fixed_timezone(-offset if mask[tz_pos] == "-" else offset)
+        else:
+            tzi = timezone.utc
+
+    time_comps.append(tzi)
+
+    return time_comps
+
+
+def _name_numbers(names) -> dict:
+    """Map each name to its 1-based position, keeping the first one of repeated names like list.index."""
+    numbers = {}
+    for number, name in enumerate(names, 1):
+        numbers.setdefault(name, number)
+
+    return numbers
+
+
+FormatCacheInfo = namedtuple("FormatCacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+
+def _render_day(d, locale: str, compiled):
+    """
+    Render the directives of compiled strftime segments that only depend on the day of ``d``.
+
+    Returns the formatted string if nothing else is left, otherwise the segments with the time-of-day
+    directives still to be formatted.
+    """
+    cls = type(d)
+    directives = cls._STRFTIME_DIRECTIVES
+    time_directives = cls._STRFTIME_TIME_DIRECTIVES
+    segments = []
+    for text, is_directive in compiled:
+        if is_directive and text in time_directives:
+            segments.append((text, True))
+            continue
+
+        if is_directive:
+            text = directives[text](d, locale)
+        if segments and not segments[-1][1]:
+            segments[-1] = (segments[-1][0] + text, False)
+        else:
+            segments.append((text, False))
+
+    if not segments:
+        return ""
+
+    if len(segments) == 1 and not segments[0][1]:
+        return segments[0][0]
+
+    return tuple(segments)
+
+
+class _FormatCache:
+    """
+    LRU of strftime output that only depends on the day, keyed by (ordinal, format, locale, class).
+
+    An entry is the formatted string, or for formats with time-of-day directives the compiled segments
+    with the date directives already rendered, leaving the time directives to be filled in per call.
+    """
+
+    __slots__ = ("maxsize", "hits", "misses", "_entries")
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def render(self, d, fmt: str, locale: str, compiled):
+        key = (_ymd_to_ordinal(d._year, d._month, d._day), fmt, locale, type(d))
+        entries = self._entries
+
+        try:
+            entry = entries[key]
+        except KeyError:
+            pass
+        else:
+            self.hits += 1
+            try:
+                entries.move_to_end(key)
+            except KeyError:  # evicted by another thread
+                pass
+            return entry
+
+        self.misses += 1
+        entry = _render_day(d, locale, compiled)
+        entries[key] = entry
+        if len(entries) > self.maxsize:
+            try:
+                entries.popitem(last=False)
+            except KeyError:
+                pass
+
+        return entry
+
+
+_format_cache = None
+
+# Number of formatted values joined into one write by write_formatted
+_WRITE_CHUNK = 4096
+
+
+def _iter_formatted(values, fmt, locale):
+    """
+    Yield ``value.strftime(fmt, locale)`` for each value, or ``value.isoformat()`` if ``fmt`` is None.
+
+    Formats are compiled once per class and locale and the day-dependent part is rendered once per run
+    of values on the same day. ``datetime.date`` and ``datetime.datetime`` values are converted to Jalali.
+    """
+    if fmt is not None and not isinstance(fmt, str):
+        raise TypeError(f"strftime() argument 1 must be str, not {type(fmt).__name__}")
+
+    if locale not in ("en", "fa"):
+        locale = None
+
+    compiled = {}
+    last_ordinal = ymd = None
+    last_day = entry = None
+
+    for value in values:
+        if not isinstance(value, JalaliDate):
+            if not isinstance(value, date):
+                raise TypeError(f"expected a date or JalaliDate, not {type(value).__name__}")
 
-def _is_ascii_digit(c: str) -> bool:
-    return c in "0123456789"
+            ordinal = value.toordinal()
+            if ordinal != last_ordinal:
+                last_ordinal = ordinal
+                ymd = _ordinal_to_ymd(ordinal - _GREGORIAN_ORDINAL_OFFSET)
+
+                if not MINYEAR <= ymd[0] <= MAXYEAR:
+                    raise ValueError(f"year must be in {MINYEAR}..{MAXYEAR}", ymd[0])
+
+            if isinstance(value, dt):
+                value = JalaliDateTime._from_fields(
+                    *ymd, value.hour, value.minute, value.second, value.microsecond, value.tzinfo
+                )
+            else:
+                value = JalaliDate._from_fields(*ymd)
+
+        if fmt is None:
+            yield value.isoformat()
+            continue
+
+        cls = type(value)
+        value_locale = locale or value._locale
+        day = (value._year, value._month, value._day, cls, value_locale)
+        if day != last_day:
+            try:
+                segments = compiled[cls, value_locale]
+            except KeyError:
+                segments = compiled[cls, value_locale] = _compile_strftime(fmt, cls, value_locale)
+
+            last_day = day
+            entry = _render_day(value, value_locale, segments)
+
+        if entry.__class__ is str:
+            yield entry
+        else:
+            directives = cls._STRFTIME_DIRECTIVES
+            yield "".join(
+                [directives[text](value, value_locale) if is_directive else text for text, is_directive in entry]
+            )
+
+
+def enable_format_cache(maxsize: int = 4096):
+    """
+    Cache the day-dependent part of ``strftime`` output.
+
+    Formatted text is kept for up to ``maxsize`` (ordinal, format, locale) combinations, least recently
+    used first out. Time-of-day directives of ``JalaliDateTime`` are still formatted on every call.
+    ``isoformat`` is not cached, as its direct formatting is cheaper than a cache lookup. Calling it
+    again replaces the cache with an empty one of the new size.
+
+    Args:
+        maxsize (int): The maximum number of cached entries. Must be positive.
+
+    Raises:
+        ValueError: If maxsize is not a positive integer.
+    """
+    global _format_cache
+
+    if not isinstance(maxsize, int) or isinstance(maxsize, bool) or maxsize <= 0:
+        raise ValueError(f"maxsize must be a positive integer, not {maxsize!r}")
+
+    _format_cache = _FormatCache(maxsize)
+
+
+def disable_format_cache():
+    """Stop caching formatted output and drop the cached entries."""
+    global _format_cache
+    _format_cache = None
+
+
+def clear_format_cache():
+    """Drop the cached entries and reset the statistics, keeping the cache enabled if it is."""
+    if _format_cache is not None:
+        enable_format_cache(_format_cache.maxsize)
+
+
+def format_cache_info() -> FormatCacheInfo:
+    """
+    Return the statistics of the format cache.
+
+    Returns:
+        FormatCacheInfo: A named tuple of ``hits``, ``misses``, ``maxsize`` and ``currsize``.
+                         All of them are 0 while the cache is disabled.
+    """
+    cache = _format_cache
+    if cache is None:
+        return FormatCacheInfo(0, 0, 0, 0)
+
+    return FormatCacheInfo(cache.hits, cache.misses, cache.maxsize, len(cache._entries))
 
 
 class JalaliDate:
@@ -173,6 +1235,15 @@ class JalaliDate:
     # _hashcode: Cached hash code for the instance to speed up hash-based operations.
     __slots__ = "_year", "_month", "_day", "_locale", "_hashcode"
 
+    # strftime directives and the aliases expanded into them, see _compile_strftime, and the directives
+    # that do not only depend on the day, which the format cache leaves to be formatted per call
+    _STRFTIME_DIRECTIVES = _STRFTIME_DATE
+    _STRFTIME_ALIASES = {"c": "%A %d %B %Y", "x": "%y/%m/%d"}
+    _STRFTIME_TIME_DIRECTIVES = frozenset()
+
+    # scanners of the common strptime formats, see _fixed_scanner
+    _STRPTIME_SCANNERS = _DATE_SCANNERS
+
     def __init__(self, year, month=None, day=None, locale="en"):
         """
         Initialize a JalaliDate object.
@@ -216,6 +1287,15 @@ class JalaliDate:
         self._year, self._month, self._day, self._locale = self._check_date_fields(year, month, day, locale)
         self._hashcode = -1
 
+    @classmethod
+    def _from_fields(cls, year: int, month: int, day: int, locale: str = "en"):
+        """Build an instance from already validated fields, bypassing ``__init__``."""
+        self = object.__new__(cls)
+        self._year, self._month, self._day, self._locale = year, month, day, locale
+        self._hashcode = -1
+
+        return self
+
     @property
     def year(self) -> int:
         """
@@ -426,41 +1506,7 @@ class JalaliDate:
             day = year.day
             year = year.year
 
-        # Days in each month of the Gregorian calendar
-        gregorian_days_in_month = [0, 31, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334]
-
-        # Determine the Jalali year
-        jalali_year = 0 if year <= 1600 else 979
-        year -= 621 if year <= 1600 else 1600
-
-        # Determine if the year is a leap year
-        leap_year = year + 1 if month > 2 else year
-
-        # Calculate the number of days
-        days = (365 * year) + (leap_year + 3) // 4 - (leap_year + 99) // 100
-        days += (leap_year + 399) // 400 - 80 + day + gregorian_days_in_month[month - 1]
-
-        # Update the Jalali year
-        jalali_year += 33 * (days // 12053)
-        days %= 12053
-        jalali_year += 4 * (days // 1461)
-        days %= 1461
-
-        # Correct for the leap year case
-        if days > 365:
-            jalali_year += (days - 1) // 365
-            days = (days - 1) % 365
-
-        # Determine the Jalali month and day
-        if days < 186:
-            jalali_month = 1 + days // 31
-            jalali_day = 1 + (days % 31)
-        else:
-            days -= 186
-            jalali_month = 7 + days // 30
-            jalali_day = 1 + (days % 30)
-
-        return cls(jalali_year, jalali_month, jalali_day)
+        return cls(*_gregorian_to_jalali(year, month, day))
 
     def to_gregorian(self) -> date:
         """
@@ -579,67 +1625,46 @@ class JalaliDate:
             >>> jdate.isoformat()
             '1398-03-17'
         """
-        iso = f"{self._year:04d}-{self._month:02d}-{self._day:02d}"
-
-        if self._locale == "fa":
-            iso = digits.en_to_fa(iso)
-
-        return iso
+        table = _DIGITS2[self._locale]
+        return f"{_format_year(self._year, self._locale)}-{table[self._month]}-{table[self._day]}"
 
     __str__ = isoformat
 
     def toordinal(self) -> int:
-        return self.to_gregorian().toordinal() - 226894
+        return _ymd_to_ordinal(self._year, self._month, self._day)
 
     @classmethod
     def fromordinal(cls, n: int):
-        return cls(date.fromordinal(n + 226894))
+        return cls(*_ordinal_to_ymd(n))
 
     @classmethod
     def fromisoformat(cls, date_string: str):
         """
         Construct a JalaliDate from an ISO 8601 formatted date string.
 
+        The digits may be ASCII, Persian or Arabic-Indic, and ``bytes``, ``bytearray`` and ``memoryview``
+        holding UTF-8 text are accepted as well.
+
         Args:
-            date_string (str): The date string in ISO 8601 format.
+            date_string (str | bytes | bytearray | memoryview): The date string in ISO 8601 format.
 
         Returns:
             JalaliDate: A JalaliDate object corresponding to the given date string.
 
         Raises:
-            TypeError: If the provided argument is not a string.
+            TypeError: If the provided argument is not a string or bytes-like.
             ValueError: If the provided string is not a valid ISO 8601 formatted date.
         """
-        if not isinstance(date_string, str):
-            raise TypeError("fromisoformat: argument must be str")
-
-        if len(date_string) not in (7, 8, 10):
+        string, mask = _iso_input(date_string)
+        if len(mask) != 10:
             raise ValueError(f"Invalid isoformat string: {date_string!r}")
 
         try:
-            return cls(*cls._parse_isoformat_date(digits.fa_to_en(date_string)))
-        except Exception:
-            raise ValueError(f"Invalid isoformat string: {date_string!r}")
-
-    @classmethod
-    def _parse_isoformat_date(cls, dtstr: str):
-        # It is assumed that this function will only be called with a
-        # string of length exactly 10, and (though this is not used) ASCII-only
-        assert len(dtstr) in (7, 8, 10)
-
-        year = int(dtstr[0:4])
-        if dtstr[4] != "-":
-            raise ValueError(f"Invalid date separator: {dtstr[4]}")
-
-        month = int(dtstr[5:7])
-        if dtstr[7] != "-":
-            raise ValueError("Invalid date separator")
-
-        day = int(dtstr[8:10])
-
-        cls._check_date_fields(year, month, day, "en")
+            year, month, day = _iso_date_fields(string, mask)
+        except ValueError:
+            raise ValueError(f"Invalid isoformat string: {date_string!r}") from None
 
-        return [year, month, day]
+        return cls._from_fields(year, month, day)
 
     def __hash__(self):
         if self._hashcode == -1:
@@ -751,7 +1776,7 @@ class JalaliDate:
         Returns:
             int: The week number of the year, starting from 1.
         """
-        o = JalaliDate(self._year, 1, 1).weekday()
+        o = (_ymd_to_ordinal(self._year, 1, 1) + 4) % 7
         days = self.days_before_month(self._month) + self._day + o
 
         week_no, r = divmod(days, 7)
@@ -770,6 +1795,32 @@ class JalaliDate:
         """
         return self.year, self.week_of_year(), self.isoweekday()
 
+    def to_words(self, weekday: bool = False) -> str:
+        """
+        Return the date in Persian words, as written in letters and contracts.
+
+        The day is an ordinal word and the year is spelled out, both from precomputed tables.
+
+        Args:
+            weekday (bool, optional): If True, start with the name of the weekday. Defaults to False.
+
+        Returns:
+            str: The date in words.
+
+        Example:
+            >>> from persiantools.jdatetime import JalaliDate
+            >>> JalaliDate(1367, 2, 14).to_words()
+            'چهاردهم اردیبهشت یک هزار و سیصد و شصت و هفت'
+
+            >>> JalaliDate(1367, 2, 14).to_words(weekday=True)
+            'چهارشنبه چهاردهم اردیبهشت یک هزار و سیصد و شصت و هفت'
+        """
+        words = f"{DAY_ORDINAL_WORDS_FA[self._day]} {MONTH_NAMES_FA[self._month]} {_year_words(self._year)}"
+        if weekday:
+            return f"{WEEKDAY_NAMES_FA[self.weekday()]} {words}"
+
+        return words
+
     def ctime(self) -> str:
         """
         Return a string representing the date and time in a locale’s appropriate format.
@@ -808,49 +1859,80 @@ class JalaliDate:
         if locale is None or locale not in ["fa", "en"]:
             locale = self._locale
 
-        month_names = MONTH_NAMES_EN if locale == "en" else MONTH_NAMES_FA
-        month_names_abbr = MONTH_NAMES_ABBR_EN if locale == "en" else MONTH_NAMES_ABBR_FA
-        day_names = WEEKDAY_NAMES_EN if locale == "en" else WEEKDAY_NAMES_FA
-        day_names_abbr = WEEKDAY_NAMES_ABBR_EN if locale == "en" else WEEKDAY_NAMES_ABBR_FA
-        am = "AM" if locale == "en" else "ق.ظ"
-
-        format_time = {
-            "%a": day_names_abbr[self.weekday()],
-            "%A": day_names[self.weekday()],
-            "%w": str(self.weekday()),
-            "%d": f"{self._day:02d}",
-            "%b": month_names_abbr[self._month],
-            "%B": month_names[self._month],
-            "%m": f"{self._month:02d}",
-            "%y": f"{self._year % 100:02d}",
-            "%Y": f"{self._year:04d}",
-            "%H": "00",
-            "%I": "00",
-            "%p": am,
-            "%M": "00",
-            "%S": "00",
-            "%f": "000000",
-            "%z": "",
-            "%Z": "",
-            "%j": f"{self.days_before_month(self._month) + self._day:03d}",
-            "%U": f"{self.week_of_year():02d}",
-            "%W": f"{self.week_of_year():02d}",
-            "%X": "00:00:00",
-            "%%": "%",
-        }
+        segments = _compile_strftime(fmt, type(self), locale)
+        if _format_cache is not None:
+            segments = _format_cache.render(self, fmt, locale, segments)
+            if segments.__class__ is str:
+                return segments
+
+        directives = self._STRFTIME_DIRECTIVES
+        result = "".join([directives[text](self, locale) if is_directive else text for text, is_directive in segments])
 
-        if "%c" in fmt:
-            fmt = utils.replace(fmt, {"%c": "%A %d %B %Y"})
+        return result
 
-        if "%x" in fmt:
-            fmt = utils.replace(fmt, {"%x": "%y/%m/%d"})
+    @staticmethod
+    def format_many(values, fmt=None, locale=None):
+        """
+        Format a sequence of dates with one format.
 
-        result = utils.replace(fmt, format_time)
+        This is equivalent to ``[v.strftime(fmt, locale) for v in values]``, but the format is compiled once
+        and the date part is rendered once per run of values on the same day. ``datetime.date`` and
+        ``datetime.datetime`` values are converted to JalaliDate and JalaliDateTime on the fly.
 
-        if locale == "fa":
-            result = digits.en_to_fa(result)
+        Args:
+            values (iterable): JalaliDate, JalaliDateTime, date or datetime instances.
+            fmt (str, optional): The strftime format. If None, ``isoformat()`` is used.
+            locale (str, optional): 'en' or 'fa'. If None, the locale of each value is used.
 
-        return result
+        Returns:
+            list: The formatted strings, in input order.
+
+        Example:
+            >>> from datetime import date
+            >>> JalaliDate.format_many([JalaliDate(1403, 1, 1), date(2024, 3, 21)], "%Y/%m/%d")
+            ['1403/01/01', '1403/01/02']
+        """
+        return list(_iter_formatted(values, fmt, locale))
+
+    @staticmethod
+    def write_formatted(values, fmt, fileobj, sep: str = "\n", locale=None) -> int:
+        """
+        Format a sequence of dates with one format and write them to a text file.
+
+        Each value is followed by ``sep``. The strings are written in chunks, see `format_many`.
+
+        Args:
+            values (iterable): JalaliDate, JalaliDateTime, date or datetime instances.
+            fmt (str): The strftime format. If None, ``isoformat()`` is used.
+            fileobj (io.TextIOBase): The text file to write to.
+            sep (str, optional): The string written after each value. Defaults to a newline.
+            locale (str, optional): 'en' or 'fa'. If None, the locale of each value is used.
+
+        Returns:
+            int: The number of values written.
+
+        Example:
+            >>> import io
+            >>> buffer = io.StringIO()
+            >>> JalaliDate.write_formatted([JalaliDate(1403, 1, 1)], "%Y/%m/%d", buffer)
+            1
+            >>> buffer.getvalue()
+            '1403/01/01\n'
+        """
+        count = 0
+        chunk = []
+        for text in _iter_formatted(values, fmt, locale):
+            chunk.append(text)
+            if len(chunk) == _WRITE_CHUNK:
+                fileobj.write(sep.join(chunk) + sep)
+                count += len(chunk)
+                chunk.clear()
+
+        if chunk:
+            fileobj.write(sep.join(chunk) + sep)
+            count += len(chunk)
+
+        return count
 
     def _compare(self, other):
         assert isinstance(other, JalaliDate)
@@ -941,17 +2023,16 @@ class JalaliDate:
         raise NotImplementedError
 
     @classmethod
-    def strptime(cls, data_string, fmt, locale="en"):
-        if locale not in ["en", "fa"]:
-            raise ValueError("locale must be 'en' or 'fa'")
-
-        if locale == "fa":
-            data_string = digits.fa_to_en(data_string)
+    @lru_cache(maxsize=256)
+    def _compile_strptime(cls, fmt: str, locale: str):
+        """
+        Compile a strptime format of the class once per (class, format, locale).
 
-        month_names_list = MONTH_NAMES_EN[1:] if locale == "en" else MONTH_NAMES_FA[1:]
-        month_names_abbr_list = MONTH_NAMES_ABBR_EN[1:] if locale == "en" else MONTH_NAMES_ABBR_FA[1:]
-        weekday_names_list = WEEKDAY_NAMES_EN if locale == "en" else WEEKDAY_NAMES_FA
-        weekday_names_abbr_list = WEEKDAY_NAMES_ABBR_EN if locale == "en" else WEEKDAY_NAMES_ABBR_FA
+        Returns the pattern, the format with its aliases expanded and the month numbers of
+        the abbreviated and the full month names.
+        """
+        month_names_list = _MONTH_NAMES[locale][1:]
+        month_names_abbr_list = _MONTH_NAMES_ABBR[locale][1:]
 
         directives_regex_pattern = {
             "%Y": r"(?P<Y>\d{4})",
@@ -960,8 +2041,8 @@ class JalaliDate:
             "%d": r"(?P<d>\d{1,2})",
             "%b": cls._seqToRE(month_names_abbr_list, "b"),
             "%B": cls._seqToRE(month_names_list, "B"),
-            "%a": cls._seqToRE(weekday_names_abbr_list, "a"),
-            "%A": cls._seqToRE(weekday_names_list, "A"),
+            "%a": cls._seqToRE(_WEEKDAY_NAMES_ABBR[locale], "a"),
+            "%A": cls._seqToRE(_WEEKDAY_NAMES[locale], "A"),
         }
 
         fmt = utils.replace(
@@ -972,76 +2053,36 @@ class JalaliDate:
             },
         )
 
-        data_string_regex = utils.replace(fmt, directives_regex_pattern)
-        full_pattern = f"^{data_string_regex}$"
-
-        match = re.match(full_pattern, data_string, re.IGNORECASE)
-        if not match:
-            match_strict = re.match(f"^{data_string_regex}$", data_string, re.IGNORECASE)
-            if not match_strict:
-                raise ValueError(f"Date string '{data_string}' does not match format '{fmt}'")
-            directives = match_strict.groupdict()
-        else:
-            directives = match.groupdict()
+        pattern = re.compile(f"^{utils.replace(fmt, directives_regex_pattern)}$", re.IGNORECASE)
+        return pattern, fmt, _name_numbers(month_names_abbr_list), _name_numbers(month_names_list)
 
-        parsed_components = {}
-        for k, v in directives.items():
-            if v is not None:
-                if k not in ["a", "A", "b", "B"] and v.isdigit():
-                    parsed_components[k] = int(v)
-                else:
-                    parsed_components[k] = v
-
-        year = parsed_components.get("Y")
-        yy = parsed_components.get("y")
-
-        if year is None and yy is not None:
-            if not (0 <= yy <= 99):
-                raise ValueError(f"Year without century (yy) '{yy}' out of range 00-99.")
-            # Heuristic: if yy > 70, assume 13yy, else 14yy.
-            year = (
-                (1300 + yy) if yy > (2070 - 2000) else (1400 + yy)
-            )  # Adjusted heuristic to be roughly 70 for 1300 century.
-            # Current Jalali year is around 140x. So values like 01, 02.. up to e.g. 70 => 14xx.
-            # values like 71, 72 .. 99 => 13xx.
-        elif year is None:
-            raise ValueError("Year information is missing from the date string or format.")
+    @classmethod
+    def strptime(cls, data_string, fmt, locale="en"):
+        if locale not in ["en", "fa"]:
+            raise ValueError("locale must be 'en' or 'fa'")
 
-        month = parsed_components.get("m")
-        if month is None:
-            month_name_abbr = parsed_components.get("b")
-            month_name_full = parsed_components.get("B")
+        scanner = cls._STRPTIME_SCANNERS.get(fmt) if isinstance(data_string, _TEXT_TYPES) else None
+        if scanner is not None:
+            fields = scanner(data_string)
+            if fields is not None:
+                return cls._from_fields(*fields, locale=locale)
 
-            found_month = False
-            if month_name_abbr is not None:
-                normalized_month_abbr = month_name_abbr.capitalize() if locale == "en" else month_name_abbr
-                try:
-                    month = month_names_abbr_list.index(normalized_month_abbr) + 1
-                    found_month = True
-                except ValueError:
-                    try:
-                        month = month_names_list.index(normalized_month_abbr) + 1
-                        found_month = True
-                    except ValueError:
-                        pass
-
-            if not found_month and month_name_full is not None:
-                normalized_month_full = month_name_full.capitalize() if locale == "en" else month_name_full
-                try:
-                    month = month_names_list.index(normalized_month_full) + 1
-                    found_month = True
-                except ValueError:
-                    pass
+        if isinstance(data_string, _BYTES_TYPES):
+            data_string = bytes(data_string).decode("utf-8")
 
-            if not found_month:
-                raise ValueError(
-                    f"Month name not recognized from '{month_name_abbr or month_name_full}' for locale '{locale}'."
-                )
+        pattern, fmt, month_abbr_numbers, month_numbers = cls._compile_strptime(fmt, locale)
 
-        day = parsed_components.get("d")
-        if day is None:
+        fields = _strptime_ymd(data_string, pattern, month_abbr_numbers, month_numbers, locale)
+        if fields == "format":
+            raise ValueError(f"Date string '{data_string}' does not match format '{fmt}'")
+        if fields == "year":
+            raise ValueError("Year information is missing from the date string or format.")
+        if fields == "month":
+            raise ValueError(f"Month name not recognized in '{data_string}' for locale '{locale}'.")
+        if fields == "day":
             raise ValueError("Day information is missing from the date string or format.")
 
+        year, month, day = fields
         cls._check_date_fields(year, month, day, locale)
 
         return cls(year, month, day, locale=locale)
@@ -1065,6 +2106,11 @@ _tzinfo_class = tzinfo
 class JalaliDateTime(JalaliDate):
     __slots__ = JalaliDate.__slots__ + ("_hour", "_minute", "_second", "_microsecond", "_tzinfo")
 
+    _STRFTIME_DIRECTIVES = _STRFTIME_DATETIME
+    _STRFTIME_ALIASES = {"c": "%A %d %B %Y %X", "x": "%y/%m/%d"}
+    _STRFTIME_TIME_DIRECTIVES = frozenset("HIpMSfzZX")
+    _STRPTIME_SCANNERS = _DATETIME_SCANNERS
+
     def __init__(
         self,
         year,
@@ -1124,6 +2170,48 @@ class JalaliDateTime(JalaliDate):
         self._microsecond = microsecond
         self._tzinfo = tzinfo
 
+    @classmethod
+    def _from_fields(
+        cls,
+        year: int,
+        month: int,
+        day: int,
+        hour: int = 0,
+        minute: int = 0,
+        second: int = 0,
+        microsecond: int = 0,
+        tzinfo=None,
+        locale: str = "en",
+    ):
+        """Build an instance from already validated fields, bypassing ``__init__``."""
+        self = object.__new__(cls)
+        self._year, self._month, self._day, self._locale = year, month, day, locale
+        self._hour, self._minute, self._second, self._microsecond = hour, minute, second, microsecond
+        self._tzinfo = tzinfo
+        self._hashcode = -1
+
+        return self
+
+    def _wall_seconds(self) -> int:
+        """Return the wall clock time as seconds since the epoch, ignoring tzinfo."""
+        return (self.toordinal() - _EPOCH_ORDINAL) * 86400 + self._hour * 3600 + self._minute * 60 + self._second
+
+    def _utcoffset_seconds(self, wall: int):
+        """Return the UTC offset in seconds at the given wall clock seconds, or None (see _offset_seconds)."""
+        tz = self._tzinfo
+        if isinstance(tz, TehranTZ):
+            return tz.local_offset_at(wall)
+
+        if isinstance(tz, timezone):
+            return _offset_seconds(tz.utcoffset(None))
+
+        # not self.utcoffset(), which rejects the offsets with seconds of ZoneInfo LMT periods
+        g = self.to_gregorian()
+        if g.tzinfo is None:
+            g = g.replace(tzinfo=tz)
+
+        return _offset_seconds(tz.utcoffset(g))
+
     @staticmethod
     def _check_time_fields(hour, minute, second, microsecond):
         if not isinstance(hour, int):
@@ -1275,275 +2363,488 @@ class JalaliDateTime(JalaliDate):
     @classmethod
     def fromisoformat(cls, date_string: str):
         """Construct a datetime from a string in one of the ISO 8601 formats."""
-        if not isinstance(date_string, str):
-            raise TypeError("fromisoformat: argument must be str")
-
-        if len(date_string) < 7:
-            raise ValueError(f"Invalid isoformat string: {date_string!r}")
-
-        # Split this at the separator
+        string, mask = _iso_input(date_string)
         try:
-            separator_location = cls._find_isoformat_datetime_separator(date_string)
-            dstr = date_string[0:separator_location]
-            tstr = date_string[(separator_location + 1) :]
-
-            date_components = cls._parse_isoformat_date(dstr)
+            year, month, day = _iso_date_fields(string, mask)
+            if len(mask) > 11:
+                # any character separates the date and the time
+                hour, minute, second, microsecond, tzi = _iso_time_fields(string, mask, 11)
+            else:
+                hour = minute = second = microsecond = 0
+                tzi = None
         except ValueError:
             raise ValueError(f"Invalid isoformat string: {date_string!r}") from None
 
-        if tstr:
-            try:
-                time_components = cls._parse_isoformat_time(tstr)
-            except ValueError:
-                raise ValueError(f"Invalid isoformat string: {date_string!r}") from None
-        else:
-            time_components = [0, 0, 0, 0, None]
+        if hour > 23 or minute > 59 or second > 59:
+            # let the constructor report the field that is out of range
+            return cls(year, month, day, hour, minute, second, microsecond, tzi)
 
-        return cls(*(date_components + time_components))
+        return cls._from_fields(year, month, day, hour, minute, second, microsecond, tzi)
+
+    @staticmethod
+    def _check_tzinfo_arg(tz):
+        if tz is not None and not isinstance(tz, tzinfo):
+            raise TypeError("tzinfo argument must be None or of a tzinfo subclass")
 
     @classmethod
-    def _find_isoformat_datetime_separator(cls, dtstr: str):
-        # See the comment in _datetimemodule.c:_find_isoformat_datetime_separator
-        len_dtstr = len(dtstr)
-        if len_dtstr == 7:
-            return 7
-
-        assert len_dtstr > 7
-        date_separator = "-"
-        week_indicator = "W"
-
-        if dtstr[4] == date_separator:
-            if dtstr[5] == week_indicator:
-                if len_dtstr < 8:
-                    raise ValueError("Invalid ISO string")
-                if len_dtstr > 8 and dtstr[8] == date_separator:
-                    if len_dtstr == 9:
-                        raise ValueError("Invalid ISO string")
-                    if len_dtstr > 10 and _is_ascii_digit(dtstr[10]):
-                        # This is as far as we need to resolve the ambiguity for
-                        # the moment - if we have YYYY-Www-##, the separator is
-                        # either a hyphen at 8 or a number at 10.
-                        #
-                        # We'll assume it's a hyphen at 8 because it's way more
-                        # likely that someone will use a hyphen as a separator than
-                        # a number, but at this point it's really best effort
-                        # because this is an extension of the spec anyway.
-                        # TODO(pganssle): Document this
-                        return 8
-                    return 10
-                else:
-                    # YYYY-Www (8)
-                    return 8
-            else:
-                # YYYY-MM-DD (10)
-                return 10
-        else:
-            if dtstr[4] == week_indicator:
-                # YYYYWww (7) or YYYYWwwd (8)
-                idx = 7
-                while idx < len_dtstr:
-                    if not _is_ascii_digit(dtstr[idx]):
-                        break
-                    idx += 1
-
-                if idx < 9:
-                    return idx
-
-                if idx % 2 == 0:
-                    # If the index of the last number is even, it's YYYYWwwd
-                    return 7
-                else:
-                    return 8
-            else:
-                # YYYYMMDD (8)
-                return 8
+    def combine(cls, jdate, time_v):
+        if not isinstance(jdate, JalaliDate):
+            raise TypeError("date argument must be a JalaliDate instance")
+
+        if not isinstance(time_v, _time):
+            raise TypeError("time argument must be a time instance")
+
+        return cls(
+            jdate.year,
+            jdate.month,
+            jdate.day,
+            time_v.hour,
+            time_v.minute,
+            time_v.second,
+            time_v.microsecond,
+            time_v.tzinfo,
+        )
+
+    def timestamp(self):
+        return self.to_gregorian().timestamp()
+
+    def utctimetuple(self):
+        "Return UTC time tuple compatible with time.gmtime()."
+        return self.to_gregorian().utctimetuple()
+
+    def astimezone(self, tz=None):
+        """
+        Convert the current JalaliDateTime to another timezone.
+
+        This method returns a new JalaliDateTime object representing the same
+        time instant in a different timezone. The returned object will have
+        its `tzinfo` attribute set to the new timezone.
+
+        Parameters:
+        tz (tzinfo, optional): The timezone to convert the JalaliDateTime to.
+                            If `None`, the method will use the system's local timezone.
+                            The `tz` parameter must be an instance of a subclass of `datetime.tzinfo`.
+
+        Returns:
+        JalaliDateTime: A new JalaliDateTime object with the same time instant in the specified timezone.
+
+        Raises:
+        TypeError: If the `tz` parameter is not `None` and is not an instance of a subclass of `datetime.tzinfo`.
+
+        Example:
+        >>> from datetime import timezone, timedelta
+        >>> jdt = JalaliDateTime(1400, 1, 1, 12, 30, 45, tzinfo=timezone(timedelta(hours=3)))
+        >>> jdt_utc = jdt.astimezone(timezone.utc)
+        >>> print(jdt_utc)
+        JalaliDateTime(1400, 1, 1, 9, 30, 45, tzinfo=datetime.timezone.utc)
+
+        >>> new_tz = timezone(timedelta(hours=5))
+        >>> jdt_new_tz = jdt.astimezone(new_tz)
+        >>> print(jdt_new_tz)
+        JalaliDateTime(1400, 1, 1, 17, 30, 45, tzinfo=datetime.timezone(datetime.timedelta(seconds=18000)))
+        """
+        self._check_tzinfo_arg(tz)
+
+        if tz is not None and tz is self._tzinfo:
+            return self
+
+        if tz is not None and self._tzinfo is not None:
+            wall = self._wall_seconds()
+            offset = self._utcoffset_seconds(wall)
+
+            if offset is not None:
+                target = _utcoffset_from_utc(tz, wall - offset)
+
+                if target is not None:
+                    return self._shift_wall(target - offset, tz)
+
+        # Local time zone, naive values and sub-second offsets are left to datetime
+        return JalaliDateTime(self.to_gregorian().astimezone(tz))
 
     @classmethod
-    def _parse_isoformat_time(cls, tstr: str):
-        # Format supported is HH[:MM[:SS[.fff[fff]]]][+HH:MM[:SS[.ffffff]]]
-        len_str = len(tstr)
-        if len_str < 2:
-            raise ValueError("Isoformat time too short")
+    def astimezone_many(cls, values, tz=None):
+        """
+        Convert a sequence of JalaliDateTime (or datetime) values to another timezone.
+
+        This is equivalent to ``[v.astimezone(tz) for v in values]``, but the target offset is
+        looked up once per offset period and the Jalali date once per day, instead of once per value.
 
-        # This is equivalent to re.search('[+-Z]', tstr), but faster
-        tz_pos = tstr.find("-") + 1 or tstr.find("+") + 1 or tstr.find("Z") + 1
-        timestr = tstr[: tz_pos - 1] if tz_pos > 0 else tstr
+        Parameters:
+        values (iterable): JalaliDateTime or datetime.datetime instances.
+        tz (tzinfo, optional): The target timezone. If `None`, the system's local timezone is used.
 
-        time_comps = cls._parse_hh_mm_ss_ff(timestr)
+        Returns:
+        list: The converted JalaliDateTime objects, in input order.
 
-        tzi = None
-        if tz_pos == len_str and tstr[-1] == "Z":
-            tzi = timezone.utc
-        elif tz_pos > 0:
-            tzstr = tstr[tz_pos:]
+        Example:
+        >>> from persiantools.tz import TehranTZ
+        >>> JalaliDateTime.astimezone_many([JalaliDateTime(1403, 1, 1, tzinfo=timezone.utc)], TehranTZ())
+        [JalaliDateTime(1403, 1, 1, 3, 30, tzinfo=TehranTZ())]
+        """
+        return list(cls.iter_astimezone(values, tz))
+
+    @classmethod
+    def iter_astimezone(cls, values, tz=None):
+        """
+        Lazily convert JalaliDateTime (or datetime) values to another timezone.
 
-            # Valid time zone strings are:
-            # HH                  len: 2
-            # HHMM                len: 4
-            # HH:MM               len: 5
-            # HHMMSS              len: 6
-            # HHMMSS.f+           len: 7+
-            # HH:MM:SS            len: 8
-            # HH:MM:SS.f+         len: 10+
+        This is the generator variant of `astimezone_many`, suitable for streams that do not fit in memory.
 
-            if len(tzstr) in (0, 1, 3):
-                raise ValueError("Malformed time zone string")
+        Parameters:
+        values (iterable): JalaliDateTime or datetime.datetime instances.
+        tz (tzinfo, optional): The target timezone. If `None`, the system's local timezone is used.
+
+        Yields:
+        JalaliDateTime: The converted values, in input order.
+        """
+        cls._check_tzinfo_arg(tz)
 
-            tz_comps = cls._parse_hh_mm_ss_ff(tzstr)
+        offsets = _OffsetCache(tz)
+        last_ordinal = last_ymd = None
 
-            if all(x == 0 for x in tz_comps):
-                tzi = timezone.utc
-            else:
-                tzsign = -1 if tstr[tz_pos - 1] == "-" else 1
+        for value in values:
+            if not isinstance(value, JalaliDateTime):
+                value = JalaliDateTime(value)
 
-                td = timedelta(hours=tz_comps[0], minutes=tz_comps[1], seconds=tz_comps[2], microseconds=tz_comps[3])
+            if tz is None or value._tzinfo is None or value._tzinfo is tz:
+                yield value.astimezone(tz)
+                continue
 
-                tzi = timezone(tzsign * td)
+            wall = value._wall_seconds()
+            offset = value._utcoffset_seconds(wall)
+            target = None if offset is None else offsets.offset_at(wall - offset)
 
-        time_comps.append(tzi)
+            if target is None:
+                yield value.astimezone(tz)
+                continue
 
-        return time_comps
+            ordinal, seconds = divmod(wall - offset + target, 86400)
+            if ordinal != last_ordinal:
+                last_ymd = _ordinal_to_ymd(ordinal + _EPOCH_ORDINAL)
+                last_ordinal = ordinal
+
+                if not MINYEAR <= last_ymd[0] <= MAXYEAR:
+                    raise OverflowError("result out of range")
+
+            hour, seconds = divmod(seconds, 3600)
+            minute, second = divmod(seconds, 60)
+
+            yield JalaliDateTime._from_fields(*last_ymd, hour, minute, second, value._microsecond, tz, value._locale)
 
     @classmethod
-    def _parse_hh_mm_ss_ff(cls, tstr: str):
-        # Parses things of the form HH[:?MM[:?SS[{.,}fff[fff]]]]
-        len_str = len(tstr)
+    def _from_wall(cls, wall: int, tz=None, locale="en"):
+        """Build a JalaliDateTime from wall clock seconds since the epoch."""
+        days, seconds = divmod(wall, 86400)
+        year, month, day = _ordinal_to_ymd(days + _EPOCH_ORDINAL)
 
-        time_comps = [0, 0, 0, 0]
-        pos = 0
-        for comp in range(0, 3):
-            if (len_str - pos) < 2:
-                raise ValueError("Incomplete time component")
+        if not MINYEAR <= year <= MAXYEAR:
+            raise OverflowError("result out of range")
 
-            time_comps[comp] = int(tstr[pos : pos + 2])
+        hour, seconds = divmod(seconds, 3600)
+        minute, second = divmod(seconds, 60)
 
-            pos += 2
-            next_char = tstr[pos : pos + 1]
+        return JalaliDateTime._from_fields(year, month, day, hour, minute, second, 0, tz, locale)
 
-            if comp == 0:
-                has_sep = next_char == ":"
+    def _period_boundary(self, wall: int, epoch: bool):
+        """Resolve a period boundary given as wall clock seconds in this value's timezone."""
+        tz = self._tzinfo
+        if tz is None:
+            result = self._from_wall(wall, None, self._locale)
+            return int(result.timestamp()) if epoch else result
 
-            if not next_char or comp >= 2:
-                break
+        offset = _utcoffset_at_wall(tz, wall)
+        if offset is None:
+            raise ValueError("UTC offsets with a sub-second component are not supported")
 
-            if has_sep and next_char != ":":
-                raise ValueError("Invalid time separator: %c" % next_char)
+        seconds = wall - offset
+        if epoch:
+            return seconds
 
-            pos += has_sep
+        return self._from_wall(seconds + _utcoffset_from_utc(tz, seconds), tz, self._locale)
 
-        if pos < len_str:
-            if tstr[pos] not in ".,":
-                raise ValueError("Invalid microsecond component")
-            else:
-                pos += 1
+    def floor(self, unit: str, epoch: bool = False):
+        """
+        Return the start of the Jalali calendar period that contains this datetime.
 
-                len_remainder = len_str - pos
+        Periods are taken in the local (wall clock) calendar of the datetime; weeks start on Shanbeh and
+        quarters on Farvardin, Tir, Mehr and Dey. For aware values the start is resolved in the datetime's
+        timezone, so a skipped local midnight maps to the first instant of the day.
 
-                if len_remainder >= 6:
-                    to_parse = 6
-                else:
-                    to_parse = len_remainder
+        Parameters:
+        unit (str): One of "minute", "hour", "day", "week", "month", "quarter" or "year".
+        epoch (bool, optional): If True, return POSIX seconds instead of a JalaliDateTime. Naive values are
+            taken as local time, as in `timestamp()`. Default is False.
 
-                time_comps[3] = int(tstr[pos : (pos + to_parse)])
-                if to_parse < 6:
-                    time_comps[3] *= _FRACTION_CORRECTION[to_parse - 1]
-                if len_remainder > to_parse and not all(map(_is_ascii_digit, tstr[(pos + to_parse) :])):
-                    raise ValueError("Non-digit values in unparsed fraction")
+        Returns:
+        JalaliDateTime or int: The start of the period.
 
-        return time_comps
+        Raises:
+        ValueError: If the unit is not supported.
 
-    @staticmethod
-    def _check_tzinfo_arg(tz):
-        if tz is not None and not isinstance(tz, tzinfo):
-            raise TypeError("tzinfo argument must be None or of a tzinfo subclass")
+        Example:
+        >>> JalaliDateTime(1403, 5, 17, 14, 30).floor("quarter")
+        JalaliDateTime(1403, 4, 1, 0, 0)
+        """
+        _check_period_unit(unit)
+
+        return self._period_boundary(_period_wall(self._wall_seconds(), unit)[0], epoch)
+
+    def ceil(self, unit: str, epoch: bool = False):
+        """
+        Return the first period boundary at or after this datetime.
+
+        A datetime that is already at the start of a period is returned as is (see `floor`).
+
+        Parameters:
+        unit (str): One of "minute", "hour", "day", "week", "month", "quarter" or "year".
+        epoch (bool, optional): If True, return POSIX seconds instead of a JalaliDateTime. Default is False.
+
+        Returns:
+        JalaliDateTime or int: The start of the next period, or of the current one if on its boundary.
+
+        Example:
+        >>> JalaliDateTime(1403, 5, 17, 14, 30).ceil("month")
+        JalaliDateTime(1403, 6, 1, 0, 0)
+        """
+        _check_period_unit(unit)
+
+        wall = self._wall_seconds()
+        start, end = _period_wall(wall, unit)
+
+        return self._period_boundary(start if wall == start and not self._microsecond else end, epoch)
+
+    def period_bounds(self, unit: str, epoch: bool = False):
+        """
+        Return the start and the (exclusive) end of the period that contains this datetime.
+
+        Parameters:
+        unit (str): One of "minute", "hour", "day", "week", "month", "quarter" or "year".
+        epoch (bool, optional): If True, return POSIX seconds instead of JalaliDateTime objects. Default is False.
+
+        Returns:
+        tuple: ``(start, end)``, see `floor`.
+
+        Example:
+        >>> JalaliDateTime(1403, 12, 10, 8).period_bounds("year")
+        (JalaliDateTime(1403, 1, 1, 0, 0), JalaliDateTime(1404, 1, 1, 0, 0))
+        """
+        _check_period_unit(unit)
+
+        start, end = _period_wall(self._wall_seconds(), unit)
+
+        return self._period_boundary(start, epoch), self._period_boundary(end, epoch)
 
     @classmethod
-    def combine(cls, jdate, time_v):
-        if not isinstance(jdate, JalaliDate):
-            raise TypeError("date argument must be a JalaliDate instance")
+    def _iter_period_bounds(cls, timestamps, unit: str, tz):
+        _check_period_unit(unit)
+        cls._check_tzinfo_arg(tz)
 
-        if not isinstance(time_v, _time):
-            raise TypeError("time argument must be a time instance")
+        offsets = _OffsetCache(tz)
+        start = end = 0
 
-        return cls(
-            jdate.year,
-            jdate.month,
-            jdate.day,
-            time_v.hour,
-            time_v.minute,
-            time_v.second,
-            time_v.microsecond,
-            time_v.tzinfo,
-        )
+        for timestamp in timestamps:
+            if not start <= timestamp < end:
+                seconds = int(timestamp // 1)
+                offset = offsets.offset_at(seconds)
+                if offset is None:
+                    raise ValueError("UTC offsets with a sub-second component are not supported")
+
+                wall_start, wall_end = _period_wall(seconds + offset, unit)
+                start = wall_start - _utcoffset_at_wall(tz, wall_start)
+                end = wall_end - _utcoffset_at_wall(tz, wall_end)
+
+            yield timestamp, start, end
+
+    @classmethod
+    def floor_many(cls, timestamps, unit: str, tz=None):
+        """
+        Floor a sequence of POSIX timestamps to Jalali calendar periods.
+
+        Consecutive timestamps that fall in the same period reuse its bounds, so a sorted (or clustered)
+        column costs about one calendar computation per period.
+
+        Parameters:
+        timestamps (iterable): POSIX timestamps (int or float).
+        unit (str): One of "minute", "hour", "day", "week", "month", "quarter" or "year".
+        tz (tzinfo, optional): The timezone whose calendar defines the periods. If None, the system's
+            local time is used.
+
+        Returns:
+        list: The period starts as POSIX seconds.
+
+        Example:
+        >>> from persiantools.tz import TehranTZ
+        >>> JalaliDateTime.floor_many([1700000000, 1700003600], "day", TehranTZ())
+        [1699993800, 1699993800]
+        """
+        return [start for _, start, _ in cls._iter_period_bounds(timestamps, unit, tz)]
+
+    @classmethod
+    def ceil_many(cls, timestamps, unit: str, tz=None):
+        """
+        Round a sequence of POSIX timestamps up to Jalali calendar period boundaries.
+
+        See `floor_many` for the parameters.
+
+        Returns:
+        list: The first period boundary at or after each timestamp, as POSIX seconds.
+        """
+        return [
+            start if timestamp == start else end
+            for timestamp, start, end in cls._iter_period_bounds(timestamps, unit, tz)
+        ]
+
+    @classmethod
+    def period_bounds_many(cls, timestamps, unit: str, tz=None):
+        """
+        Return the Jalali calendar period of each POSIX timestamp in a sequence.
+
+        See `floor_many` for the parameters.
+
+        Returns:
+        list: ``(start, end)`` tuples of POSIX seconds.
+        """
+        return [(start, end) for _, start, end in cls._iter_period_bounds(timestamps, unit, tz)]
+
+    def _instant_seconds(self):
+        """Return the POSIX timestamp in whole seconds if aware, otherwise the wall clock seconds."""
+        wall = self._wall_seconds()
+        if self._tzinfo is None:
+            return wall, False
+
+        offset = self._utcoffset_seconds(wall)
+        if offset is None:
+            return int(self.timestamp() // 1), True
 
-    def timestamp(self):
-        return self.to_gregorian().timestamp()
+        return wall - offset, True
 
-    def utctimetuple(self):
-        "Return UTC time tuple compatible with time.gmtime()."
-        return self.to_gregorian().utctimetuple()
+    @classmethod
+    def _humanize_reference(cls, reference, aware: bool) -> int:
+        if reference is None:
+            return int(time.time()) if aware else JalaliDateTime.now()._wall_seconds()
 
-    def astimezone(self, tz=None):
-        """
-        Convert the current JalaliDateTime to another timezone.
+        if isinstance(reference, dt):
+            reference = JalaliDateTime.to_jalali(reference)
+        elif not isinstance(reference, JalaliDateTime):
+            raise TypeError(f"reference must be a JalaliDateTime or datetime, not {type(reference).__name__}")
 
-        This method returns a new JalaliDateTime object representing the same
-        time instant in a different timezone. The returned object will have
-        its `tzinfo` attribute set to the new timezone.
+        seconds, reference_aware = reference._instant_seconds()
+        if reference_aware != aware:
+            raise TypeError("cannot mix naive and timezone-aware time")
+
+        return seconds
+
+    def humanize(self, reference=None, locale: str = "fa") -> str:
+        """
+        Return the time relative to ``reference`` in words, like "3 minutes ago" or "دیروز".
 
         Parameters:
-        tz (tzinfo, optional): The timezone to convert the JalaliDateTime to.
-                            If `None`, the method will use the system's local timezone.
-                            The `tz` parameter must be an instance of a subclass of `datetime.tzinfo`.
+        reference (JalaliDateTime or datetime, optional): The instant to compare with. Defaults to now,
+                                                          local time for naive values.
+        locale (str, optional): 'fa' (default) or 'en'.
 
         Returns:
-        JalaliDateTime: A new JalaliDateTime object with the same time instant in the specified timezone.
+        str: The relative time.
 
         Raises:
-        TypeError: If the `tz` parameter is not `None` and is not an instance of a subclass of `datetime.tzinfo`.
+        TypeError: If one of the value and the reference is naive and the other is aware.
 
         Example:
-        >>> from datetime import timezone, timedelta
-        >>> jdt = JalaliDateTime(1400, 1, 1, 12, 30, 45, tzinfo=timezone(timedelta(hours=3)))
-        >>> jdt_utc = jdt.astimezone(timezone.utc)
-        >>> print(jdt_utc)
-        JalaliDateTime(1400, 1, 1, 9, 30, 45, tzinfo=datetime.timezone.utc)
+        >>> reference = JalaliDateTime(1403, 1, 1, 12, 0)
+        >>> JalaliDateTime(1403, 1, 1, 11, 57).humanize(reference)
+        '۳ دقیقه پیش'
+        >>> JalaliDateTime(1402, 12, 29, 10, 0).humanize(reference, locale="en")
+        'yesterday'
+        """
+        return self.humanize_many([self], reference, locale)[0]
 
-        >>> new_tz = timezone(timedelta(hours=5))
-        >>> jdt_new_tz = jdt.astimezone(new_tz)
-        >>> print(jdt_new_tz)
-        JalaliDateTime(1400, 1, 1, 17, 30, 45, tzinfo=datetime.timezone(datetime.timedelta(seconds=18000)))
+    @classmethod
+    def humanize_many(cls, values, reference=None, locale: str = "fa"):
         """
-        return JalaliDateTime(self.to_gregorian().astimezone(tz))
+        Humanize a sequence of JalaliDateTime (or datetime) values against one reference.
 
-    def ctime(self):
-        month_names = MONTH_NAMES_EN if self.locale == "en" else MONTH_NAMES_FA
-        day_names = WEEKDAY_NAMES_EN if self.locale == "en" else WEEKDAY_NAMES_FA
-
-        c = "%s %02d %s %d %02d:%02d:%02d" % (
-            day_names[self.weekday()],
-            self.day,
-            month_names[self.month],
-            self.year,
-            self.hour,
-            self.minute,
-            self.second,
-        )
+        The reference is computed once, and the labels are rendered once per unit and count.
+
+        Parameters:
+        values (iterable): JalaliDateTime or datetime.datetime instances, either all naive or all aware.
+        reference (JalaliDateTime or datetime, optional): The instant to compare with. Defaults to now.
+        locale (str, optional): 'fa' (default) or 'en'.
+
+        Returns:
+        list: The relative times, in input order.
+        """
+        if locale not in ("en", "fa"):
+            raise ValueError("locale must be 'en' or 'fa'")
+
+        labels = []
+        references = {}
+        for value in values:
+            if isinstance(value, dt):
+                value = JalaliDateTime.to_jalali(value)
+
+            seconds, aware = value._instant_seconds()
+            try:
+                base = references[aware]
+            except KeyError:
+                base = references[aware] = cls._humanize_reference(reference, aware)
+
+            elapsed = base - seconds
+            unit, count = _humanize_bucket(elapsed)
+            if unit == "day" or (unit == "hour" and abs(elapsed) >= 12 * 3600):
+                # days are counted between the calendar dates in the value's time zone
+                wall = value._wall_seconds()
+                days = (wall + elapsed) // 86400 - wall // 86400
+                if days == 1 or days == -1 or (unit == "day" and days):
+                    unit, count = "day", days
+                elif unit == "day":
+                    # 22 to 24 hours apart within one day
+                    hours = (abs(elapsed) + 1800) // 3600
+                    unit, count = "hour", hours if elapsed >= 0 else -hours
+
+            labels.append(_humanize_label(unit, count, locale))
+
+        return labels
+
+    def _shift_wall(self, seconds: int, tz):
+        """Return a copy moved by ``seconds`` of wall clock time and attached to ``tz``."""
+        seconds += self._hour * 3600 + self._minute * 60 + self._second
+
+        if 0 <= seconds < 86400:
+            # Same day: only the time fields change
+            year, month, day = self._year, self._month, self._day
+        else:
+            days, seconds = divmod(seconds, 86400)
+            year, month, day = _ordinal_to_ymd(self.toordinal() + days)
+
+            if not MINYEAR <= year <= MAXYEAR:
+                raise OverflowError("result out of range")
 
-        if self.locale == "fa":
-            c = digits.en_to_fa(c)
+        hour, seconds = divmod(seconds, 3600)
+        minute, second = divmod(seconds, 60)
 
-        return c
+        return JalaliDateTime._from_fields(year, month, day, hour, minute, second, self._microsecond, tz, self._locale)
+
+    def ctime(self):
+        locale = self._locale
+        year = _format_year(self._year, locale) if self._year >= 1000 else _localize_digits(str(self._year), locale)
+
+        return "%s %s %s %s %s" % (
+            _WEEKDAY_NAMES[locale][self.weekday()],
+            _DIGITS2[locale][self._day],
+            _MONTH_NAMES[locale][self._month],
+            year,
+            _format_time(self._hour, self._minute, self._second, locale),
+        )
 
     def isoformat(self, sep="T") -> str:
         s = "%04d-%02d-%02d%c%02d:%02d:%02d" % (
-            self.year,
-            self.month,
-            self.day,
+            self._year,
+            self._month,
+            self._day,
             sep,
-            self.hour,
-            self.minute,
-            self.second,
+            self._hour,
+            self._minute,
+            self._second,
         )
 
         if self.microsecond:
@@ -1729,17 +3030,16 @@ class JalaliDateTime(JalaliDate):
         )
 
     @classmethod
-    def strptime(cls, data_string, fmt, locale="en"):
-        if locale not in ["en", "fa"]:
-            raise ValueError("locale must be 'en' or 'fa'")
-
-        if locale == "fa":
-            data_string = digits.fa_to_en(data_string)
+    @lru_cache(maxsize=256)
+    def _compile_strptime(cls, fmt: str, locale: str):
+        """
+        Compile a strptime format of the class once per (class, format, locale).
 
-        month_names = MONTH_NAMES_EN[1:] if locale == "en" else MONTH_NAMES_FA[1:]
-        month_names_abbr = MONTH_NAMES_ABBR_EN[1:] if locale == "en" else MONTH_NAMES_ABBR_FA[1:]
-        weekday_names = WEEKDAY_NAMES_EN if locale == "en" else WEEKDAY_NAMES_FA
-        weekday_names_abbr = WEEKDAY_NAMES_ABBR_EN if locale == "en" else WEEKDAY_NAMES_ABBR_FA
+        Returns the pattern, the month numbers of the abbreviated and the full month names and
+        the names of the periods of %p.
+        """
+        month_names = _MONTH_NAMES[locale][1:]
+        month_names_abbr = _MONTH_NAMES_ABBR[locale][1:]
         periods = ["AM", "PM"] if locale == "en" else ["ق.ظ", "ب.ظ"]
 
         """
@@ -1751,8 +3051,8 @@ class JalaliDateTime(JalaliDate):
             "%Y": r"(?P<Y>\d{4})",
             "%m": r"(?P<m>1[0-2]|0[1-9]|[1-9])",
             "%d": r"(?P<d>3[0-1]|[1-2]\d|0[1-9]|[1-9]| [1-9])",
-            "%a": cls._seqToRE(weekday_names_abbr, "a"),
-            "%A": cls._seqToRE(weekday_names, "A"),
+            "%a": cls._seqToRE(_WEEKDAY_NAMES_ABBR[locale], "a"),
+            "%A": cls._seqToRE(_WEEKDAY_NAMES[locale], "A"),
             "%b": cls._seqToRE(month_names_abbr, "b"),
             "%B": cls._seqToRE(month_names, "B"),
             "%H": r"(?P<H>2[0-3]|[0-1]\d|\d)",
@@ -1779,11 +3079,31 @@ class JalaliDateTime(JalaliDate):
             },
         )
 
-        data_string_regex = utils.replace(fmt, directives_regex_pattern)
-        full_pattern = f"^{data_string_regex}$"
+        pattern = re.compile(f"^{utils.replace(fmt, directives_regex_pattern)}$", re.IGNORECASE)
+        return pattern, _name_numbers(month_names_abbr), _name_numbers(month_names), periods
+
+    @classmethod
+    def strptime(cls, data_string, fmt, locale="en"):
+        if locale not in ["en", "fa"]:
+            raise ValueError("locale must be 'en' or 'fa'")
+
+        scanner = cls._STRPTIME_SCANNERS.get(fmt) if isinstance(data_string, _TEXT_TYPES) else None
+        if scanner is not None:
+            fields = scanner(data_string)
+            if fields is not None:
+                return cls._from_fields(*fields, locale=locale)
+
+        if isinstance(data_string, _BYTES_TYPES):
+            data_string = bytes(data_string).decode("utf-8")
 
-        if re.match(full_pattern, data_string, re.IGNORECASE):
-            directives = re.search(data_string_regex, data_string, re.IGNORECASE).groupdict()
+        if locale == "fa":
+            data_string = digits.fa_to_en(data_string)
+
+        pattern, month_abbr_numbers, month_numbers, periods = cls._compile_strptime(fmt, locale)
+
+        match = pattern.match(data_string)
+        if match:
+            directives = match.groupdict()
 
             if "Y" in directives.keys() and len(directives.get("Y")) < 4:
                 raise ValueError("Year element must contain exactly 4 digits")
@@ -1795,7 +3115,10 @@ class JalaliDateTime(JalaliDate):
                 name, is_abbr = (
                     (directives.pop("b"), True) if "b" in directives.keys() else (directives.pop("B"), False)
                 )
-                directives["m"] = (month_names_abbr.index(name) if is_abbr else month_names.index(name)) + 1
+                try:
+                    directives["m"] = month_abbr_numbers[name] if is_abbr else month_numbers[name]
+                except KeyError:
+                    raise ValueError(f"{name!r} is not in list") from None
 
             # extraction of hour from periodic time format
             if "p" in directives.keys():
@@ -1807,19 +3130,11 @@ class JalaliDateTime(JalaliDate):
             # extraction of timezone information if provided
             tz = None
             if "z" in directives.keys():
-                sign = 1 if directives["z"][0] == "+" else -1
-                delta = timedelta(
-                    hours=sign * directives["zH"],
-                    minutes=sign * directives["zM"],
-                    seconds=sign * directives.get("zS", 0),
-                    microseconds=sign * directives.get("zf", 0),
-                )
-                tz = timezone(delta)
+                tz = _strptime_offset(directives["z"][0], *match.group("zH", "zM", "zS", "zf"))
             elif "Z" in directives.keys():
-                try:
-                    tz = ZoneInfo(directives.get("Z"))
-                except Exception:
-                    raise ValueError(f"Unknown time zone name: {directives.get('Z')}")
+                tz = _zone_info(directives["Z"])
+                if tz is None:
+                    raise ValueError(f"Unknown time zone name: {directives['Z']}")
 
             cls_attrs = {
                 "year": directives.get("Y", 1),
@@ -1867,33 +3182,6 @@ class JalaliDateTime(JalaliDate):
     def __str__(self):
         return self.isoformat(sep=" ")
 
-    def strftime(self, fmt: str, locale=None) -> str:
-        if locale is None or locale not in ["fa", "en"]:
-            locale = self._locale
-
-        datetime = self.to_gregorian()
-
-        format_time = {
-            "%H": "%02d" % self._hour,
-            "%I": "%02d" % (self._hour if self._hour <= 12 else self._hour - 12),
-            "%p": "AM" if self._hour < 12 else "PM",
-            "%M": "%02d" % self._minute,
-            "%S": "%02d" % self._second,
-            "%f": "%06d" % self._microsecond,
-            "%z": datetime.strftime("%z"),
-            "%Z": ("" if not self._tzinfo else self._tzinfo.tzname(datetime)),
-            "%X": "%02d:%02d:%02d" % (self._hour, self._minute, self._second),
-        }
-
-        if "%c" in fmt:
-            fmt = utils.replace(fmt, {"%c": "%A %d %B %Y %X"})
-
-        result = utils.replace(fmt, format_time)
-
-        result = super().strftime(result, locale)
-
-        return result
-
     def __base_compare(self, other):
         assert isinstance(other, JalaliDateTime)
 
@@ -2147,3 +3435,801 @@ class JalaliDateTime(JalaliDate):
 
     def __reduce__(self):
         return self.__class__, self.__getstate__()
+
+
+class JalaliClock:
+    """
+    A clock for stamping the current Jalali date and time at a high rate.
+
+    The Jalali date of the current local day and the UTC instant of its midnight are cached, so a call
+    only reads ``time.time()`` and derives the time of day from it; the calendar fields are recomputed
+    when the day (or the UTC offset) changes.
+
+    Attributes:
+        tz (tzinfo): The timezone of the stamps, or None for naive local time.
+        resolution (float): Stamps are truncated to multiples of this many seconds, or None for
+            microsecond precision. Calls that fall in the same step reuse the computed fields, but each
+            call returns its own instance, so that changing the ``locale`` of one stamp leaves the others
+            alone.
+
+    Example:
+        >>> from persiantools.tz import TehranTZ
+        >>> clock = JalaliClock(TehranTZ(), resolution=1)
+        >>> clock.now()
+        JalaliDateTime(1404, 3, 16, 2, 17, 14, tzinfo=TehranTZ())
+        >>> clock.today()
+        JalaliDate(1404, 3, 16, Jomeh)
+    """
+
+    __slots__ = (
+        "_tz",
+        "_resolution",
+        "_time_func",
+        "_locale",
+        "_offsets",
+        "_start",
+        "_end",
+        "_midnight",
+        "_ymd",
+        "_last_stamp",
+        "_last",
+    )
+
+    def __init__(self, tz=None, resolution=None, locale="en", time_func=time.time):
+        """
+        Initialize a JalaliClock.
+
+        Args:
+            tz (tzinfo, optional): The timezone of the stamps. If None, naive local time is used, as in
+                `JalaliDateTime.now()`.
+            resolution (float, optional): The step, in seconds, to which stamps are truncated. Default is None.
+            locale (str, optional): The locale of the returned objects, 'en' or 'fa'. Default is 'en'.
+            time_func (callable, optional): Returns the current time in seconds since the epoch.
+                Default is `time.time`.
+
+        Raises:
+            TypeError: If `tz` is not None and not a tzinfo instance.
+            ValueError: If `resolution` is not positive or the locale is not 'en' or 'fa'.
+        """
+        JalaliDateTime._check_tzinfo_arg(tz)
+
+        if resolution is not None and not resolution > 0:
+            raise ValueError("resolution must be positive")
+
+        if locale not in ("en", "fa"):
+            raise ValueError("locale must be 'en' or 'fa'")
+
+        self._tz = tz
+        self._resolution = resolution
+        self._time_func = time_func
+        self._locale = locale
+        self._offsets = _OffsetCache(tz)
+        self._start = self._end = self._midnight = 0
+        self._ymd = None
+        self._last_stamp = self._last = None
+
+    @property
+    def tz(self):
+        """
+        Get the timezone of the stamps.
+
+        Returns:
+            tzinfo: The timezone, or None for naive local time.
+        """
+        return self._tz
+
+    @property
+    def resolution(self):
+        """
+        Get the step to which stamps are truncated.
+
+        Returns:
+            float: The resolution in seconds, or None for microsecond precision.
+        """
+        return self._resolution
+
+    def _read(self):
+        """Return the current time as ``(seconds, microseconds)``, refreshing the cached day if needed."""
+        t = self._time_func()
+        if self._resolution is not None:
+            t -= t % self._resolution
+
+        seconds = int(t // 1)
+        microsecond = round((t - seconds) * 1_000_000)
+        if microsecond >= 1_000_000:
+            seconds += 1
+            microsecond -= 1_000_000
+
+        if not self._start <= seconds < self._end:
+            self._refresh(seconds)
+
+        return seconds, microsecond
+
+    def _refresh(self, seconds: int):
+        offset, start, end = self._offsets.period_at(seconds)
+        if offset is None:
+            raise ValueError("UTC offsets with a sub-second component are not supported")
+
+        ordinal, seconds_of_day = divmod(seconds + offset, 86400)
+
+        self._midnight = seconds - seconds_of_day
+        self._start = max(self._midnight, start)
+        self._end = min(self._midnight + 86400, end)
+        self._ymd = _ordinal_to_ymd(ordinal + _EPOCH_ORDINAL)
+
+    def timestamp(self) -> float:
+        """
+        Return the current time in seconds since the epoch, truncated to the clock resolution.
+
+        Returns:
+            float: The current POSIX timestamp.
+        """
+        seconds, microsecond = self._read()
+        return seconds + microsecond / 1_000_000
+
+    def today(self) -> JalaliDate:
+        """
+        Return the current Jalali date in the clock's timezone.
+
+        Returns:
+            JalaliDate: Today's date.
+        """
+        self._read()
+        return JalaliDate._from_fields(*self._ymd, self._locale)
+
+    def now(self) -> JalaliDateTime:
+        """
+        Return the current Jalali date and time in the clock's timezone.
+
+        Returns:
+            JalaliDateTime: The current date and time, aware when the clock has a timezone.
+        """
+        stamp = self._read()
+        if stamp != self._last_stamp:
+            hour, rem = divmod(stamp[0] - self._midnight, 3600)
+            minute, second = divmod(rem, 60)
+
+            self._last_stamp = stamp
+            self._last = (*self._ymd, hour, minute, second, stamp[1], self._tz, self._locale)
+
+        return JalaliDateTime._from_fields(*self._last)
+
+
+# Candidate formats of infer_format, in order of preference between equal scores
+INFER_FORMATS = (
+    "%Y/%m/%d",
+    "%Y-%m-%d",
+    "%Y%m%d",
+    "%Y.%m.%d",
+    "%d/%m/%Y",
+    "%d-%m-%Y",
+    "%d.%m.%Y",
+    "%y/%m/%d",
+    "%d %B %Y",
+    "%d %b %Y",
+    "%A %d %B %Y",
+    "%a %d %b %Y",
+    "%Y/%m/%d %H:%M",
+    "%Y-%m-%d %H:%M",
+    "%Y/%m/%d %H:%M:%S",
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%dT%H:%M:%S",
+)
+
+_NAME_DIRECTIVES = ("%a", "%A", "%b", "%B", "%c", "%p")
+_TIME_DIRECTIVES = ("%H", "%I", "%M", "%S", "%f", "%p", "%X", "%z", "%Z")
+
+_DIGIT_SCRIPTS = {digit: script for script, chars in _DIGITS.items() for digit in chars}
+_DIGIT_SCRIPTS.update(dict.fromkeys("٠١٢٣٤٥٦٧٨٩", "ar"))
+
+
+def _format_candidates(fmt: str):
+    """Return the ``(strptime, locale)`` pairs to try for ``fmt``; only names depend on the locale."""
+    parse = JalaliDateTime.strptime if any(d in fmt for d in _TIME_DIRECTIVES) else JalaliDate.strptime
+    if any(d in fmt for d in _NAME_DIRECTIVES):
+        return [(parse, "en"), (parse, "fa")]
+
+    return [(parse, None)]
+
+
+def _digit_script(text: str):
+    for char in text:
+        script = _DIGIT_SCRIPTS.get(char)
+        if script is not None:
+            return script
+
+    return None
+
+
+class InferredFormat:
+    """
+    The strptime format inferred from a sample by ``infer_format``.
+
+    Attributes:
+        format (str): The inferred strptime format.
+        locale (str): The locale of the parsed values, 'fa' for Persian names or Persian and Arabic-Indic digits.
+        digits (str): The digit script of the sample: 'en', 'fa' or 'ar'.
+        matched (int): The number of samples the format parsed.
+        total (int): The number of non-empty samples.
+    """
+
+    __slots__ = ("format", "locale", "digits", "matched", "total", "_parse", "_fallbacks")
+
+    def __init__(self, fmt, locale, digits, matched, total, parse, fallbacks):
+        self.format = fmt
+        self.locale = locale
+        self.digits = digits
+        self.matched = matched
+        self.total = total
+        self._parse = parse
+        self._fallbacks = fallbacks
+
+    @property
+    def score(self) -> float:
+        """The share of the sample the format parsed."""
+        return self.matched / self.total
+
+    def parse(self, value):
+        """
+        Parse ``value`` with the inferred format.
+
+        The digits may be in any script. The other candidate formats are tried, in order, only when the
+        inferred one does not match.
+
+        Returns:
+            JalaliDate | JalaliDateTime: A JalaliDateTime for formats with a time, a JalaliDate otherwise.
+
+        Raises:
+            ValueError: If no candidate format matches ``value``.
+        """
+        text = value.strip().translate(_TO_ASCII_DIGITS)
+        try:
+            return self._parse(text, self.format, self.locale)
+        except ValueError:
+            pass
+
+        for fmt in self._fallbacks:
+            for parse, locale in _format_candidates(fmt):
+                try:
+                    return parse(text, fmt, locale or self.locale)
+                except ValueError:
+                    pass
+
+        raise ValueError(f"{value!r} does not match {self.format!r} or any other candidate format")
+
+    def __repr__(self):
+        return (
+            f"InferredFormat(format={self.format!r}, locale={self.locale!r}, digits={self.digits!r}, "
+            f"matched={self.matched}, total={self.total})"
+        )
+
+
+def infer_format(samples, formats=None) -> InferredFormat:
+    """
+    Infer the strptime format of a column of Jalali dates from a sample of its values.
+
+    Every candidate format is scored by the number of samples it parses, with the month and weekday
+    names tried in both locales and the digits read in any script. The best candidate wins, the earlier
+    one on a tie, and scoring stops at the first candidate that parses the whole sample. Empty values
+    are skipped.
+
+    Args:
+        samples (iterable of str): Values of the column.
+        formats (sequence of str, optional): The candidate formats. Defaults to ``INFER_FORMATS``.
+
+    Returns:
+        InferredFormat: The inferred format, whose ``parse`` method reads the rest of the column.
+
+    Raises:
+        ValueError: If there are no samples or no candidate format parses any of them.
+
+    Example:
+        >>> inferred = infer_format(["۱۴۰۳/۰۲/۰۵", "۱۴۰۳/۰۲/۱۲"])
+        >>> inferred.format, inferred.locale, inferred.digits
+        ('%Y/%m/%d', 'fa', 'fa')
+        >>> inferred.parse("۱۴۰۳/۰۳/۰۱")
+        JalaliDate(1403, 3, 1, Seshanbeh)
+    """
+    formats = INFER_FORMATS if formats is None else tuple(formats)
+
+    texts = []
+    scripts = {}
+    for sample in samples:
+        text = sample.strip() if sample else ""
+        if text:
+            script = _digit_script(text)
+            scripts[script] = scripts.get(script, 0) + 1
+            texts.append(text.translate(_TO_ASCII_DIGITS))
+
+    if not texts:
+        raise ValueError("infer_format needs at least one non-empty sample")
+
+    scripts.pop(None, None)
+    digits = max(scripts, key=scripts.get) if scripts else "en"
+    numeric_locale = "en" if digits == "en" else "fa"
+
+    best = None
+    for fmt in formats:
+        for parse, locale in _format_candidates(fmt):
+            locale = locale or numeric_locale
+            matched = 0
+            for text in texts:
+                try:
+                    parse(text, fmt, locale)
+                except ValueError:
+                    continue
+                matched += 1
+
+            if matched and (best is None or matched > best[0]):
+                best = (matched, fmt, locale, parse)
+
+        if best is not None and best[0] == len(texts):
+            break
+
+    if best is None:
+        raise ValueError("none of the candidate formats matches the samples")
+
+    matched, fmt, locale, parse = best
+    fallbacks = tuple(f for f in formats if f != fmt)
+
+    return InferredFormat(fmt, locale, digits, matched, len(texts), parse, fallbacks)
+
+
+PARSE_ERRORS = ("raise", "coerce", "collect")
+PARSE_OUTPUTS = ("date", "tuple", "packed")
+
+ParsedValues = namedtuple("ParsedValues", ["values", "failures"])
+
+
+def _check_ymd(year: int, month: int, day: int):
+    """Return the reason code of an invalid date, or None."""
+    if not MINYEAR <= year <= MAXYEAR:
+        return "year"
+    if not 1 <= month <= 12:
+        return "month"
+    if not 1 <= day <= _days_in_month(year, month):
+        return "day"
+
+    return None
+
+
+def _iso_ymd(value):
+    """Return the ``(year, month, day)`` of an ISO 8601 date, or the reason code why it is not one."""
+    if type(value) is str:
+        string = value
+        if value.translate(_DIGIT_MASK) != "0000-00-00":
+            return "format"
+    elif isinstance(value, _BYTES_TYPES):
+        # bytes are read without decoding them to str
+        string = _ascii_bytes(value)
+        if string is None or string.translate(_BYTES_DIGIT_MASK) != b"0000-00-00":
+            return "format"
+    else:
+        return "type"
+
+    year, month, day = int(string[0:4]), int(string[5:7]), int(string[8:10])
+    if 1 <= month <= 12 and 1 <= day <= _MONTH_COUNT[month][0] and MINYEAR <= year <= MAXYEAR:
+        return year, month, day
+
+    return _check_ymd(year, month, day) or (year, month, day)
+
+
+def _strptime_ymd(value: str, pattern, month_abbr_numbers: dict, month_numbers: dict, locale: str):
+    """
+    Return the ``(year, month, day)`` that ``JalaliDate.strptime`` and ``parse_many`` read from ``value``.
+
+    ``pattern`` and the month numbers are those of ``JalaliDate._compile_strptime``. The digits may be of
+    any script. Returns the reason code "format" if ``value`` does not match, or "year", "month" or "day"
+    for a missing field or an unknown month name. The ranges of the fields are left to the caller.
+    """
+    match = pattern.match(value.translate(_TO_ASCII_DIGITS))
+    if match is None:
+        return "format"
+
+    groups = match.groupdict()
+    if groups.get("Y") is not None:
+        year = int(groups["Y"])
+    elif groups.get("y") is not None:
+        # 71..99 are read as 1371..1399 and 00..70 as 1400..1470
+        yy = int(groups["y"])
+        year = 1300 + yy if yy > 70 else 1400 + yy
+    else:
+        return "year"
+
+    if groups.get("m") is not None:
+        month = int(groups["m"])
+    else:
+        abbr, full = groups.get("b"), groups.get("B")
+        if locale == "en":
+            abbr, full = abbr and abbr.capitalize(), full and full.capitalize()
+        month = (month_abbr_numbers.get(abbr) or month_numbers.get(abbr)) if abbr else month_numbers.get(full)
+        if month is None:
+            return "month"
+
+    if groups.get("d") is None:
+        return "day"
+    return year, month, int(groups["d"])
+
+
+def parse_many(values, fmt=None, errors: str = "raise", output: str = "date", locale: str = "en"):
+    """
+    Parse many Jalali date strings without raising an exception for each invalid one.
+
+    Values are validated by the parser itself instead of by exceptions from the constructor, so
+    invalid values cost no more than valid ones. Each failure gets a reason code:
+
+    - ``"type"``: the value is not a string or bytes-like,
+    - ``"format"``: it does not match the format,
+    - ``"year"``, ``"month"`` or ``"day"``: the field is out of range or missing.
+
+    Args:
+        values (iterable): The date strings, as str or as UTF-8 ``bytes``, ``bytearray`` or ``memoryview``.
+        fmt (str, optional): A ``JalaliDate.strptime`` format. Defaults to ISO 8601 (``YYYY-MM-DD``) as read by
+            ``JalaliDate.fromisoformat``. The digits may be ASCII, Persian or Arabic-Indic in both cases.
+        errors (str, optional): "raise" to raise ValueError at the first invalid value, "coerce" to put None in
+            its place, or "collect" to do the same and also return the failures. Defaults to "raise".
+        output (str, optional): "date" for JalaliDate objects, "tuple" for ``(year, month, day)`` tuples or
+            "packed" for ``YYYYMMDD`` integers. Defaults to "date".
+        locale (str, optional): The locale of month names and of the returned dates ('en' or 'fa').
+
+    Returns:
+        list: The parsed values in input order, or, with errors="collect", ``ParsedValues(values, failures)``
+        where ``failures`` is a list of ``(index, reason)``.
+
+    Raises:
+        ValueError: For an invalid value with errors="raise", or for invalid arguments.
+
+    Example:
+        >>> from persiantools.jdatetime import parse_many
+        >>> parse_many(["1403-01-15", "۱۴۰۳-۰۲-۳۱", "1402-12-30", None], errors="collect", output="packed")
+        ParsedValues(values=[14030115, 14030231, None, None], failures=[(2, 'day'), (3, 'type')])
+    """
+    if errors not in PARSE_ERRORS:
+        raise ValueError(f"errors must be one of {PARSE_ERRORS}")
+    if output not in PARSE_OUTPUTS:
+        raise ValueError(f"output must be one of {PARSE_OUTPUTS}")
+    if locale not in ("en", "fa"):
+        raise ValueError("locale must be 'en' or 'fa'")
+
+    if fmt is None:
+        read = _iso_ymd
+    else:
+        scanner = JalaliDate._STRPTIME_SCANNERS.get(fmt)
+        compiled = JalaliDate._compile_strptime(fmt, locale)
+        pattern, _, month_abbr_numbers, month_numbers = compiled
+
+        def read(value):
+            if not isinstance(value, _TEXT_TYPES):
+                return "type"
+
+            if scanner is not None:
+                fields = scanner(value)
+                if fields is not None:
+                    return fields
+
+            if not isinstance(value, str):
+                try:
+                    value = bytes(value).decode("utf-8")
+                except UnicodeDecodeError:
+                    return "format"
+
+            fields = _strptime_ymd(value, pattern, month_abbr_numbers, month_numbers, locale)
+            if type(fields) is str:
+                return fields
+
+            return _check_ymd(*fields) or fields
+
+    if output == "date":
+        from_fields = JalaliDate._from_fields
+
+        def build(year, month, day):
+            return from_fields(year, month, day, locale)
+
+    elif output == "tuple":
+
+        def build(year, month, day):
+            return year, month, day
+
+    else:
+
+        def build(year, month, day):
+            return year * 10000 + month * 100 + day
+
+    results = []
+    failures = []
+    append = results.append
+    for index, value in enumerate(values):
+        fields = read(value)
+        if type(fields) is str:
+            if errors == "raise":
+                if type(value) is memoryview:
+                    value = value.tobytes()
+                raise ValueError(f"invalid {fields} in value {index}: {value!r}")
+            failures.append((index, fields))
+            append(None)
+        else:
+            append(build(*fields))
+
+    if errors == "collect":
+        return ParsedValues(results, failures)
+
+    return results
+
+
+def parse_column(buffer, offsets, fmt=None, errors: str = "raise", output: str = "date", locale: str = "en"):
+    """
+    Parse the Jalali dates at the given offsets of one buffer, such as the raw bytes of a CSV file.
+
+    The fields are sliced from ``buffer`` and read as bytes, so no ``str`` is created for them when they
+    match ISO 8601 or one of the fixed-width ``strptime`` formats such as ``%Y/%m/%d``. Digits may be ASCII
+    or the UTF-8 bytes of Persian or Arabic-Indic digits. Other fields are decoded and parsed as by
+    ``parse_many``.
+
+    Args:
+        buffer (bytes | bytearray | memoryview): The UTF-8 text that holds the fields.
+        offsets (iterable): The ``(start, end)`` byte offsets of the fields in ``buffer``.
+        fmt, errors, output, locale: As for ``parse_many``.
+
+    Returns:
+        list: As for ``parse_many``, in the order of ``offsets``.
+
+    Raises:
+        ValueError: For an invalid value with errors="raise", or for invalid arguments.
+
+    Example:
+        >>> from persiantools.jdatetime import parse_column
+        >>> data = "1403/01/15,۱۴۰۳/۰۲/۳۱\n".encode("utf-8")
+        >>> parse_column(data, [(0, 10), (11, 29)], "%Y/%m/%d", output="packed")
+        [14030115, 14030231]
+    """
+    if not isinstance(buffer, (bytes, bytearray)):
+        buffer = memoryview(buffer).cast("B")
+
+    return parse_many((buffer[start:end] for start, end in offsets), fmt, errors, output, locale)
+
+
+# The words of Persian relative date expressions by token kind, written with single spaces. The kinds are
+# D (a day relative to today), Y (a year relative to this one), N (a count), U (a unit), R (a direction),
+# T (this), E (the first or last day of a period), M (a month name) and W (a weekday name).
+_RELATIVE_WORDS = {
+    "D": {"امروز": 0, "دیروز": -1, "پریروز": -2, "فردا": 1, "پس فردا": 2},
+    "Y": {"امسال": 0, "پارسال": -1},
+    "W": {
+        (name[:-4] + " شنبه" if len(name) > 4 and name.endswith("شنبه") else name): number
+        for number, name in enumerate(n.replace("\u200c", "") for n in WEEKDAY_NAMES_FA)
+    },
+    "M": {name + suffix: number for number, name in enumerate(MONTH_NAMES_FA) if name for suffix in ("", " ماه")},
+    "U": {"روز": "day", "هفته": "week", "هفته ی": "week", "هفتهٔ": "week", "ماه": "month", "سال": "year"},
+    "R": {
+        **dict.fromkeys(("پیش", "قبل", "قبلی", "گذشته"), -1),
+        **dict.fromkeys(("بعد", "بعدی", "دیگر", "آینده", "آتی"), 1),
+    },
+    "T": {"این": 0, "همین": 0},
+    "E": {
+        **dict.fromkeys(("اول", "ابتدای", "ابتدا", "آغاز", "شروع"), "first"),
+        **dict.fromkeys(("آخر", "اخر", "پایان", "انتهای", "انتها"), "last"),
+    },
+}
+
+
+def _relative_alternation(words) -> str:
+    """Return a regex alternation of ``words``, longest first, where the spaces may also be left out."""
+    return "|".join(" ?".join(map(re_escape, word.split(" "))) for word in sorted(words, key=len, reverse=True))
+
+
+_RELATIVE_NUMBER_WORDS = _relative_alternation(
+    {
+        word.replace("\u200c", " ")
+        for word, (kind, _) in digits._number_words().items()
+        if kind in ("num", "hundred", "big") and "ي" not in word and "ك" not in word
+    }
+)
+
+# One token at a time; D, W and M come before the number words and units that start their names
+_RELATIVE_TOKEN = re.compile(
+    " ?(?:"
+    + "|".join(f"(?P<{kind}>{_relative_alternation(_RELATIVE_WORDS[kind])})" for kind in "DYWMURTE")
+    + rf"|(?P<N>[0-9۰-۹٠-٩]+|(?:{_RELATIVE_NUMBER_WORDS})(?: و (?:{_RELATIVE_NUMBER_WORDS}))*)"
+    + r")(?!\w)"
+)
+
+# The token sequences of the accepted expressions
+_RELATIVE_GRAMMAR = re.compile(r"D|E?(?:N?UR|TU|Y)|EU|(?:E|N)?M(?:N|Y|TU|UR)?|W(?:R|TU|UR)?|TW")
+
+# The values of _RELATIVE_WORDS by their words without spaces, which may be left out as in "پسفردا"
+_RELATIVE_VALUES = {
+    kind: {word.replace(" ", ""): value for word, value in words.items()} for kind, words in _RELATIVE_WORDS.items()
+}
+
+_RELATIVE_SPACES = re.compile("[\\s\u200c\u00a0]+")
+
+
+def _relative_tokens(text: str):
+    """Return the ``(kind, value)`` tokens of ``text``, or None when some of it is not a known word."""
+    text = _RELATIVE_SPACES.sub(" ", text).strip().replace("ي", "ی").replace("ك", "ک")
+    tokens = []
+    pos = 0
+    match = _RELATIVE_TOKEN.match
+    while pos < len(text):
+        token = match(text, pos)
+        if token is None:
+            return None
+
+        kind = token.lastgroup
+        word = token.group(kind)
+        if kind != "N":
+            value = _RELATIVE_VALUES[kind][word.replace(" ", "")]
+        elif word[0].isdigit():
+            value = int(word)
+        else:
+            value = digits.from_word(word)
+        tokens.append((kind, value))
+        pos = token.end()
+
+    return tokens
+
+
+def _shift_ymd(year: int, month: int, day: int, unit: str, count: int):
+    """Return the date ``count`` units after the given one, with the day clamped to the end of the month."""
+    if unit == "day" or unit == "week":
+        return _ordinal_to_ymd(_ymd_to_ordinal(year, month, day) + count * (7 if unit == "week" else 1))
+
+    if unit == "year":
+        year += count
+    else:
+        year, month = divmod(year * 12 + month - 1 + count, 12)
+        month += 1
+
+    return year, month, min(day, _days_in_month(year, month))
+
+
+def _period_edge(year: int, month: int, day: int, unit: str, edge: str):
+    """Return the first or the last day of the ``unit`` containing the given date."""
+    if unit == "week":
+        ordinal = _ymd_to_ordinal(year, month, day)
+        first = ordinal - (ordinal + 4) % 7
+        return _ordinal_to_ymd(first if edge == "first" else first + 6)
+
+    if unit == "month":
+        return year, month, 1 if edge == "first" else _days_in_month(year, month)
+
+    if unit == "year":
+        return (year, 1, 1) if edge == "first" else (year, 12, _days_in_month(year, 12))
+
+    return year, month, day
+
+
+@lru_cache(maxsize=1024)
+def _relative_fields(text: str, ordinal: int):
+    """Return the ``(year, month, day)`` of the relative expression ``text`` from the day ``ordinal``."""
+    tokens = _relative_tokens(text)
+    kinds = "".join(kind for kind, _ in tokens) if tokens is not None else ""
+    if not _RELATIVE_GRAMMAR.fullmatch(kinds):
+        raise ValueError(f"unrecognized relative date: {text!r}")
+
+    values = [value for _, value in tokens]
+    edge = None
+    if kinds[0] == "E":
+        edge = values.pop(0)
+        kinds = kinds[1:]
+
+    if kinds == "D":
+        return _ordinal_to_ymd(ordinal + values[0])
+
+    year, month, day = _ordinal_to_ymd(ordinal)
+
+    if "M" in kinds:
+        # [day] month [year], where the year is a number or relative to this one
+        start = kinds.index("M")
+        month = values[start]
+        day = values[0] if start else 1
+        tail, rest = kinds[start + 1 :], values[start + 1 :]
+        if tail == "N":
+            year = rest[0]
+        elif tail == "Y":
+            year += rest[0]
+        elif tail:
+            if rest[0 if tail == "UR" else 1] != "year":
+                raise ValueError(f"unrecognized relative date: {text!r}")
+            year += rest[1] if tail == "UR" else 0
+
+        if edge is not None:
+            day = 1 if edge == "first" else _days_in_month(year, month)
+
+        return year, month, day
+
+    if "W" in kinds:
+        # the weekday of this week, its next or last occurrence, or that of a week relative to this one
+        target = values[kinds.index("W")]
+        weekday = (ordinal + 4) % 7
+        tail, rest = kinds[kinds.index("W") + 1 :], values[kinds.index("W") + 1 :]
+        if tail == "R":
+            if rest[0] > 0:
+                return _ordinal_to_ymd(ordinal + (target - weekday - 1) % 7 + 1)
+            return _ordinal_to_ymd(ordinal - (weekday - target - 1) % 7 - 1)
+
+        weeks = 0
+        if tail:
+            if rest[0 if tail == "UR" else 1] != "week":
+                raise ValueError(f"unrecognized relative date: {text!r}")
+            weeks = rest[1] if tail == "UR" else 0
+
+        return _ordinal_to_ymd(ordinal - weekday + target + 7 * weeks)
+
+    # a period relative to this one: [count] unit direction, this unit, this or last year or, with an edge, unit
+    if kinds == "Y":
+        unit, count = "year", values[0]
+    elif kinds == "TU":
+        unit, count = values[1], 0
+    elif kinds == "U":
+        unit, count = values[0], 0
+    else:
+        unit, count = values[-2], values[-1] * (values[0] if kinds == "NUR" else 1)
+
+    year, month, day = _shift_ymd(year, month, day, unit, count)
+    if edge is not None:
+        year, month, day = _period_edge(year, month, day, unit, edge)
+
+    return year, month, day
+
+
+def parse_relative(text: str, reference=None):
+    """
+    Resolve a Persian relative date expression such as "دیروز" or "اول ماه آینده".
+
+    The accepted expressions are:
+
+    - a day: "امروز", "دیروز", "پریروز", "فردا", "پس‌فردا",
+    - a count of days, weeks, months or years before or after the reference: "۳ روز پیش", "دو هفته بعد",
+      "سال آینده", "این ماه", "امسال", "پارسال",
+    - the first or last day of such a period, with "اول" or "آخر": "اول ماه آینده", "آخر هفته", "آخر امسال",
+    - a month name with an optional day or "اول"/"آخر" before it and an optional year after it, a number
+      or relative: "آخر اسفند", "۱۵ مهر", "اول فروردین سال بعد", "۱ دی ۱۴۰۰",
+    - a weekday name: "سه‌شنبه" is the one of this week, "شنبه آینده" the next one after the reference,
+      "شنبه گذشته" the last one before it and "شنبه هفته بعد" the one of the next week.
+
+    Weeks start on Saturday. Moving by months or years keeps the day of the month, clamped to the
+    length of the target month. Words may be joined with a zero-width non-joiner or written with the
+    Arabic yeh and kaf, and counts may be digits of any script or number words. Results are memoized
+    per (expression, reference day).
+
+    Args:
+        text (str): The expression.
+        reference (JalaliDate | JalaliDateTime | date | datetime, optional): The day the expression is
+            relative to. Defaults to today.
+
+    Returns:
+        JalaliDate: The resolved date, or a JalaliDateTime with the time of ``reference`` when it is one.
+
+    Raises:
+        TypeError: If ``text`` is not a string or ``reference`` is not a date.
+        ValueError: If the expression is not recognized or its date is out of range.
+
+    Example:
+        >>> from persiantools.jdatetime import JalaliDate, parse_relative
+        >>> parse_relative("۳ روز پیش", JalaliDate(1403, 1, 2))
+        JalaliDate(1402, 12, 28, Doshanbeh)
+        >>> parse_relative("اول ماه آینده", JalaliDate(1403, 6, 31))
+        JalaliDate(1403, 7, 1, Yekshanbeh)
+    """
+    if not isinstance(text, str):
+        raise TypeError("parse_relative: text must be str")
+
+    if reference is None:
+        reference = JalaliDate.today()
+    elif isinstance(reference, dt):
+        reference = JalaliDateTime(reference)
+    elif isinstance(reference, date):
+        reference = JalaliDate(reference)
+    elif not isinstance(reference, JalaliDate):
+        raise TypeError(f"reference must be a date, not {type(reference).__name__}")
+
+    year, month, day = _relative_fields(text, reference.toordinal())
+    reason = _check_ymd(year, month, day)
+    if reason is not None:
+        raise ValueError(f"{reason} is out of range in {text!r}")
+
+    if isinstance(reference, JalaliDateTime):
+        return reference.replace(year=year, month=month, day=day)
+
+    return JalaliDate._from_fields(year, month, day, reference.locale)
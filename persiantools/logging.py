@@ -0,0 +1,116 @@
+import logging
+import time
+from datetime import timezone
+
+from persiantools import digits
+from persiantools.jdatetime import JalaliDateTime
+
+
+class JalaliFormatter(logging.Formatter):
+    """
+    A logging formatter that stamps records with Jalali dates.
+
+    ``asctime`` is rendered with ``JalaliDateTime.strftime``, so ``datefmt`` takes the Jalali directives
+    and ``locale`` selects English or Persian names and digits. The rendered time is cached per second and
+    only the milliseconds are added per record, which keeps the cost of a log call close to the standard
+    ``logging.Formatter``.
+
+    The formatter also sets ``jalali_date``, ``jalali_time`` and ``jalali_datetime`` on each record it
+    formats, in ASCII ISO form, so they can be used in the format string or picked up by JSON formatters.
+
+    Args:
+        fmt (str, optional): The format of the message, as for ``logging.Formatter``.
+        datefmt (str, optional): The Jalali strftime format of ``asctime``. Defaults to
+                                 ``"%Y-%m-%d %H:%M:%S"`` followed by the milliseconds.
+        style (str, optional): The style of ``fmt``, as for ``logging.Formatter``.
+        tz (tzinfo, optional): The timezone of the stamps. If None, local time is used, or UTC when the
+                               ``converter`` of the formatter is ``time.gmtime``.
+        locale (str, optional): The locale of ``asctime`` ('en' or 'fa'). Defaults to 'en'.
+        **kwargs: Passed on to ``logging.Formatter``, e.g. ``validate`` or ``defaults``.
+
+    Example:
+        >>> import logging
+        >>> from persiantools.logging import JalaliFormatter
+        >>> from persiantools.tz import TehranTZ
+        >>> handler = logging.StreamHandler()
+        >>> handler.setFormatter(JalaliFormatter("%(asctime)s %(levelname)s %(message)s", tz=TehranTZ()))
+    """
+
+    default_time_format = "%Y-%m-%d %H:%M:%S"
+    default_msec_format = "%s,%03d"
+
+    def __init__(self, fmt=None, datefmt=None, style="%", tz=None, locale="en", **kwargs):
+        if locale not in ("en", "fa"):
+            raise ValueError("locale must be 'en' or 'fa'")
+
+        super().__init__(fmt, datefmt, style, **kwargs)
+        self.tz = tz
+        self.locale = locale
+        # (second, datefmt, rendered datefmt, date field, time field, utc offset) of the last stamp
+        self._stamp = None
+
+    def _stamp_at(self, created: float, datefmt):
+        second = int(created // 1)
+        stamp = self._stamp
+        if stamp is not None and stamp[0] == second and stamp[1] == datefmt:
+            return stamp
+
+        tz = self.tz
+        if tz is None and self.converter is time.gmtime:
+            tz = timezone.utc
+
+        jdt = JalaliDateTime.fromtimestamp(second, tz)
+        iso = jdt.isoformat()
+        stamp = (
+            second,
+            datefmt,
+            jdt.strftime(datefmt or self.default_time_format, self.locale),
+            iso[:10],
+            iso[11:19],
+            iso[19:],
+        )
+        self._stamp = stamp
+
+        return stamp
+
+    def formatTime(self, record, datefmt=None):
+        """
+        Return the Jalali creation time of ``record``.
+
+        Without ``datefmt`` the milliseconds are appended using ``default_msec_format``.
+        """
+        text = self._stamp_at(record.created, datefmt)[2]
+        if datefmt or not self.default_msec_format:
+            return text
+
+        text = self.default_msec_format % (text, record.msecs)
+        if self.locale == "fa":
+            text = digits.en_to_fa(text)
+
+        return text
+
+    def jalali_fields(self, record) -> dict:
+        """
+        Return the Jalali stamp of ``record`` as a dictionary for structured logging.
+
+        Returns:
+            dict: ``jalali_date`` (``YYYY-MM-DD``), ``jalali_time`` (``HH:MM:SS.mmm``) and
+                  ``jalali_datetime`` (ISO 8601 with the UTC offset when ``tz`` is set).
+
+        Example:
+            >>> formatter = JalaliFormatter(tz=TehranTZ())
+            >>> formatter.jalali_fields(record)
+            {'jalali_date': '1403-01-01', 'jalali_time': '12:30:00.250', 'jalali_datetime': '1403-01-01T12:30:00.250+03:30'}
+        """
+        _, _, _, day, clock, offset = self._stamp_at(record.created, self.datefmt)
+        clock = f"{clock}.{int(record.msecs):03d}"
+
+        return {
+            "jalali_date": day,
+            "jalali_time": clock,
+            "jalali_datetime": f"{day}T{clock}{offset}",
+        }
+
+    def format(self, record):
+        record.__dict__.update(self.jalali_fields(record))
+        return super().format(record)
@@ -0,0 +1,245 @@
+from bisect import bisect_right
+from datetime import datetime, timedelta, tzinfo
+
+# Ordinal of 1970-01-01 in the proleptic Gregorian calendar
+_EPOCH_ORDINAL = 719163
+
+# Local mean time of Tehran, used for every instant before the first transition
+_TEHRAN_LMT = (12344, 0, "LMT")
+
+# Transitions of the Asia/Tehran zone, taken from the IANA tz database.
+# Each row contains the following columns:
+# 1. The UTC instant (seconds since the epoch) at which the period starts.
+# 2. The UTC offset in seconds during the period.
+# 3. The DST component of the offset in seconds.
+# 4. The abbreviation of the period.
+# DST followed the Jalali calendar (1 Farvardin to 30 Shahrivar) and was abolished in 1401,
+# so the last row is in effect indefinitely.
+# fmt: off
+_TEHRAN_TRANSITIONS = (
+    (-1704165944, 12344, 0, "TMT"),
+    (-1090466744, 12600, 0, "+0330"),
+    (227820600, 16200, 3600, "+0430"),
+    (246223800, 14400, 0, "+04"),
+    (259617600, 18000, 3600, "+05"),
+    (271108800, 14400, 0, "+04"),
+    (279576000, 12600, 0, "+0330"),
+    (296598600, 16200, 3600, "+0430"),
+    (306531000, 12600, 0, "+0330"),
+    (322432200, 16200, 3600, "+0430"),
+    (338499000, 12600, 0, "+0330"),
+    (673216200, 16200, 3600, "+0430"),
+    (685481400, 12600, 0, "+0330"),
+    (701209800, 16200, 3600, "+0430"),
+    (717103800, 12600, 0, "+0330"),
+    (732745800, 16200, 3600, "+0430"),
+    (748639800, 12600, 0, "+0330"),
+    (764281800, 16200, 3600, "+0430"),
+    (780175800, 12600, 0, "+0330"),
+    (795817800, 16200, 3600, "+0430"),
+    (811711800, 12600, 0, "+0330"),
+    (827353800, 16200, 3600, "+0430"),
+    (843247800, 12600, 0, "+0330"),
+    (858976200, 16200, 3600, "+0430"),
+    (874870200, 12600, 0, "+0330"),
+    (890512200, 16200, 3600, "+0430"),
+    (906406200, 12600, 0, "+0330"),
+    (922048200, 16200, 3600, "+0430"),
+    (937942200, 12600, 0, "+0330"),
+    (953584200, 16200, 3600, "+0430"),
+    (969478200, 12600, 0, "+0330"),
+    (985206600, 16200, 3600, "+0430"),
+    (1001100600, 12600, 0, "+0330"),
+    (1016742600, 16200, 3600, "+0430"),
+    (1032636600, 12600, 0, "+0330"),
+    (1048278600, 16200, 3600, "+0430"),
+    (1064172600, 12600, 0, "+0330"),
+    (1079814600, 16200, 3600, "+0430"),
+    (1095708600, 12600, 0, "+0330"),
+    (1111437000, 16200, 3600, "+0430"),
+    (1127331000, 12600, 0, "+0330"),
+    (1206045000, 16200, 3600, "+0430"),
+    (1221939000, 12600, 0, "+0330"),
+    (1237667400, 16200, 3600, "+0430"),
+    (1253561400, 12600, 0, "+0330"),
+    (1269203400, 16200, 3600, "+0430"),
+    (1285097400, 12600, 0, "+0330"),
+    (1300739400, 16200, 3600, "+0430"),
+    (1316633400, 12600, 0, "+0330"),
+    (1332275400, 16200, 3600, "+0430"),
+    (1348169400, 12600, 0, "+0330"),
+    (1363897800, 16200, 3600, "+0430"),
+    (1379791800, 12600, 0, "+0330"),
+    (1395433800, 16200, 3600, "+0430"),
+    (1411327800, 12600, 0, "+0330"),
+    (1426969800, 16200, 3600, "+0430"),
+    (1442863800, 12600, 0, "+0330"),
+    (1458505800, 16200, 3600, "+0430"),
+    (1474399800, 12600, 0, "+0330"),
+    (1490128200, 16200, 3600, "+0430"),
+    (1506022200, 12600, 0, "+0330"),
+    (1521664200, 16200, 3600, "+0430"),
+    (1537558200, 12600, 0, "+0330"),
+    (1553200200, 16200, 3600, "+0430"),
+    (1569094200, 12600, 0, "+0330"),
+    (1584736200, 16200, 3600, "+0430"),
+    (1600630200, 12600, 0, "+0330"),
+    (1616358600, 16200, 3600, "+0430"),
+    (1632252600, 12600, 0, "+0330"),
+    (1647894600, 16200, 3600, "+0430"),
+    (1663788600, 12600, 0, "+0330"),
+)
+# fmt: on
+
+
+def _build_tables(transitions, before):
+    trans_utc = tuple(row[0] for row in transitions)
+    ttinfos = tuple(row[1:] for row in transitions)
+
+    # Local (wall clock) start of each period for fold=0 and fold=1, see zoneinfo._ts_to_local
+    trans_local = ([], [])
+    previous = before[0]
+    for start, (offset, _, _) in zip(trans_utc, ttinfos):
+        trans_local[0].append(start + max(previous, offset))
+        trans_local[1].append(start + min(previous, offset))
+        previous = offset
+
+    return trans_utc, ttinfos, (tuple(trans_local[0]), tuple(trans_local[1]))
+
+
+_TRANS_UTC, _TTINFOS, _TRANS_LOCAL = _build_tables(_TEHRAN_TRANSITIONS, _TEHRAN_LMT)
+
+_TIMEDELTAS = {seconds: timedelta(seconds=seconds) for row in _TTINFOS + (_TEHRAN_LMT,) for seconds in row[:2]}
+
+
+def _wall_seconds(dt) -> int:
+    """Return the wall clock time of a datetime as seconds since the epoch, ignoring its tzinfo."""
+    return (dt.toordinal() - _EPOCH_ORDINAL) * 86400 + dt.hour * 3600 + dt.minute * 60 + dt.second
+
+
+class TehranTZ(tzinfo):
+    """
+    The Asia/Tehran time zone.
+
+    Offsets are resolved by bisecting an embedded transition table, so no tz database
+    (and no ``tzdata`` package on Windows) is needed. The class is a singleton: every
+    call to ``TehranTZ()`` returns the same instance.
+
+    Example:
+        >>> from datetime import datetime
+        >>> from persiantools.tz import TehranTZ
+        >>> datetime(2020, 6, 1, 12, 0, tzinfo=TehranTZ()).utcoffset()
+        datetime.timedelta(seconds=16200)
+    """
+
+    _instance = None
+
+    key = "Asia/Tehran"
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+
+        return cls._instance
+
+    def __repr__(self):
+        return f"{type(self).__name__}()"
+
+    def __str__(self):
+        return self.key
+
+    def __reduce__(self):
+        return self.__class__, ()
+
+    @staticmethod
+    def _ttinfo_at_utc(timestamp: int):
+        idx = bisect_right(_TRANS_UTC, timestamp)
+        return _TTINFOS[idx - 1] if idx else _TEHRAN_LMT
+
+    @staticmethod
+    def _ttinfo_at_local(seconds: int, fold: int = 0):
+        idx = bisect_right(_TRANS_LOCAL[fold], seconds)
+        return _TTINFOS[idx - 1] if idx else _TEHRAN_LMT
+
+    def offset_at(self, timestamp: int) -> int:
+        """
+        Get the UTC offset in seconds at the given UTC instant.
+
+        Args:
+            timestamp (int): Seconds since the epoch.
+
+        Returns:
+            int: The UTC offset in seconds.
+        """
+        return self._ttinfo_at_utc(timestamp)[0]
+
+    def local_offset_at(self, seconds: int, fold: int = 0) -> int:
+        """
+        Get the UTC offset in seconds of a wall clock time.
+
+        Args:
+            seconds (int): The wall clock time as seconds since the epoch.
+            fold (int, optional): Selects the later of two ambiguous wall times when 1. Default is 0.
+
+        Returns:
+            int: The UTC offset in seconds.
+        """
+        return self._ttinfo_at_local(seconds, fold)[0]
+
+    def period_at(self, timestamp: int):
+        """
+        Get the offset period that contains the given UTC instant.
+
+        Args:
+            timestamp (int): Seconds since the epoch.
+
+        Returns:
+            tuple: ``(offset, start, end)`` in seconds. ``start`` and ``end`` are the UTC bounds of
+            the period and are None when the period is unbounded on that side.
+        """
+        idx = bisect_right(_TRANS_UTC, timestamp)
+        offset = _TTINFOS[idx - 1][0] if idx else _TEHRAN_LMT[0]
+        start = _TRANS_UTC[idx - 1] if idx else None
+        end = _TRANS_UTC[idx] if idx < len(_TRANS_UTC) else None
+
+        return offset, start, end
+
+    def utcoffset(self, dt):
+        if dt is None:
+            return None
+
+        return _TIMEDELTAS[self._ttinfo_at_local(_wall_seconds(dt), dt.fold)[0]]
+
+    def dst(self, dt):
+        if dt is None:
+            return None
+
+        return _TIMEDELTAS[self._ttinfo_at_local(_wall_seconds(dt), dt.fold)[1]]
+
+    def tzname(self, dt):
+        if dt is None:
+            return None
+
+        return self._ttinfo_at_local(_wall_seconds(dt), dt.fold)[2]
+
+    def fromutc(self, dt):
+        if not isinstance(dt, datetime):
+            raise TypeError("fromutc() requires a datetime argument")
+
+        if dt.tzinfo is not self:
+            raise ValueError("dt.tzinfo is not self")
+
+        timestamp = _wall_seconds(dt)
+        idx = bisect_right(_TRANS_UTC, timestamp)
+        offset = _TTINFOS[idx - 1][0] if idx else _TEHRAN_LMT[0]
+
+        fold = 0
+        if idx:
+            previous = _TTINFOS[idx - 2][0] if idx > 1 else _TEHRAN_LMT[0]
+            fold = int(previous - offset > timestamp - _TRANS_UTC[idx - 1])
+
+        dt = dt + _TIMEDELTAS[offset]
+        if fold:
+            dt = dt.replace(fold=1)
+
+        return dt
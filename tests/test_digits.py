@@ -101,3 +101,46 @@ class TestDigits(TestCase):
                 digits.to_word(0.15)
         finally:
             digits.MANTISSA = old_mantissa
+
+    def test_from_word(self):
+        self.assertEqual(digits.from_word("یکصد و بیست و سه هزار"), 123000)
+        self.assertEqual(digits.from_word("صفر"), 0)
+        self.assertEqual(digits.from_word("هزار و پانصد"), 1500)
+        self.assertEqual(digits.from_word("دو هزار میلیارد"), 2_000_000_000_000)
+        self.assertEqual(digits.from_word("منفی پانزده و هفت هزارم"), -15.007)
+        self.assertEqual(digits.from_word("یکصد و بیست و سه و چهارصد و پنجاه و شش هزارم"), 123.456)
+        self.assertEqual(digits.from_word("پنج ده هزارم"), 0.0005)
+        self.assertEqual(digits.words_to_number("نهصد و چهل و هشت هزار و ششصد و سیزده و چهار صدم"), 948613.04)
+
+        # other spellings
+        self.assertEqual(digits.from_word("سه صد و يك"), 301)
+        self.assertEqual(digits.from_word("هشت‌صد و هیجده ملیون"), 818_000_000)
+        self.assertEqual(digits.from_word("پونصد و شونزده"), 516)
+
+        for number in (1, 12, 100, 1001, 3512, 9512026, -123, 10**15 - 1, 15.007, -123.45, 1000.5):
+            self.assertEqual(digits.from_word(digits.to_word(number)), number)
+
+        # the longest integer part whose fraction fits the MANTISSA word wins
+        for number in (230.03, 50.08, 11461460.001, 10.3627, 123.456, 7.5):
+            self.assertEqual(digits.from_word(digits.to_word(number)), number)
+        self.assertEqual(digits.from_word("ده و سه صدم"), 10.03)
+
+        with pytest.raises(ValueError):
+            digits.from_word("سه تا")
+        with pytest.raises(ValueError):
+            digits.from_word("سه و چهار")
+        with pytest.raises(ValueError):
+            digits.from_word("")
+        with pytest.raises(TypeError):
+            digits.from_word(123)
+
+    def test_from_word_many(self):
+        self.assertEqual(digits.from_word_many(["یک", "دو هزار", "یک"]), [1, 2000, 1])
+
+    def test_extract_numbers(self):
+        text = "مبلغ دو میلیون و پانصد هزار ریال برای سه و چهار قلم و سهم"
+        self.assertEqual(
+            [(text[start:end], number) for (start, end), number in digits.extract_numbers(text)],
+            [("دو میلیون و پانصد هزار", 2_500_000), ("سه", 3), ("چهار", 4)],
+        )
+        self.assertEqual(list(digits.extract_numbers("هیچ عددی")), [])
@@ -0,0 +1,63 @@
+import io
+from unittest import TestCase
+
+from persiantools.extract import extract
+from persiantools.jdatetime import JalaliDate
+
+TEXT = (
+    "جلسه در ۱۴ اردیبهشت ۱۳۶۷ و 1367/03/01 برگزار شد. ۱۴ام اردیبهشت، اردیبهشت ۶۷ و 14 Ordibehesht 1367 "
+    "و ۱۴/۰۲/۱۳۶۷ و ٢٥ دي ١٤٠٢ و مهر ماه سال ۱۴۰۰"
+)
+
+
+class TestExtract(TestCase):
+    def test_extract(self):
+        matches = list(extract(TEXT, year=1403))
+        self.assertEqual(
+            [(TEXT[start:end], value) for (start, end), value in matches],
+            [
+                ("۱۴ اردیبهشت ۱۳۶۷", JalaliDate(1367, 2, 14)),
+                ("1367/03/01", JalaliDate(1367, 3, 1)),
+                ("۱۴ام اردیبهشت", JalaliDate(1403, 2, 14)),
+                ("اردیبهشت ۶۷", JalaliDate(1367, 2, 1)),
+                ("14 Ordibehesht 1367", JalaliDate(1367, 2, 14)),
+                ("۱۴/۰۲/۱۳۶۷", JalaliDate(1367, 2, 14)),
+                ("٢٥ دي ١٤٠٢", JalaliDate(1402, 10, 25)),
+                ("مهر ماه سال ۱۴۰۰", JalaliDate(1400, 7, 1)),
+            ],
+        )
+
+    def test_invalid_and_bare(self):
+        text = "۳۰ اسفند ۱۴۰۲ و ۳۰ اسفند ۱۴۰۳ و 1403/13/01 و ۱۲۳۴۵/۰۱/۰۱ و مهر و دیروز"
+        self.assertEqual([value for _, value in extract(text, year=1403)], [JalaliDate(1403, 12, 30)])
+        self.assertEqual(list(extract("", year=1403)), [])
+
+    def test_two_digit_year(self):
+        self.assertEqual(next(extract("دی ۱۰", year=1403))[1], JalaliDate(1410, 10, 1))
+        self.assertEqual(next(extract("دی ۳۰", year=1403))[1], JalaliDate(1330, 10, 1))
+
+    def test_count_after_month(self):
+        for text, date in (
+            ("۱۵ مهر ۲۰ نفر", "۱۵ مهر"),
+            ("۱۵ مهر ۲۰نفر", "۱۵ مهر"),
+            ("۱۵ مهر ۲۰ ٪", "۱۵ مهر"),
+            ("15 Mehr 20 people", "15 Mehr"),
+        ):
+            self.assertEqual(
+                [(text[s:e], v) for (s, e), v in extract(text, year=1403)], [(date, JalaliDate(1403, 7, 15))]
+            )
+        self.assertEqual(next(extract("۱۵ مهر ۲۰ تاریخ", year=1403))[1], JalaliDate(1420, 7, 15))
+
+    def test_chunks(self):
+        expected = list(extract(TEXT * 30, year=1403))
+        for size in (1, 2, 5, 64, 100, 1000):
+            chunks = [(TEXT * 30)[i : i + size] for i in range(0, len(TEXT) * 30, size)]
+            self.assertEqual(list(extract(chunks, year=1403)), expected)
+
+        file = io.StringIO(TEXT * 30)
+        self.assertEqual(list(extract(iter(lambda: file.read(77), ""), year=1403)), expected)
+
+    def test_lazy(self):
+        matches = extract(TEXT, year=1403)
+        self.assertEqual(next(matches)[0], (8, 24))
+        self.assertEqual(next(matches)[0], (27, 37))
@@ -1,12 +1,27 @@
+import io
 import os
 import pickle
-from datetime import date, timedelta
+from datetime import date, datetime, timedelta
 from time import struct_time, time
 from unittest import TestCase
 
 import pytest
 
-from persiantools.jdatetime import MAXYEAR, MINYEAR, JalaliDate
+from persiantools.jdatetime import (
+    MAXYEAR,
+    MINYEAR,
+    JalaliDate,
+    JalaliDateTime,
+    _compile_strftime,
+    clear_format_cache,
+    disable_format_cache,
+    enable_format_cache,
+    format_cache_info,
+    infer_format,
+    parse_column,
+    parse_many,
+    parse_relative,
+)
 
 
 class TestJalaliDate(TestCase):
@@ -356,6 +371,94 @@ class TestJalaliDate(TestCase):
         with pytest.raises(ValueError, match=f"Year must be between {MINYEAR} and {MAXYEAR}"):
             JalaliDate.is_leap(invalid_year_above)
 
+    def test_strftime_compiled(self):
+        j = JalaliDate(1395, 3, 1)
+        self.assertEqual(j.strftime("%%c %%x %c"), "%c %x Shanbeh 01 Khordad 1395")
+        self.assertEqual(j.strftime("%q %Y%"), "%q 1395%")
+        self.assertEqual(j.strftime(""), "")
+        self.assertEqual(j.strftime("no directives"), "no directives")
+
+        self.assertEqual(
+            _compile_strftime("%Y/%m/%d %q", JalaliDate),
+            (("Y", True), ("/", False), ("m", True), ("/", False), ("d", True), (" %q", False)),
+        )
+        self.assertIs(_compile_strftime("%x", JalaliDate), _compile_strftime("%x", JalaliDate))
+
+        with pytest.raises(TypeError):
+            j.strftime(None)
+
+    def test_strftime_persian_digits(self):
+        j = JalaliDate(1403, 12, 30, locale="fa")
+        self.assertEqual(j.isoformat(), "۱۴۰۳-۱۲-۳۰")
+        self.assertEqual(j.strftime("%j %w %y 12"), "۳۶۶ ۵ ۰۳ ۱۲")
+        self.assertEqual(j.strftime("%j %w %y 12", locale="en"), "366 5 03 12")
+        self.assertEqual(JalaliDate(1, 1, 1, locale="fa").strftime("%Y"), "۰۰۰۱")
+
+    def test_format_cache(self):
+        self.assertEqual(format_cache_info(), (0, 0, 0, 0))
+        enable_format_cache(2)
+        try:
+            j = JalaliDate(1403, 12, 30, locale="fa")
+            self.assertEqual(j.strftime("%A %d %B %Y"), "پنجشنبه ۳۰ اسفند ۱۴۰۳")
+            self.assertEqual(j.strftime("%A %d %B %Y"), "پنجشنبه ۳۰ اسفند ۱۴۰۳")
+            self.assertEqual(j.strftime("%A %d %B %Y", locale="en"), "Panjshanbeh 30 Esfand 1403")
+            self.assertEqual(format_cache_info(), (1, 2, 2, 2))
+
+            self.assertEqual(j.isoformat(), "۱۴۰۳-۱۲-۳۰")
+            self.assertEqual(format_cache_info()[:2], (1, 2))
+            self.assertEqual(JalaliDate(1403, 12, 29).strftime("%A %d %B %Y"), "Chaharshanbeh 29 Esfand 1403")
+            self.assertEqual(format_cache_info().currsize, 2)
+
+            clear_format_cache()
+            self.assertEqual(format_cache_info(), (0, 0, 2, 0))
+
+            with pytest.raises(ValueError):
+                enable_format_cache(0)
+        finally:
+            disable_format_cache()
+
+        self.assertEqual(format_cache_info(), (0, 0, 0, 0))
+
+    def test_to_words(self):
+        self.assertEqual(JalaliDate(1367, 2, 14).to_words(), "چهاردهم اردیبهشت یک هزار و سیصد و شصت و هفت")
+        self.assertEqual(JalaliDate(1403, 12, 30).to_words(weekday=True), "پنجشنبه سی‌ام اسفند یک هزار و چهارصد و سه")
+        self.assertEqual(JalaliDate(1, 1, 1).to_words(), "یکم فروردین یک")
+        self.assertEqual(JalaliDate(1400, 7, 23).to_words(), "بیست و سوم مهر یک هزار و چهارصد")
+
+    def test_format_many(self):
+        values = [
+            JalaliDate(1403, 1, 1),
+            date(2024, 3, 21),
+            JalaliDate(1403, 1, 2, locale="fa"),
+            datetime(2024, 3, 22, 10),
+        ]
+        self.assertEqual(
+            JalaliDate.format_many(values, "%Y/%m/%d"),
+            ["1403/01/01", "1403/01/02", "۱۴۰۳/۰۱/۰۲", "1403/01/03"],
+        )
+        self.assertEqual(JalaliDate.format_many(values, "%d %B", locale="en")[2], "02 Farvardin")
+        self.assertEqual(JalaliDate.format_many(values[-1:], "%H:%M"), ["10:00"])
+        self.assertEqual(JalaliDate.format_many(values[:2]), ["1403-01-01", "1403-01-02"])
+        self.assertEqual(JalaliDate.format_many([], "%Y"), [])
+
+        buffer = io.StringIO()
+        self.assertEqual(JalaliDate.write_formatted(values, "%y%m%d", buffer, sep=","), 4)
+        self.assertEqual(buffer.getvalue(), "030101,030102,۰۳۰۱۰۲,030103,")
+
+        with pytest.raises(TypeError):
+            JalaliDate.format_many(["1403/01/01"], "%Y")
+        with pytest.raises(TypeError):
+            JalaliDate.format_many(values, 1)
+        for value in (date(600, 1, 1), datetime(600, 1, 1, 12)):
+            with pytest.raises(ValueError):
+                JalaliDate(value)
+            with pytest.raises(ValueError):
+                JalaliDate.format_many([value], "%Y/%m/%d")
+            with pytest.raises(ValueError):
+                JalaliDate.format_many([value])
+            with pytest.raises(ValueError):
+                JalaliDate.write_formatted([value], "%Y", io.StringIO())
+
     def test_format(self):
         j = JalaliDate(date(1988, 5, 4))
         self.assertEqual(j.isoformat(), "1367-02-14")
@@ -409,6 +512,9 @@ class TestJalaliDate(TestCase):
 
         self.assertEqual(JalaliDate(1367, 2, 14), JalaliDate.fromisoformat("1367-02-14"))
         self.assertEqual(JalaliDate(1397, 12, 9), JalaliDate.fromisoformat("۱۳۹۷-۱۲-۰۹"))
+        self.assertEqual(JalaliDate(1397, 12, 9), JalaliDate.fromisoformat("١٣٩٧-١٢-٠٩"))
+        self.assertEqual(JalaliDate(1397, 12, 9), JalaliDate.fromisoformat(b"1397-12-09"))
+        self.assertEqual(JalaliDate(1397, 12, 9), JalaliDate.fromisoformat("۱۳۹۷-۱۲-۰۹".encode()))
 
         with pytest.raises(TypeError):
             JalaliDate.fromisoformat(13670214)
@@ -452,6 +558,12 @@ class TestJalaliDate(TestCase):
         with pytest.raises(ValueError):
             JalaliDate.fromisoformat(" 1395-03-01")
 
+        with pytest.raises(ValueError):
+            JalaliDate.fromisoformat("1395-+3-01")
+
+        with pytest.raises(ValueError, match="Invalid isoformat string: '1402-12-30'"):
+            JalaliDate.fromisoformat("1402-12-30")
+
         j_date = JalaliDate(1400, 1, 1)
         self.assertEqual(j_date.strftime("%A, %d %B %Y"), "Yekshanbeh, 01 Farvardin 1400")
         self.assertEqual(j_date.strftime("%A, %d %B %Y", locale="fa"), "یکشنبه, ۰۱ فروردین ۱۴۰۰")
@@ -744,6 +856,156 @@ class TestJalaliDate(TestCase):
 
         self.assertEqual(JalaliDate.strptime("1400-Tir-15", "%Y-%b-%d"), JalaliDate(1400, 4, 15))
 
+    def test_infer_format(self):
+        inferred = infer_format(["1403/2/5", "1403/12/30", "", None])
+        self.assertEqual((inferred.format, inferred.locale, inferred.digits), ("%Y/%m/%d", "en", "en"))
+        self.assertEqual((inferred.matched, inferred.total, inferred.score), (2, 2, 1.0))
+        self.assertEqual(inferred.parse("1403/3/1"), JalaliDate(1403, 3, 1))
+        # a mismatch falls back to the other candidates
+        self.assertEqual(inferred.parse("01/03/1403"), JalaliDate(1403, 3, 1))
+
+        inferred = infer_format(["۱۴۰۳-۰۲-۰۵", "١٤٠٣-٠٢-١٢", "۱۴۰۳-۰۲-۳۱"])
+        self.assertEqual((inferred.format, inferred.locale, inferred.digits), ("%Y-%m-%d", "fa", "fa"))
+        self.assertEqual(inferred.parse("۱۴۰۳-۰۲-۰۵").locale, "fa")
+
+        inferred = infer_format(["05 Ordibehesht 1403", "12 Khordad 1402", "n/a"])
+        self.assertEqual((inferred.format, inferred.locale, inferred.matched, inferred.total), ("%d %B %Y", "en", 2, 3))
+        self.assertEqual(infer_format(["۵ اردیبهشت ۱۴۰۳"]).locale, "fa")
+        self.assertEqual(infer_format(["1403-02-05 10:20:30"]).parse("1403-02-05 11:00:00").hour, 11)
+
+        with pytest.raises(ValueError, match="does not match"):
+            inferred.parse("yesterday")
+        with pytest.raises(ValueError):
+            infer_format(["yesterday", "tomorrow"])
+        with pytest.raises(ValueError):
+            infer_format(["", None])
+
+    def test_parse_many(self):
+        values = [
+            "1403-01-15",
+            "۱۴۰۳-۰۲-۳۱",
+            b"1403-12-30",
+            "1402-12-30",
+            "1403-13-01",
+            "0000-01-01",
+            "1403/01/15",
+            None,
+        ]
+        self.assertEqual(
+            parse_many(values, errors="collect", output="tuple"),
+            (
+                [(1403, 1, 15), (1403, 2, 31), (1403, 12, 30), None, None, None, None, None],
+                [(3, "day"), (4, "month"), (5, "year"), (6, "format"), (7, "type")],
+            ),
+        )
+        self.assertEqual(parse_many(values[:3], output="packed"), [14030115, 14030231, 14031230])
+        self.assertEqual(parse_many(values[:2]), [JalaliDate(1403, 1, 15), JalaliDate(1403, 2, 31)])
+        self.assertEqual(parse_many(values[2:5], errors="coerce"), [JalaliDate(1403, 12, 30), None, None])
+
+        with pytest.raises(ValueError, match="invalid day in value 3"):
+            parse_many(values)
+
+    def test_parse_many_format(self):
+        result = parse_many(
+            ["1403/1/5", "۱۴۰۳/۰۲/۳۱", "1403/01/32", "1403-01-05", 14030105], "%Y/%m/%d", errors="collect"
+        )
+        self.assertEqual(result.values, [JalaliDate(1403, 1, 5), JalaliDate(1403, 2, 31), None, None, None])
+        self.assertEqual(result.failures, [(2, "day"), (3, "format"), (4, "type")])
+
+        values = ["05 Ordibehesht 1403", "05 ordibehesht 1403", "05 Foo 1403"]
+        self.assertEqual(parse_many(values, "%d %B %Y", errors="coerce", output="packed"), [14030205, 14030205, None])
+
+        dates = parse_many(["۰۵ اردیبهشت ۱۴۰۳"], "%d %B %Y", locale="fa")
+        self.assertEqual((dates[0], dates[0].locale), (JalaliDate(1403, 2, 5), "fa"))
+
+        values = ["75/01/15", "۷۵/۰۱/۱۵", "٧5/0۱/١٥", "0۳/01/15", "۰۳-۰۱-۱۵", "03/13/01", "1403/01/15", "۱۵ far ۷5"]
+        for fmt in ("%y/%m/%d", "%Y/%m/%d", "%d %b %y"):
+            for locale in ("en", "fa"):
+                with self.subTest(fmt=fmt, locale=locale):
+                    expected = []
+                    for value in values:
+                        try:
+                            expected.append(JalaliDate.strptime(value, fmt, locale))
+                        except ValueError:
+                            expected.append(None)
+                    self.assertEqual(parse_many(values, fmt, errors="coerce", locale=locale), expected)
+        self.assertEqual(parse_many(values[:3], "%y/%m/%d"), [JalaliDate(1375, 1, 15)] * 3)
+        self.assertEqual(JalaliDate.strptime(values[1], "%y/%m/%d"), JalaliDate(1375, 1, 15))
+        self.assertEqual(JalaliDate.strptime(values[-1], "%d %b %y"), JalaliDate(1375, 1, 15))
+
+        with pytest.raises(ValueError):
+            parse_many([], errors="ignore")
+        with pytest.raises(ValueError):
+            parse_many([], output="ordinal")
+
+    def test_parse_column(self):
+        data = "1403-01-15,۱۴۰۳-۰۲-۳۱,1402-12-30,١٤٠٣-٠١-٠١,1403-0\u0670-01\n".encode("utf-8")
+        offsets = [(0, 10), (11, 29), (30, 40), (41, 59), (60, 71)]
+        result = parse_column(data, offsets, errors="collect", output="packed")
+        self.assertEqual(result.values, [14030115, 14030231, None, 14030101, None])
+        self.assertEqual(result.failures, [(2, "day"), (4, "format")])
+
+        for buffer in (bytearray(data), memoryview(data)):
+            with self.subTest(buffer=type(buffer).__name__):
+                self.assertEqual(parse_column(buffer, offsets[:2]), [JalaliDate(1403, 1, 15), JalaliDate(1403, 2, 31)])
+
+        data = "1403/1/5;۱۴۰۳/۰۲/۳۱;05 Ordibehesht 1403".encode("utf-8")
+        self.assertEqual(
+            parse_column(data, [(0, 8), (9, 27)], "%Y/%m/%d"), [JalaliDate(1403, 1, 5), JalaliDate(1403, 2, 31)]
+        )
+        self.assertEqual(parse_column(data, [(28, 47)], "%d %B %Y", output="tuple"), [(1403, 2, 5)])
+
+        with pytest.raises(ValueError, match="invalid day in value 0: b'1402-12-30'"):
+            parse_column(memoryview(b"1402-12-30"), [(0, 10)])
+
+    def test_parse_relative(self):
+        ref = JalaliDate(1403, 1, 2)  # a Panjshanbeh
+        cases = {
+            "امروز": (1403, 1, 2),
+            "دیروز": (1403, 1, 1),
+            "پریروز": (1402, 12, 29),
+            "پس\u200cفردا": (1403, 1, 4),
+            "پسفردا": (1403, 1, 4),
+            "۳ روز پیش": (1402, 12, 28),
+            "بیست و یک روز بعد": (1403, 1, 23),
+            "هفته\u200cی بعد": (1403, 1, 9),
+            "دو هفته قبل": (1402, 12, 17),
+            "اول ماه آینده": (1403, 2, 1),
+            "آخر هفته": (1403, 1, 3),
+            "اول هفته بعد": (1403, 1, 4),
+            "آخر اسفند": (1403, 12, 30),
+            "اول فروردین سال بعد": (1404, 1, 1),
+            "۱ دی ۱۴۰۰": (1400, 10, 1),
+            "پارسال": (1402, 1, 2),
+            "سه\u200cشنبه": (1402, 12, 29),
+            "يكشنبه": (1402, 12, 27),
+            "شنبه آینده": (1403, 1, 4),
+            "شنبه گذشته": (1402, 12, 26),
+            "جمعه هفته بعد": (1403, 1, 10),
+        }
+        for text, expected in cases.items():
+            with self.subTest(text=text):
+                self.assertEqual(parse_relative(text, ref), JalaliDate(*expected))
+
+        # months and years keep the day, clamped to the end of the month
+        self.assertEqual(parse_relative("ماه بعد", JalaliDate(1403, 6, 31)), JalaliDate(1403, 7, 30))
+        self.assertEqual(parse_relative("سال بعد", JalaliDate(1403, 12, 30)), JalaliDate(1404, 12, 29))
+
+        self.assertEqual(
+            parse_relative("دیروز", JalaliDateTime(1403, 1, 1, 10, 30)), JalaliDateTime(1402, 12, 29, 10, 30)
+        )
+        self.assertEqual(parse_relative("فردا", date(2024, 3, 20)), JalaliDate(1403, 1, 2))
+        self.assertEqual(parse_relative("فردا", JalaliDate(1403, 1, 1, "fa")).locale, "fa")
+
+        for text in ("فردا پیش", "هفته", "چیزی", "شنبه ماه بعد"):
+            with self.subTest(text=text):
+                with pytest.raises(ValueError, match="unrecognized relative date"):
+                    parse_relative(text, ref)
+        with pytest.raises(ValueError, match="day is out of range"):
+            parse_relative("۳۰ اسفند ۱۴۰۲", ref)
+        with pytest.raises(TypeError):
+            parse_relative(b"\xd9\x81\xd8\xb1\xd8\xaf\xd8\xa7", ref)
+
     def test_locale_setter_invalid_value(self):
         jdate = JalaliDate.today()
 
@@ -3,13 +3,23 @@ import pickle
 import time
 from datetime import date, datetime
 from datetime import time as _time
-from datetime import timedelta, timezone
+from datetime import timedelta, timezone, tzinfo
 from unittest import TestCase
 from zoneinfo import ZoneInfo
 
 import pytest
 
-from persiantools.jdatetime import JalaliDate, JalaliDateTime, _is_ascii_digit
+from persiantools.jdatetime import (
+    JalaliClock,
+    JalaliDate,
+    JalaliDateTime,
+    disable_format_cache,
+    enable_format_cache,
+    format_cache_info,
+    format_duration,
+    format_durations,
+)
+from persiantools.tz import TehranTZ
 
 
 class TestJalaliDateTime(TestCase):
@@ -183,6 +193,24 @@ class TestJalaliDateTime(TestCase):
         with pytest.raises(ValueError):
             JalaliDateTime.strptime(s, fmt)
 
+    def test_strptime_shared_tzinfo(self):
+        fmt = "%Y-%m-%d %H:%M:%S %z"
+        a = JalaliDateTime.strptime("1400-01-01 12:00:00 +0330", fmt)
+        b = JalaliDateTime.strptime("1400-01-02 08:00:00 +03:30", fmt)
+        c = JalaliDateTime.fromisoformat("1400-01-03T08:00:00+03:30")
+        assert a.tzinfo is b.tzinfo is c.tzinfo
+        assert JalaliDateTime.strptime("1400-01-01 12:00:00 -0715", fmt).utcoffset() == timedelta(hours=-7, minutes=-15)
+        assert JalaliDateTime.strptime("1400-01-01 12:00:00 +0000", fmt).tzinfo is timezone.utc
+
+        fmt = "%Y-%m-%d %H:%M:%S %Z"
+        a = JalaliDateTime.strptime("1402-01-01 12:00:00 Asia/Tehran", fmt)
+        b = JalaliDateTime.strptime("1402-01-02 12:00:00 Asia/Tehran", fmt)
+        assert a.tzinfo is b.tzinfo
+        assert b - a == timedelta(days=1)
+        for _ in range(2):
+            with pytest.raises(ValueError, match="Unknown time zone name: Mars/Phobos"):
+                JalaliDateTime.strptime("1400-01-01 12:00:00 Mars/Phobos", fmt)
+
     def test_operators(self):
         self.assertEqual(
             JalaliDateTime(1367, 2, 14, 4, 30, 0, 0) + timedelta(days=30, seconds=15, milliseconds=1),
@@ -338,6 +366,36 @@ class TestJalaliDateTime(TestCase):
         jdt = JalaliDateTime(1400, 4, 25, 21, 45, 0, 0, locale="fa")
         self.assertEqual(jdt.strftime("%c"), "جمعه ۲۵ تیر ۱۴۰۰ ۲۱:۴۵:۰۰")
 
+    def test_strptime_compiled_once(self):
+        compiled = JalaliDateTime._compile_strptime("%d %b %Y %H:%M", "en")
+        self.assertIs(JalaliDateTime._compile_strptime("%d %b %Y %H:%M", "en"), compiled)
+        self.assertIsNot(JalaliDate._compile_strptime("%d %b %Y", "en"), compiled)
+
+        self.assertEqual(
+            JalaliDateTime.strptime("14 Ord 1367 10:30", "%d %b %Y %H:%M"), JalaliDateTime(1367, 2, 14, 10, 30)
+        )
+        self.assertEqual(JalaliDateTime.strptime("14 اسفند 1367", "%d %B %Y", "fa"), JalaliDateTime(1367, 12, 14))
+        with pytest.raises(ValueError, match="'ord' is not in list"):
+            JalaliDateTime.strptime("14 ord 1367 10:30", "%d %b %Y %H:%M")
+
+    def test_strptime_scanned_formats(self):
+        self.assertEqual(
+            JalaliDateTime.strptime("1403-01-15 10:20:30", "%Y-%m-%d %H:%M:%S"), JalaliDateTime(1403, 1, 15, 10, 20, 30)
+        )
+        self.assertEqual(
+            JalaliDateTime.strptime("۱۴۰۳/۰۱/۱۵ ۱۰:۲۰", "%Y/%m/%d %H:%M"), JalaliDateTime(1403, 1, 15, 10, 20)
+        )
+        self.assertEqual(JalaliDateTime.strptime("١٤٠٣١٢٣٠", "%Y%m%d", "fa").locale, "fa")
+        self.assertEqual(JalaliDate.strptime("۱۴۰۳-۰۱-۱۵", "%Y-%m-%d"), JalaliDate(1403, 1, 15))
+        self.assertEqual(JalaliDate.strptime("1403/1۲/30", "%Y/%m/%d"), JalaliDate(1403, 12, 30))
+
+        with pytest.raises(ValueError, match="day must be in 1..29"):
+            JalaliDate.strptime("1402/12/30", "%Y/%m/%d")
+        with pytest.raises(ValueError, match="data string and format are not matched"):
+            JalaliDateTime.strptime("1403-01-15 24:00:00", "%Y-%m-%d %H:%M:%S")
+        with pytest.raises(ValueError):
+            JalaliDateTime.strptime("1403-01-15 10:20", "%Y-%m-%d %H:%M:%S")
+
     def test_strptime(self):
         self.assertEqual(
             JalaliDateTime(1400, 6, 23, 1, 4, 1),
@@ -574,6 +632,101 @@ class TestJalaliDateTime(TestCase):
 
         self.assertEqual(gregorian_new_tz, expected_new_tz)
 
+    def test_astimezone_day_boundary(self):
+        jdt = JalaliDateTime(1402, 12, 29, 22, 0, 0, 15, tzinfo=timezone.utc)
+        self.assertEqual(jdt.astimezone(TehranTZ()), JalaliDateTime(1403, 1, 1, 1, 30, 0, 15, tzinfo=TehranTZ()))
+        minus_23 = timezone(timedelta(hours=-23))
+        self.assertEqual(jdt.astimezone(minus_23), JalaliDateTime(1402, 12, 28, 23, 0, 0, 15, tzinfo=minus_23))
+
+        jdt = JalaliDateTime(1403, 1, 1, 1, 0, tzinfo=ZoneInfo("Asia/Tehran"))
+        self.assertEqual(jdt.astimezone(timezone.utc).jdate(), JalaliDate(1402, 12, 29))
+        self.assertIs(jdt.astimezone(jdt.tzinfo), jdt)
+
+    def test_astimezone_matches_gregorian(self):
+        zones = [timezone.utc, timezone(timedelta(hours=-9, minutes=-30)), ZoneInfo("America/New_York"), TehranTZ()]
+        for seconds in range(0, 2_000_000_000, 37_000_001):
+            for source in zones:
+                for target in zones:
+                    jdt = JalaliDateTime.fromtimestamp(seconds, source)
+                    result = jdt.astimezone(target)
+                    expected = JalaliDateTime(jdt.to_gregorian().astimezone(target))
+                    self.assertEqual(repr(result), repr(expected))
+
+    def test_astimezone_lmt_offset(self):
+        # Asia/Tehran was at its local mean time, +03:25:44, until 1946
+        jdt = JalaliDateTime(1300, 1, 1, 12, tzinfo=ZoneInfo("Asia/Tehran"))
+        self.assertEqual(jdt.astimezone(timezone.utc), JalaliDateTime(1300, 1, 1, 8, 34, 16, tzinfo=timezone.utc))
+        self.assertEqual(
+            repr(jdt.astimezone(TehranTZ())), repr(JalaliDateTime(jdt.to_gregorian().astimezone(TehranTZ())))
+        )
+
+    def test_astimezone_keeps_locale(self):
+        jdt = JalaliDateTime(1400, 1, 1, 12, 30, tzinfo=timezone.utc, locale="fa")
+        self.assertEqual(jdt.astimezone(TehranTZ()).locale, "fa")
+
+    def test_astimezone_many(self):
+        zones = [timezone.utc, ZoneInfo("America/New_York"), ZoneInfo("Asia/Tehran"), TehranTZ()]
+        values = [
+            JalaliDateTime.fromtimestamp(seconds, zones[seconds % 3])
+            for seconds in range(1_647_800_000, 1_648_000_000, 1_777)
+        ]
+        values.append(JalaliDateTime(1401, 1, 1, 12, 0))
+
+        for tz in zones:
+            expected = [value.astimezone(tz) for value in values]
+            self.assertEqual(list(map(repr, JalaliDateTime.astimezone_many(values, tz))), list(map(repr, expected)))
+
+        stream = JalaliDateTime.iter_astimezone(iter(values[:3]), TehranTZ())
+        self.assertEqual(next(stream), values[0].astimezone(TehranTZ()))
+
+        self.assertEqual(
+            JalaliDateTime.astimezone_many([datetime(2022, 9, 21, 19, 0, tzinfo=timezone.utc)], TehranTZ()),
+            [JalaliDateTime(1401, 6, 30, 23, 30, tzinfo=TehranTZ())],
+        )
+
+        with self.assertRaises(TypeError):
+            JalaliDateTime.astimezone_many(values, "UTC")
+
+    def test_astimezone_many_zoneinfo(self):
+        class CountingZone(tzinfo):
+            def __init__(self, key):
+                self.zone = ZoneInfo(key)
+                self.calls = 0
+
+            def utcoffset(self, dt):
+                self.calls += 1
+                return self.zone.utcoffset(dt.replace(tzinfo=self.zone))
+
+            def dst(self, dt):
+                return self.zone.dst(dt.replace(tzinfo=self.zone))
+
+            def tzname(self, dt):
+                return self.zone.tzname(dt.replace(tzinfo=self.zone))
+
+            def fromutc(self, dt):
+                self.calls += 1
+                return self.zone.fromutc(dt.replace(tzinfo=self.zone)).replace(tzinfo=self)
+
+        # pre-1946 values in the LMT period of Asia/Tehran, and a year of Europe/Paris with two transitions
+        values = [JalaliDateTime(1300, 1, 1, 12, tzinfo=ZoneInfo("Asia/Tehran"))]
+        values += [
+            JalaliDateTime.fromtimestamp(seconds, timezone.utc)
+            for seconds in range(1_672_531_200, 1_704_067_200, 3_600)
+        ]
+        for key in ("Europe/Paris", "Asia/Tehran"):
+            tz = CountingZone(key)
+            result = JalaliDateTime.astimezone_many(values, tz)
+            self.assertLess(tz.calls, 2 * 366 + 100)
+            # the wall times, as JalaliDateTime has no fold for the repeated hour
+            expected = [value.to_gregorian().astimezone(tz.zone).replace(tzinfo=None) for value in values]
+            self.assertTrue([v.to_gregorian().replace(tzinfo=None) for v in result] == expected)
+            self.assertTrue(all(v.tzinfo is tz for v in result))
+
+        self.assertEqual(
+            JalaliDateTime.astimezone_many(values[:1], timezone.utc),
+            [JalaliDateTime(1300, 1, 1, 8, 34, 16, tzinfo=timezone.utc)],
+        )
+
     def test_astimezone_invalid(self):
         jdt = JalaliDateTime(1400, 1, 1, 12, 30, 45, tzinfo=timezone.utc)
         with self.assertRaises(TypeError):
@@ -729,10 +882,110 @@ class TestJalaliDateTime(TestCase):
         jdate = JalaliDateTime(1400, 1, 1, 15, 30, 45)
         self.assertEqual(jdate.strftime("%I:%M %p"), "03:30 PM")
 
+    def test_strftime_percent_escape(self):
+        jdate = JalaliDateTime(1400, 1, 1, 15, 30, 45)
+        self.assertEqual(jdate.strftime("%%H"), "%H")
+        self.assertEqual(jdate.strftime("%%%H:%%M %%"), "%15:%M %")
+        self.assertEqual(jdate.strftime("%%H %H", locale="fa"), "%H ۱۵")
+
     def test_strftime_edge_case_midnight(self):
         jdate = JalaliDateTime(1400, 1, 1, 0, 0, 0)
         self.assertEqual(jdate.strftime("%Y-%m-%d %H:%M:%S"), "1400-01-01 00:00:00")
 
+    def test_strftime_tehran_lmt_offset(self):
+        jdate = JalaliDateTime(1290, 1, 1, 12, 0, tzinfo=TehranTZ())
+        self.assertEqual(jdate.strftime("%z %Z"), "+032544 LMT")
+        self.assertEqual(jdate.strftime("%%z %c"), "%z Chaharshanbeh 01 Farvardin 1290 12:00:00")
+
+    def test_strftime_format_cache(self):
+        enable_format_cache()
+        try:
+            for hour, period in ((9, "AM"), (21, "PM")):
+                jdt = JalaliDateTime(1403, 1, 1, hour, 5, 7, 123456, tzinfo=TehranTZ())
+                self.assertEqual(jdt.strftime("%Y/%m/%d %H:%M %p"), f"1403/01/01 {hour:02d}:05 {period}")
+                self.assertEqual(jdt.isoformat(), f"1403-01-01T{hour:02d}:05:07.123456+03:30")
+            self.assertEqual(format_cache_info()[:2], (1, 1))
+        finally:
+            disable_format_cache()
+
+    def test_humanize(self):
+        reference = JalaliDateTime(1403, 1, 1, 12, 0)
+        cases = [
+            (timedelta(seconds=10), "همین الان", "just now"),
+            (timedelta(minutes=3), "۳ دقیقه پیش", "3 minutes ago"),
+            (timedelta(minutes=1), "۱ دقیقه پیش", "1 minute ago"),
+            (timedelta(hours=5, minutes=20), "۵ ساعت پیش", "5 hours ago"),
+            (timedelta(hours=26), "دیروز", "yesterday"),
+            (timedelta(days=3), "۳ روز پیش", "3 days ago"),
+            (timedelta(days=15), "۲ هفته پیش", "2 weeks ago"),
+            (timedelta(days=100), "۳ ماه پیش", "3 months ago"),
+            (timedelta(days=800), "۲ سال پیش", "2 years ago"),
+            (-timedelta(minutes=10), "۱۰ دقیقه بعد", "in 10 minutes"),
+            (-timedelta(days=1), "فردا", "tomorrow"),
+        ]
+        for delta, fa, en in cases:
+            value = reference - delta
+            self.assertEqual(value.humanize(reference), fa)
+            self.assertEqual(value.humanize(reference.to_gregorian(), locale="en"), en)
+
+        values = [reference - delta for delta, _, _ in cases]
+        self.assertEqual(JalaliDateTime.humanize_many(values, reference), [fa for _, fa, _ in cases])
+
+    def test_humanize_calendar_days(self):
+        evening = JalaliDateTime(1403, 1, 1, 23, 50)
+        midnight = JalaliDateTime(1403, 1, 2, 0, 10)
+        self.assertEqual(midnight.humanize(evening, locale="en"), "in 20 minutes")
+        self.assertEqual(evening.humanize(midnight, locale="en"), "20 minutes ago")
+        self.assertEqual(JalaliDateTime(1403, 1, 1, 23, 58).humanize(JalaliDateTime(1403, 1, 2, 0, 1)), "۳ دقیقه پیش")
+        self.assertEqual(JalaliDateTime(1403, 1, 1, 20, 0).humanize(midnight, locale="en"), "4 hours ago")
+        self.assertEqual(JalaliDateTime(1403, 1, 1, 11, 0).humanize(midnight, locale="en"), "yesterday")
+        self.assertEqual(evening.humanize(JalaliDateTime(1403, 1, 1, 8, 0), locale="en"), "in 16 hours")
+        self.assertEqual(JalaliDateTime(1403, 1, 2, 13, 0).humanize(evening, locale="en"), "tomorrow")
+        self.assertEqual(JalaliDateTime(1403, 1, 1, 0, 30).humanize(evening, locale="en"), "23 hours ago")
+        self.assertEqual(JalaliDateTime(1402, 12, 29, 0, 30).humanize(midnight, locale="en"), "2 days ago")
+
+        tehran = ZoneInfo("Asia/Tehran")
+        self.assertEqual(
+            JalaliDateTime(1300, 1, 1, 11, 0, tzinfo=tehran).humanize(JalaliDateTime(1300, 1, 2, 1, 0, tzinfo=tehran)),
+            "دیروز",
+        )
+
+    def test_humanize_aware(self):
+        reference = JalaliDateTime(1403, 1, 1, 12, 0, tzinfo=TehranTZ())
+        value = JalaliDateTime(1403, 1, 1, 7, 30, tzinfo=timezone.utc)
+        self.assertEqual(value.humanize(reference, locale="en"), "1 hour ago")
+        self.assertEqual(JalaliDateTime.now(timezone.utc).humanize(locale="en"), "just now")
+        self.assertEqual(JalaliDateTime.now().humanize(), "همین الان")
+
+        with pytest.raises(TypeError):
+            value.humanize(JalaliDateTime(1403, 1, 1))
+        with pytest.raises(ValueError):
+            value.humanize(reference, locale="de")
+
+    def test_format_duration(self):
+        duration = timedelta(days=2, hours=3, minutes=15)
+        self.assertEqual(format_duration(duration), "۲ روز و ۳ ساعت و ۱۵ دقیقه")
+        self.assertEqual(format_duration(duration, style="words"), "دو روز و سه ساعت و پانزده دقیقه")
+        self.assertEqual(format_duration(duration, precision=2), "۲ روز و ۳ ساعت")
+        self.assertEqual(format_duration(timedelta(days=1, seconds=5), precision=2), "۱ روز و ۵ ثانیه")
+        self.assertEqual(format_duration(timedelta(microseconds=10)), "۰ ثانیه")
+        self.assertEqual(format_duration(-timedelta(seconds=0.5), style="words"), "صفر ثانیه")
+        self.assertEqual(format_duration(-timedelta(minutes=90)), "منفی ۱ ساعت و ۳۰ دقیقه")
+        self.assertEqual(format_duration(3661.9), "۱ ساعت و ۱ دقیقه و ۱ ثانیه")
+        self.assertEqual(format_durations([60, timedelta(hours=2)], style="words"), ["یک دقیقه", "دو ساعت"])
+
+        with pytest.raises(ValueError):
+            format_duration(duration, style="roman")
+        with pytest.raises(ValueError):
+            format_duration(duration, precision=0)
+        with pytest.raises(TypeError):
+            format_duration("1 day")
+        for value in (float("nan"), float("inf"), -float("inf")):
+            with pytest.raises(ValueError, match="duration must be finite"):
+                format_duration(value)
+            with pytest.raises(ValueError, match="duration must be finite"):
+                format_durations([60, value])
+
     def test_fromisoformat_valid_date_and_time(self):
         jdt = JalaliDateTime.fromisoformat("1403-08-09T02:21:45.123456+04:30")
         self.assertEqual(jdt.year, 1403)
@@ -748,34 +1001,44 @@ class TestJalaliDateTime(TestCase):
         jdt = JalaliDateTime.fromisoformat("1403-08-09T02:21:45+04:30")
         self.assertEqual(jdt.tzinfo, timezone(timedelta(hours=4, minutes=30)))
 
+    def test_fromisoformat_digits_and_bytes(self):
+        expected = JalaliDateTime(1403, 8, 9, 2, 21, 45, 123400, timezone(timedelta(hours=-3, minutes=-30)))
+        self.assertEqual(JalaliDateTime.fromisoformat("۱۴۰۳-۰۸-۰۹T۰۲:۲۱:۴۵.۱۲۳۴-۰۳:۳۰"), expected)
+        self.assertEqual(JalaliDateTime.fromisoformat("١٤٠٣-٠٨-٠٩ ٠٢٢١٤٥,١٢٣٤-٠٣٣٠"), expected)
+        self.assertEqual(JalaliDateTime.fromisoformat(b"1403-08-09T02:21:45.1234-03:30"), expected)
+        self.assertEqual(JalaliDateTime.fromisoformat("1403-08-09T02:21:45.1234999-03:30").microsecond, 123499)
+        self.assertEqual(JalaliDateTime.fromisoformat(b"1403-08-09 02:21Z").tzinfo, timezone.utc)
+        self.assertEqual(JalaliDateTime.fromisoformat("1403-08-09"), JalaliDateTime(1403, 8, 9))
+        self.assertEqual(JalaliDateTime.fromisoformat(memoryview("۱۴۰۳-۰۸-۰۹T۰۲:۲۱:۴۵.۱۲۳۴-۰۳:۳۰".encode())), expected)
+        self.assertEqual(
+            JalaliDateTime.strptime(bytearray("۱۴۰۳/۰۸/۰۹ ۰۲:۲۱".encode()), "%Y/%m/%d %H:%M"),
+            JalaliDateTime(1403, 8, 9, 2, 21),
+        )
+        self.assertEqual(
+            JalaliDateTime.strptime("09 Aban 1403 02:21".encode(), "%d %B %Y %H:%M"), JalaliDateTime(1403, 8, 9, 2, 21)
+        )
+
+        with pytest.raises(ValueError, match="hour must be in 0..23"):
+            JalaliDateTime.fromisoformat("1403-08-09T24:00")
+        with pytest.raises(ValueError, match="Invalid isoformat string"):
+            JalaliDateTime.fromisoformat("1403-08-09T02:21:45.")
+        with pytest.raises(ValueError, match="Invalid isoformat string"):
+            JalaliDateTime.fromisoformat("1403-08-09T02: 1")
+        with pytest.raises(TypeError):
+            JalaliDateTime.fromisoformat(14030809)
+
     def test_fromisoformat_invalid_string(self):
         with self.assertRaises(ValueError):
             JalaliDateTime.fromisoformat("invalid-date-time")
 
-        self.assertEqual(JalaliDateTime._find_isoformat_datetime_separator("2021W12"), 7)
-
-        with pytest.raises(ValueError, match="Invalid ISO string"):
-            JalaliDateTime._find_isoformat_datetime_separator("2021-W12-")
-
-    def test_find_isoformat_datetime_separator(self):
-        separator = JalaliDateTime._find_isoformat_datetime_separator("1403-08-09T02:21:45")
-        self.assertEqual(separator, 10)
-
-    def test_parse_isoformat_time_with_microseconds(self):
-        time_components = JalaliDateTime._parse_isoformat_time("02:21:45.123456")
-        self.assertEqual(time_components, [2, 21, 45, 123456, None])
-
-    def test_parse_isoformat_time_with_timezone(self):
-        time_components = JalaliDateTime._parse_isoformat_time("02:21:45+04:30")
-        self.assertEqual(time_components, [2, 21, 45, 0, timezone(timedelta(hours=4, minutes=30))])
-
-    def test_parse_hh_mm_ss_ff_with_microseconds(self):
-        time_components = JalaliDateTime._parse_hh_mm_ss_ff("02:21:45.123456")
-        self.assertEqual(time_components, [2, 21, 45, 123456])
-
-    def test_is_ascii_digit(self):
-        self.assertTrue(_is_ascii_digit("5"))
-        self.assertFalse(_is_ascii_digit("a"))
+    def test_fromisoformat_time_components(self):
+        base = "1403-08-09T"
+        self.assertEqual(JalaliDateTime.fromisoformat(base + "02:21:45.123456").timetuple()[3:6], (2, 21, 45))
+        self.assertEqual(JalaliDateTime.fromisoformat(base + "02:21:45.123456").microsecond, 123456)
+        self.assertEqual(
+            JalaliDateTime.fromisoformat(base + "02:21:45+04:30").tzinfo, timezone(timedelta(hours=4, minutes=30))
+        )
+        self.assertEqual(JalaliDateTime.fromisoformat(base + "022145,5"), JalaliDateTime(1403, 8, 9, 2, 21, 45, 500000))
 
     def test_isoformat_round_trip(self):
         original = JalaliDateTime(1403, 8, 9, 2, 21, 45, 123456, tzinfo=timezone.utc)
@@ -845,3 +1108,102 @@ class TestJalaliDateTime(TestCase):
         self.assertEqual(jdt_naive_ms.isoformat(), "1398-10-05T12:30:00.000123")
         # With custom separator
         self.assertEqual(jdt_naive.isoformat(sep=" "), "1398-10-05 12:30:00")
+
+    def test_clock(self):
+        now = [1_663_786_000.25]
+        clock = JalaliClock(TehranTZ(), time_func=lambda: now[0])
+
+        for _ in range(200):
+            expected = JalaliDateTime.fromtimestamp(now[0], TehranTZ())
+            self.assertEqual(repr(clock.now()), repr(expected))
+            self.assertEqual(clock.today(), expected.jdate())
+            now[0] += 123.456789
+
+        clock = JalaliClock(timezone.utc, resolution=60, locale="fa", time_func=lambda: now[0])
+        stamp = clock.now()
+        self.assertEqual(stamp.second, 0)
+        self.assertEqual(stamp.microsecond, 0)
+        self.assertEqual(stamp.locale, "fa")
+        self.assertEqual(clock.timestamp() % 60, 0)
+
+        now[0] += 0.5
+        self.assertEqual(repr(clock.now()), repr(stamp))
+
+        # each call returns its own instance
+        stamp.locale = "en"
+        self.assertIsNot(clock.now(), stamp)
+        self.assertEqual(clock.now().locale, "fa")
+
+        clock = JalaliClock()
+        self.assertIsNone(clock.now().tzinfo)
+        self.assertIsNone(clock.tz)
+        self.assertIsNone(clock.resolution)
+
+        with self.assertRaises(TypeError):
+            JalaliClock("UTC")
+
+        with self.assertRaises(ValueError):
+            JalaliClock(resolution=0)
+
+        with self.assertRaises(ValueError):
+            JalaliClock(locale="de")
+
+    def test_floor_ceil(self):
+        jdt = JalaliDateTime(1403, 5, 17, 14, 30, 12, 5)
+        self.assertEqual(jdt.floor("minute"), JalaliDateTime(1403, 5, 17, 14, 30))
+        self.assertEqual(jdt.floor("hour"), JalaliDateTime(1403, 5, 17, 14))
+        self.assertEqual(jdt.floor("day"), JalaliDateTime(1403, 5, 17))
+        self.assertEqual(jdt.floor("week"), JalaliDateTime(1403, 5, 13))
+        self.assertEqual(jdt.floor("month"), JalaliDateTime(1403, 5, 1))
+        self.assertEqual(jdt.floor("quarter"), JalaliDateTime(1403, 4, 1))
+        self.assertEqual(jdt.floor("year"), JalaliDateTime(1403, 1, 1))
+
+        self.assertEqual(jdt.ceil("day"), JalaliDateTime(1403, 5, 18))
+        self.assertEqual(jdt.ceil("quarter"), JalaliDateTime(1403, 7, 1))
+        self.assertEqual(JalaliDateTime(1403, 12, 30, 1).ceil("month"), JalaliDateTime(1404, 1, 1))
+        self.assertEqual(JalaliDateTime(1403, 5, 1).ceil("month"), JalaliDateTime(1403, 5, 1))
+        self.assertEqual(JalaliDateTime(1403, 5, 1, 0, 0, 0, 1).ceil("month"), JalaliDateTime(1403, 6, 1))
+
+        self.assertEqual(
+            JalaliDateTime(1403, 12, 10, 8).period_bounds("year"),
+            (JalaliDateTime(1403, 1, 1), JalaliDateTime(1404, 1, 1)),
+        )
+
+        with self.assertRaises(ValueError):
+            jdt.floor("fortnight")
+
+    def test_floor_ceil_aware(self):
+        tz = TehranTZ()
+
+        # Clocks moved from 00:00 to 01:00 on 1401-01-02
+        jdt = JalaliDateTime(1401, 1, 2, 12, tzinfo=tz)
+        self.assertEqual(repr(jdt.floor("day")), repr(JalaliDateTime(1401, 1, 2, 1, tzinfo=tz)))
+        self.assertEqual(jdt.floor("day", epoch=True), 1647894600)
+        self.assertEqual(repr(jdt.floor("month")), repr(JalaliDateTime(1401, 1, 1, tzinfo=tz)))
+        self.assertEqual(jdt.period_bounds("day", epoch=True), (1647894600, 1647894600 + 23 * 3600))
+
+        jdt = JalaliDateTime(1403, 5, 17, 14, 30, tzinfo=ZoneInfo("Asia/Tehran"))
+        self.assertEqual(jdt.floor("day", epoch=True), int(JalaliDateTime(1403, 5, 17, tzinfo=tz).timestamp()))
+
+        jdt = JalaliDateTime(1403, 5, 17, 14, 30)
+        self.assertEqual(jdt.floor("day", epoch=True), int(JalaliDateTime(1403, 5, 17).timestamp()))
+
+    def test_floor_many(self):
+        tz = TehranTZ()
+        timestamps = list(range(1_647_700_000, 1_648_200_000, 3_333))
+
+        for unit in ("hour", "day", "week", "month"):
+            expected = [JalaliDateTime.fromtimestamp(ts, tz).floor(unit, epoch=True) for ts in timestamps]
+            self.assertEqual(JalaliDateTime.floor_many(timestamps, unit, tz), expected)
+
+            expected = [JalaliDateTime.fromtimestamp(ts, tz).ceil(unit, epoch=True) for ts in timestamps]
+            self.assertEqual(JalaliDateTime.ceil_many(timestamps, unit, tz), expected)
+
+        self.assertEqual(JalaliDateTime.floor_many([1700000000.5, 1700003600], "day", tz), [1699993800, 1699993800])
+        self.assertEqual(JalaliDateTime.ceil_many([1699993800], "day", tz), [1699993800])
+        self.assertEqual(
+            JalaliDateTime.period_bounds_many([1700000000], "day", timezone.utc), [(1699920000, 1700006400)]
+        )
+
+        with self.assertRaises(ValueError):
+            JalaliDateTime.floor_many([0], "decade")
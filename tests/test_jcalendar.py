@@ -0,0 +1,121 @@
+from unittest import TestCase
+
+import pytest
+
+from persiantools import jcalendar
+from persiantools.jdatetime import MAXYEAR, JalaliDate
+
+
+class TestJalaliCalendar(TestCase):
+    def test_monthrange(self):
+        self.assertEqual(jcalendar.monthrange(1403, 1), (4, 31))
+        self.assertEqual(jcalendar.monthrange(1403, 12), (4, 30))
+        self.assertEqual(jcalendar.monthrange(1402, 12), (3, 29))
+
+        for year in (1, 2, 1309, 1399, 1403, 1404, MAXYEAR):
+            self.assertEqual(jcalendar.nowruz_weekday(year), JalaliDate(year, 1, 1).weekday())
+            for month in range(1, 13):
+                first, days = jcalendar.monthrange(year, month)
+                self.assertEqual(first, JalaliDate(year, month, 1).weekday())
+                self.assertEqual(days, JalaliDate.days_in_month(month, year))
+                self.assertEqual(jcalendar.weekday(year, month, days), JalaliDate(year, month, days).weekday())
+
+        with pytest.raises(ValueError):
+            jcalendar.monthrange(1403, 13)
+        with pytest.raises(ValueError):
+            jcalendar.monthrange(0, 1)
+        for day in (0, 32):
+            with pytest.raises(ValueError):
+                jcalendar.weekday(1403, 1, day)
+        with pytest.raises(ValueError):
+            jcalendar.weekday(1403, 7, 31)
+        with pytest.raises(ValueError):
+            jcalendar.weekday(1402, 12, 30)
+        with pytest.raises(ValueError):
+            jcalendar.weekday(1403, 13, 1)
+        self.assertEqual(jcalendar.weekday(1403, 12, 30), JalaliDate(1403, 12, 30).weekday())
+
+    def test_leapdays(self):
+        self.assertTrue(jcalendar.isleap(1403))
+        self.assertFalse(jcalendar.isleap(1404))
+        self.assertEqual(jcalendar.leapdays(1300, 1400), sum(JalaliDate.is_leap(y) for y in range(1300, 1400)))
+        self.assertEqual(jcalendar.leapdays(1, MAXYEAR + 1), sum(JalaliDate.is_leap(y) for y in range(1, MAXYEAR + 1)))
+        self.assertEqual(jcalendar.leapdays(1403, 1403), 0)
+
+        with pytest.raises(ValueError):
+            jcalendar.leapdays(0, 10)
+
+    def test_monthcalendar(self):
+        self.assertEqual(
+            jcalendar.monthcalendar(1403, 1),
+            [
+                [0, 0, 0, 0, 1, 2, 3],
+                [4, 5, 6, 7, 8, 9, 10],
+                [11, 12, 13, 14, 15, 16, 17],
+                [18, 19, 20, 21, 22, 23, 24],
+                [25, 26, 27, 28, 29, 30, 31],
+            ],
+        )
+        cal = jcalendar.Calendar(jcalendar.FRIDAY)
+        self.assertEqual(list(cal.iterweekdays()), [6, 0, 1, 2, 3, 4, 5])
+        self.assertEqual(cal.monthdayscalendar(1403, 1)[0], [0, 0, 0, 0, 0, 1, 2])
+        self.assertEqual(cal.monthdays2calendar(1403, 1)[0][5], (1, 4))
+
+    def test_itermonthdates(self):
+        for firstweekday in range(7):
+            cal = jcalendar.Calendar(firstweekday)
+            for year, month in ((1402, 12), (1403, 1), (1403, 12), (1404, 7)):
+                dates = list(cal.itermonthdates(year, month))
+                self.assertEqual(len(dates) % 7, 0)
+                self.assertEqual(dates[0].weekday(), firstweekday)
+                for a, b in zip(dates, dates[1:]):
+                    self.assertEqual(b.toordinal() - a.toordinal(), 1)
+                self.assertEqual(
+                    [(d.year, d.month, d.day, d.weekday()) for d in dates],
+                    list(cal.itermonthdays4(year, month)),
+                )
+                self.assertEqual(
+                    [d.day if d.month == month else 0 for d in dates],
+                    list(cal.itermonthdays(year, month)),
+                )
+
+        self.assertEqual(list(jcalendar.Calendar(5).itermonthdates(1, 1))[0], JalaliDate(1, 1, 1))
+        with pytest.raises(ValueError):
+            list(jcalendar.itermonthdates(1, 1))
+        with pytest.raises(ValueError):
+            list(jcalendar.itermonthdates(MAXYEAR, 12))
+
+    def test_text_calendar(self):
+        self.assertEqual(
+            jcalendar.month(1403, 12),
+            "    Esfand 1403\n"
+            "Sh Ye Do Se Ch Pa Jo\n"
+            "             1  2  3\n"
+            " 4  5  6  7  8  9 10\n"
+            "11 12 13 14 15 16 17\n"
+            "18 19 20 21 22 23 24\n"
+            "25 26 27 28 29 30\n",
+        )
+        self.assertEqual(
+            jcalendar.TextCalendar(locale="fa").formatmonth(1403, 12, 3).splitlines()[:3],
+            ["         اسفند ۱۴۰۳", " ش   ی   د   س   چ   پ   ج", "                  ۱   ۲   ۳"],
+        )
+
+        year = jcalendar.calendar(1403)
+        self.assertEqual(year.splitlines()[0].strip(), "1403")
+        self.assertIn("Farvardin", year)
+        self.assertIn("Esfand", year)
+
+        with pytest.raises(ValueError):
+            jcalendar.TextCalendar(locale="de")
+
+    def test_html_calendar(self):
+        html = jcalendar.HTMLCalendar().formatmonth(1403, 1)
+        self.assertTrue(html.startswith('<table border="0" cellpadding="0" cellspacing="0" class="month">'))
+        self.assertIn('<tr><th colspan="7" class="month">Farvardin 1403</th></tr>', html)
+        self.assertIn('<td class="noday">&nbsp;</td><td class="wed">1</td>', html)
+        self.assertEqual(html.count("<tr>"), 7)
+
+        html = jcalendar.HTMLCalendar(locale="fa").formatyear(1403)
+        self.assertIn('<th colspan="3" class="year">۱۴۰۳</th>', html)
+        self.assertEqual(html.count('class="month"'), 24)
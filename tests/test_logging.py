@@ -0,0 +1,52 @@
+import logging
+import time
+from unittest import TestCase
+
+import pytest
+
+from persiantools.logging import JalaliFormatter
+from persiantools.tz import TehranTZ
+
+
+def make_record(created):
+    record = logging.LogRecord("persiantools", logging.INFO, __file__, 1, "hello %s", ("world",), None)
+    record.created = created
+    record.msecs = (created - int(created)) * 1000
+    return record
+
+
+class TestJalaliFormatter(TestCase):
+    def test_format(self):
+        formatter = JalaliFormatter("%(asctime)s %(levelname)s %(message)s", tz=TehranTZ())
+        self.assertEqual(formatter.format(make_record(1711000000.25)), "1403-01-02 09:16:40,250 INFO hello world")
+        self.assertEqual(formatter.format(make_record(1711000000.5)), "1403-01-02 09:16:40,500 INFO hello world")
+        self.assertEqual(formatter.format(make_record(1711000061.0)), "1403-01-02 09:17:41,000 INFO hello world")
+
+    def test_datefmt_locale(self):
+        formatter = JalaliFormatter("%(asctime)s", datefmt="%A %d %B %Y %H:%M", tz=TehranTZ(), locale="fa")
+        self.assertEqual(formatter.format(make_record(1711000000.25)), "پنجشنبه ۰۲ فروردین ۱۴۰۳ ۰۹:۱۶")
+
+        formatter = JalaliFormatter("%(asctime)s", tz=TehranTZ(), locale="fa")
+        self.assertEqual(formatter.format(make_record(1711000000.25)), "۱۴۰۳-۰۱-۰۲ ۰۹:۱۶:۴۰,۲۵۰")
+
+        with pytest.raises(ValueError):
+            JalaliFormatter(locale="de")
+
+    def test_gmtime_converter(self):
+        formatter = JalaliFormatter("%(asctime)s")
+        formatter.converter = time.gmtime
+        self.assertEqual(formatter.format(make_record(1711000000.25)), "1403-01-02 05:46:40,250")
+
+    def test_jalali_fields(self):
+        formatter = JalaliFormatter("%(jalali_datetime)s %(message)s", tz=TehranTZ())
+        record = make_record(1711000000.25)
+        self.assertEqual(
+            formatter.jalali_fields(record),
+            {
+                "jalali_date": "1403-01-02",
+                "jalali_time": "09:16:40.250",
+                "jalali_datetime": "1403-01-02T09:16:40.250+03:30",
+            },
+        )
+        self.assertEqual(formatter.format(record), "1403-01-02T09:16:40.250+03:30 hello world")
+        self.assertEqual(record.jalali_date, "1403-01-02")
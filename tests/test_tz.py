@@ -0,0 +1,81 @@
+import pickle
+from datetime import datetime, timedelta, timezone
+from unittest import TestCase
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from persiantools.jdatetime import JalaliDateTime
+from persiantools.tz import _TRANS_UTC, TehranTZ
+
+
+class TestTehranTZ(TestCase):
+    def setUp(self):
+        self.tz = TehranTZ()
+        self.zoneinfo = ZoneInfo("Asia/Tehran")
+
+    def test_singleton(self):
+        self.assertIs(TehranTZ(), self.tz)
+        self.assertIs(pickle.loads(pickle.dumps(self.tz)), self.tz)
+        self.assertEqual(repr(self.tz), "TehranTZ()")
+        self.assertEqual(str(self.tz), "Asia/Tehran")
+
+    def test_offsets(self):
+        self.assertEqual(datetime(2020, 6, 1, 12, tzinfo=self.tz).utcoffset(), timedelta(hours=4, minutes=30))
+        self.assertEqual(datetime(2020, 6, 1, 12, tzinfo=self.tz).dst(), timedelta(hours=1))
+        self.assertEqual(datetime(2020, 6, 1, 12, tzinfo=self.tz).tzname(), "+0430")
+        self.assertEqual(datetime(2020, 12, 1, 12, tzinfo=self.tz).utcoffset(), timedelta(hours=3, minutes=30))
+        self.assertEqual(datetime(2024, 6, 1, 12, tzinfo=self.tz).utcoffset(), timedelta(hours=3, minutes=30))
+        self.assertEqual(datetime(2024, 6, 1, 12, tzinfo=self.tz).dst(), timedelta(0))
+        self.assertEqual(datetime(1900, 1, 1, tzinfo=self.tz).tzname(), "LMT")
+        self.assertIsNone(self.tz.utcoffset(None))
+        self.assertIsNone(self.tz.dst(None))
+        self.assertIsNone(self.tz.tzname(None))
+
+    def test_integer_lookups(self):
+        self.assertEqual(self.tz.offset_at(1592000000), 16200)
+        self.assertEqual(self.tz.offset_at(1700000000), 12600)
+        self.assertEqual(self.tz.period_at(1700000000), (12600, 1663788600, None))
+        self.assertEqual(self.tz.period_at(0), (12600, -1090466744, 227820600))
+        self.assertEqual(self.tz.period_at(-1800000000), (12344, None, -1704165944))
+
+        # 1401-06-30 23:30 happened twice
+        wall = int(datetime(2022, 9, 21, 23, 30).replace(tzinfo=timezone.utc).timestamp())
+        self.assertEqual(self.tz.local_offset_at(wall), 16200)
+        self.assertEqual(self.tz.local_offset_at(wall, fold=1), 12600)
+
+    def test_matches_zoneinfo(self):
+        timestamps = {ts + delta for ts in _TRANS_UTC for delta in range(-7200, 7201, 900)}
+        timestamps.update(range(-1800000000, 2000000000, 7919 * 360))
+
+        for ts in sorted(timestamps):
+            utc = datetime(1970, 1, 1) + timedelta(seconds=ts)
+
+            expected = self.zoneinfo.fromutc(utc.replace(tzinfo=self.zoneinfo))
+            result = self.tz.fromutc(utc.replace(tzinfo=self.tz))
+            self.assertEqual(result.replace(tzinfo=None), expected.replace(tzinfo=None))
+            self.assertEqual(result.fold, expected.fold)
+
+            for fold in (0, 1):
+                wall = utc.replace(fold=fold)
+                expected = wall.replace(tzinfo=self.zoneinfo)
+                result = wall.replace(tzinfo=self.tz)
+                self.assertEqual(result.utcoffset(), expected.utcoffset())
+                self.assertEqual(result.dst(), expected.dst())
+                self.assertEqual(result.tzname(), expected.tzname())
+
+    def test_fromutc_invalid(self):
+        with pytest.raises(ValueError):
+            self.tz.fromutc(datetime(2020, 1, 1))
+
+        with pytest.raises(TypeError):
+            self.tz.fromutc("2020-01-01")
+
+    def test_with_jalali_datetime(self):
+        jdt = JalaliDateTime(1399, 3, 12, 12, 0, tzinfo=self.tz)
+        self.assertEqual(jdt.utcoffset(), timedelta(hours=4, minutes=30))
+        self.assertEqual(jdt.astimezone(timezone.utc), JalaliDateTime(1399, 3, 12, 7, 30, tzinfo=timezone.utc))
+        self.assertEqual(
+            JalaliDateTime(1402, 1, 1, 0, 0, tzinfo=timezone.utc).astimezone(self.tz),
+            JalaliDateTime(1402, 1, 1, 3, 30, tzinfo=self.tz),
+        )